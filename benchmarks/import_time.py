@@ -0,0 +1,41 @@
+"""
+Measures the time a fresh interpreter needs to import the sdk and create a client, with and without touching a
+sub client.
+
+    python benchmarks/import_time.py [runs]
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+CREATE_CLIENT = """
+from requests.auth import HTTPBasicAuth
+from databricks_sdk_python.api_client.workspace.client import get_workspace_client
+client = get_workspace_client("benchmark.cloud.databricks.com", auth=HTTPBasicAuth("user", "pass"))
+"""
+
+SCENARIOS = {
+    "python": "pass",
+    "import requests": "import requests",
+    "create workspace client": CREATE_CLIENT,
+    "create workspace client + cluster_policies": CREATE_CLIENT + "client.cluster_policies",
+    "create workspace client + all sub clients": CREATE_CLIENT
+    + "client.cluster_policies, client.permissions, client.instance_profiles\n"
+    + "client.unity_catalog.metastores, client.unity_catalog.catalogs, client.unity_catalog.schemas",
+}
+
+
+def measure(code: str, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, code in SCENARIOS.items():
+        print(f"{name:<50} {measure(code, runs) * 1000:8.1f} ms")
@@ -0,0 +1,76 @@
+"""
+Compares the throughput of validated, trusted (constructed without validation) and lazy (converted on access,
+reading two fields) parsing of api responses for every resource type.
+
+    python benchmarks/parse_models.py [items]
+"""
+import json
+import sys
+import time
+
+from pydantic_factories import ModelFactory
+
+from databricks_sdk_python.resources.account.aws.credentials import Credentials
+from databricks_sdk_python.resources.account.aws.networks import Network
+from databricks_sdk_python.resources.account.aws.storage_config import StorageConfiguration
+from databricks_sdk_python.resources.account.aws.workspaces import Workspace
+from databricks_sdk_python.resources.parsing import parse_model
+from databricks_sdk_python.resources.workspace.cluster_policies import ClusterPolicy
+from databricks_sdk_python.resources.workspace.instance_profiles import InstanceProfile
+from databricks_sdk_python.resources.workspace.permissions import PermissionLevels, Permissions
+from databricks_sdk_python.resources.workspace.unity_catalog.catalogs import Catalog
+from databricks_sdk_python.resources.workspace.unity_catalog.metastores import Metastore
+from databricks_sdk_python.resources.workspace.unity_catalog.schemas import Schema
+
+MODELS = [
+    Credentials,
+    Network,
+    StorageConfiguration,
+    Workspace,
+    ClusterPolicy,
+    InstanceProfile,
+    Permissions,
+    PermissionLevels,
+    Catalog,
+    Metastore,
+    Schema,
+]
+
+
+def responses(model, items: int) -> list:
+    factory = ModelFactory.create_factory(model)
+    responses = [json.loads(m.json()) for m in factory.batch(items)]
+    if model is ClusterPolicy:
+        for r in responses:
+            r["definition"] = json.dumps(r["definition"])
+            if r["policy_family_definition_overrides"] is not None:
+                r["policy_family_definition_overrides"] = json.dumps(r["policy_family_definition_overrides"])
+    return responses
+
+
+def parse(model, data: dict, trusted: bool, lazy: bool):
+    if model is ClusterPolicy:
+        return ClusterPolicy.parse_json(data, workspace_host=data.pop("workspace_host"), trusted=trusted)
+    return parse_model(model, data, trusted=trusted, lazy=lazy)
+
+
+def measure(model, data: list, trusted: bool = False, lazy: bool = False) -> float:
+    copies = [dict(d) for d in data]  # parse_json modifies its input
+    read = list(model.__fields__)[:2]
+    start = time.perf_counter()
+    for d in copies:
+        parsed = parse(model, d, trusted, lazy)
+        for name in read:
+            getattr(parsed, name)
+    return len(data) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{'model':<25} {'validated/s':>12} {'trusted/s':>12} {'lazy/s':>12}")
+    for model in MODELS:
+        data = responses(model, items)
+        validated = measure(model, data)
+        trusted = measure(model, data, trusted=True)
+        lazy = measure(model, data, lazy=True) if model is not ClusterPolicy else float("nan")
+        print(f"{model.__name__:<25} {validated:12.0f} {trusted:12.0f} {lazy:12.0f}")
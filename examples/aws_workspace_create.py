@@ -9,6 +9,10 @@ account_id = UUID("<databricks account id>")
 auth = HTTPBasicAuth(username="<user_name>", password="<password>")
 account_client = get_aws_account_client(account_id=account_id)
 
+# iter() parses the list response while it is downloaded and yields one workspace at a time
+for w in account_client.workspaces.iter():
+    print(w.workspace_name, w.workspace_status)
+
 credentials = account_client.credentials.create(credentials_name="<name>", role_arn="<iam role arn>")
 storage_configuration = account_client.storage_configuration.create(
     storage_configuration_name="<name>", bucket_name="<bucket name>"
@@ -13,6 +13,9 @@ cluster_policy = client.cluster_policies.create(
 cluster_policy = client.cluster_policies.get_by_id("<id of policy>")
 cluster_policy = client.cluster_policies.get_by_name("<name of policy>")
 
+# serve get_by_id / get_by_name from a single cached list call, writes through this client invalidate it
+client.cluster_policies.enable_cache(ttl=60)
+
 # Fetching current permissions
 permissions = cluster_policy.get_permissions()
 
@@ -4,3 +4,9 @@ workspace_client = get_workspace_client(workspace_host="<hostname of workspace>"
 
 instance_profiles = workspace_client.instance_profiles.list()
 instance_profile = workspace_client.instance_profiles.get("<arn or name>")
+
+# resolve many profiles with a single list call
+instance_profiles_by_name = workspace_client.instance_profiles.get_many(["<arn or name>", "<arn or name>"])
+
+# serve get (and InstanceProfile.refresh) from a cached index on arn and name
+workspace_client.instance_profiles.enable_cache(ttl=60)
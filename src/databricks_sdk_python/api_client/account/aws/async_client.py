@@ -0,0 +1,41 @@
+from functools import cached_property
+from typing import Optional
+from uuid import UUID
+
+from requests.auth import HTTPBasicAuth
+
+from databricks_sdk_python.api_client.account.aws.client import AwsAccountClient, get_aws_account_client
+from databricks_sdk_python.api_client.async_client import DEFAULT_MAX_WORKERS, AsyncBaseClient, AsyncSubClient
+
+
+class AsyncAwsAccountClient(AsyncBaseClient):
+    client: AwsAccountClient
+
+    def __init__(self, client: AwsAccountClient, max_workers: Optional[int] = None):
+        super().__init__(client=client, max_workers=max_workers)
+        self.account_id = client.account_id
+
+    @cached_property
+    def credentials(self) -> AsyncSubClient:
+        return self._sub_client(self.client.credentials)
+
+    @cached_property
+    def storage_configuration(self) -> AsyncSubClient:
+        return self._sub_client(self.client.storage_configuration)
+
+    @cached_property
+    def networks(self) -> AsyncSubClient:
+        return self._sub_client(self.client.networks)
+
+    @cached_property
+    def workspaces(self) -> AsyncSubClient:
+        return self._sub_client(self.client.workspaces)
+
+
+def get_async_aws_account_client(
+    account_id: UUID, auth: Optional[HTTPBasicAuth] = None, max_workers: Optional[int] = None
+) -> AsyncAwsAccountClient:
+    """The cached blocking client of the account is made with a connection per worker when it does not exist yet"""
+    max_workers = max_workers or DEFAULT_MAX_WORKERS
+    client = get_aws_account_client(account_id=account_id, auth=auth, pool_maxsize=max_workers)
+    return AsyncAwsAccountClient(client, max_workers=max_workers)
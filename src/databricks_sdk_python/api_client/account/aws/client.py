@@ -1,39 +1,61 @@
-from typing import Dict, Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from requests.auth import HTTPBasicAuth
 
 from databricks_sdk_python.api_client.client import BaseClient
+from databricks_sdk_python.api_client.client_cache import ClientCache
+
+if TYPE_CHECKING:
+    from databricks_sdk_python.api_client.account.aws.credentials import AwsCredentialsClient
+    from databricks_sdk_python.api_client.account.aws.networks import AwsNetworksClient
+    from databricks_sdk_python.api_client.account.aws.storage_configuration import AwsStorageConfigurationClient
+    from databricks_sdk_python.api_client.account.aws.workspaces import AwsWorkspacesClient
 
 ACCOUNT_API_PREFIX = "api/2.0/accounts"
 ACCOUNT_HOST = "accounts.cloud.databricks.com"
 
 
 class AwsAccountClient(BaseClient):
-    def __init__(self, account_id: UUID, auth: Optional[HTTPBasicAuth] = None):
-        super().__init__(host=ACCOUNT_HOST, auth=auth)
+    def __init__(self, account_id: UUID, auth: Optional[HTTPBasicAuth] = None, **kwargs):
+        """Extra keyword arguments like `rate_limiter` and `pool_maxsize` are passed to BaseClient"""
+        super().__init__(host=ACCOUNT_HOST, auth=auth, **kwargs)
         self.account_id = account_id
 
+    # sub clients and their resource models are only imported and created on first use
+
+    @cached_property
+    def credentials(self) -> "AwsCredentialsClient":
         from databricks_sdk_python.api_client.account.aws.credentials import AwsCredentialsClient
-        from databricks_sdk_python.api_client.account.aws.networks import AwsNetworksClient
+
+        return AwsCredentialsClient(self)
+
+    @cached_property
+    def storage_configuration(self) -> "AwsStorageConfigurationClient":
         from databricks_sdk_python.api_client.account.aws.storage_configuration import AwsStorageConfigurationClient
+
+        return AwsStorageConfigurationClient(self)
+
+    @cached_property
+    def networks(self) -> "AwsNetworksClient":
+        from databricks_sdk_python.api_client.account.aws.networks import AwsNetworksClient
+
+        return AwsNetworksClient(self)
+
+    @cached_property
+    def workspaces(self) -> "AwsWorkspacesClient":
         from databricks_sdk_python.api_client.account.aws.workspaces import AwsWorkspacesClient
 
-        self.credentials = AwsCredentialsClient(self)
-        self.storage_configuration = AwsStorageConfigurationClient(self)
-        self.networks = AwsNetworksClient(self)
-        self.workspaces = AwsWorkspacesClient(self)
+        return AwsWorkspacesClient(self)
 
     def _get_account_path(self):
         return f"{ACCOUNT_API_PREFIX}/{self.account_id}"
 
 
-_client_cache: Dict[UUID, AwsAccountClient] = {}
+client_cache: ClientCache[AwsAccountClient] = ClientCache()
 
 
-def get_aws_account_client(account_id: UUID, auth: Optional[HTTPBasicAuth] = None) -> AwsAccountClient:
-    client = _client_cache.get(account_id)
-    if client is not None and (auth is None or client.auth == auth):
-        return client
-    _client_cache[account_id] = AwsAccountClient(account_id=account_id, auth=auth)
-    return _client_cache[account_id]
+def get_aws_account_client(account_id: UUID, auth: Optional[HTTPBasicAuth] = None, **kwargs) -> AwsAccountClient:
+    """Returns the cached client of the account, `kwargs` like `pool_maxsize` are only used when a new client is made"""
+    return client_cache.get(account_id, auth, lambda: AwsAccountClient(account_id=account_id, auth=auth, **kwargs))
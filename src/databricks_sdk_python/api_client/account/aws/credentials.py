@@ -1,12 +1,16 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from uuid import UUID
 
 from databricks_sdk_python.api_client.account.aws.client import AwsAccountClient
+from databricks_sdk_python.api_client.list_cache import IdLookupMixin
+from databricks_sdk_python.api_client.streaming import iter_json_array
 from databricks_sdk_python.api_client.utils import UnknownApiResponse
 from databricks_sdk_python.resources.account.aws.credentials import Credentials
 
 
-class AwsCredentialsClient(object):
+class AwsCredentialsClient(IdLookupMixin):
+    _cache_indexes = {"id": "credentials_id", "name": "credentials_name"}
+
     def __init__(self, aws_account_client: AwsAccountClient):
         self.aws_account_client = aws_account_client
 
@@ -22,23 +26,41 @@ class AwsCredentialsClient(object):
         if response.status_code == 404:
             return []
         elif response.status_code == 200:
-            return [Credentials(**x) for x in response.json()]
+            return [self.aws_account_client._parse(Credentials, x) for x in response.json()]
         else:
             raise UnknownApiResponse(response)
 
+    def iter(self) -> Iterator[Credentials]:
+        """Iterate over all credentials found on databricks account, parsing the response while it is downloaded"""
+        response = self.aws_account_client._get(self._get_path(), stream=True)
+        try:
+            if response.status_code == 200:
+                for x in iter_json_array(response):
+                    yield self.aws_account_client._parse(Credentials, x)
+            elif response.status_code == 404:
+                return
+            else:
+                raise UnknownApiResponse(response)
+        finally:
+            response.close()
+
     def get_by_id(self, credentials_id: UUID) -> Optional[Credentials]:
         """Fetch a single credentials by id"""
+        if self._cache is not None:
+            return self._cache.get("id", credentials_id)
         response = self.aws_account_client._get(self._get_id_path(credentials_id))
         if response.status_code == 404:
             return None
         elif response.status_code == 200:
-            return Credentials(**response.json())
+            return self.aws_account_client._parse(Credentials, response.json())
         else:
             raise UnknownApiResponse(response)
 
     def get_by_name(self, credentials_name: str) -> Optional[Credentials]:
         """Fetch a single credentials by name"""
-        for c in self.list():
+        if self._cache is not None:
+            return self._cache.get("name", credentials_name)
+        for c in self.iter():
             if c.credentials_name == credentials_name:
                 return c
 
@@ -50,7 +72,8 @@ class AwsCredentialsClient(object):
         }
         response = self.aws_account_client._post(self._get_path(), body=body)
         if response.status_code == 201:
-            return Credentials(**response.json())
+            self._invalidate_cache()
+            return self.aws_account_client._parse(Credentials, response.json())
         else:
             raise UnknownApiResponse(response)
 
@@ -59,3 +82,4 @@ class AwsCredentialsClient(object):
         response = self.aws_account_client._delete(self._get_id_path(credentials_id))
         if response.status_code != 200:
             raise UnknownApiResponse(response)
+        self._invalidate_cache()
@@ -1,13 +1,17 @@
 import json
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from uuid import UUID
 
 from databricks_sdk_python.api_client.account.aws.client import AwsAccountClient
+from databricks_sdk_python.api_client.list_cache import IdLookupMixin
+from databricks_sdk_python.api_client.streaming import iter_json_array
 from databricks_sdk_python.api_client.utils import UnknownApiResponse
 from databricks_sdk_python.resources.account.aws.networks import Network, NetworkVpcEndpoints
 
 
-class AwsNetworksClient(object):
+class AwsNetworksClient(IdLookupMixin):
+    _cache_indexes = {"id": "network_id", "name": "network_name"}
+
     def __init__(self, aws_account_client: AwsAccountClient):
         self.aws_account_client = aws_account_client
 
@@ -21,17 +25,33 @@ class AwsNetworksClient(object):
         """List all network found on databricks account"""
         response = self.aws_account_client._get(self._get_path())
         if response.status_code == 200:
-            return [Network(**x) for x in response.json()]
+            return [self.aws_account_client._parse(Network, x) for x in response.json()]
         elif response.status_code == 404:
             return []
         else:
             raise UnknownApiResponse(response)
 
+    def iter(self) -> Iterator[Network]:
+        """Iterate over all networks found on databricks account, parsing the response while it is downloaded"""
+        response = self.aws_account_client._get(self._get_path(), stream=True)
+        try:
+            if response.status_code == 200:
+                for x in iter_json_array(response):
+                    yield self.aws_account_client._parse(Network, x)
+            elif response.status_code == 404:
+                return
+            else:
+                raise UnknownApiResponse(response)
+        finally:
+            response.close()
+
     def get_by_id(self, network_id: UUID) -> Optional[Network]:
         """Fetch a single network by id"""
+        if self._cache is not None:
+            return self._cache.get("id", network_id)
         response = self.aws_account_client._get(self._get_id_path(network_id))
         if response.status_code == 200:
-            return Network(**response.json())
+            return self.aws_account_client._parse(Network, response.json())
         elif response.status_code == 404:
             return None
         else:
@@ -39,7 +59,9 @@ class AwsNetworksClient(object):
 
     def get_by_name(self, network_name: str) -> Optional[Network]:
         """Fetch a single network by name"""
-        for s in self.list():
+        if self._cache is not None:
+            return self._cache.get("name", network_name)
+        for s in self.iter():
             if s.network_name == network_name:
                 return s
         return None
@@ -63,7 +85,8 @@ class AwsNetworksClient(object):
             body["vpc_endpoints"] = json.loads(vpc_endpoints.json())
         response = self.aws_account_client._post(self._get_path(), body=body)
         if response.status_code == 201:
-            return Network(**response.json())
+            self._invalidate_cache()
+            return self.aws_account_client._parse(Network, response.json())
         else:
             raise UnknownApiResponse(response)
 
@@ -72,3 +95,4 @@ class AwsNetworksClient(object):
         response = self.aws_account_client._delete(self._get_id_path(network_id))
         if response.status_code != 200:
             raise UnknownApiResponse(response)
+        self._invalidate_cache()
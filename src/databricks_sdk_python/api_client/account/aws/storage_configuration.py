@@ -1,12 +1,16 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from uuid import UUID
 
 from databricks_sdk_python.api_client.account.aws.client import AwsAccountClient
+from databricks_sdk_python.api_client.list_cache import IdLookupMixin
+from databricks_sdk_python.api_client.streaming import iter_json_array
 from databricks_sdk_python.api_client.utils import UnknownApiResponse
 from databricks_sdk_python.resources.account.aws.storage_config import StorageConfiguration
 
 
-class AwsStorageConfigurationClient(object):
+class AwsStorageConfigurationClient(IdLookupMixin):
+    _cache_indexes = {"id": "storage_configuration_id", "name": "storage_configuration_name"}
+
     def __init__(self, aws_account_client: AwsAccountClient):
         self.aws_account_client = aws_account_client
 
@@ -20,17 +24,33 @@ class AwsStorageConfigurationClient(object):
         """List all storage_configuration found on databricks account"""
         response = self.aws_account_client._get(self._get_path())
         if response.status_code == 200:
-            return [StorageConfiguration(**x) for x in response.json()]
+            return [self.aws_account_client._parse(StorageConfiguration, x) for x in response.json()]
         elif response.status_code == 404:
             return []
         else:
             raise UnknownApiResponse(response)
 
+    def iter(self) -> Iterator[StorageConfiguration]:
+        """Iterate over all storage configurations found on databricks account, parsing the response while it is downloaded"""
+        response = self.aws_account_client._get(self._get_path(), stream=True)
+        try:
+            if response.status_code == 200:
+                for x in iter_json_array(response):
+                    yield self.aws_account_client._parse(StorageConfiguration, x)
+            elif response.status_code == 404:
+                return
+            else:
+                raise UnknownApiResponse(response)
+        finally:
+            response.close()
+
     def get_by_id(self, storage_configuration_id: UUID) -> Optional[StorageConfiguration]:
         """Fetch a single storage_configuration by id"""
+        if self._cache is not None:
+            return self._cache.get("id", storage_configuration_id)
         response = self.aws_account_client._get(self._get_id_path(storage_configuration_id))
         if response.status_code == 200:
-            return StorageConfiguration(**response.json())
+            return self.aws_account_client._parse(StorageConfiguration, response.json())
         elif response.status_code == 404:
             return None
         else:
@@ -38,7 +58,9 @@ class AwsStorageConfigurationClient(object):
 
     def get_by_name(self, storage_configuration_name: str) -> Optional[StorageConfiguration]:
         """Fetch a single storage_configuration by name"""
-        for s in self.list():
+        if self._cache is not None:
+            return self._cache.get("name", storage_configuration_name)
+        for s in self.iter():
             if s.storage_configuration_name == storage_configuration_name:
                 return s
         return None
@@ -51,7 +73,8 @@ class AwsStorageConfigurationClient(object):
         }
         response = self.aws_account_client._post(self._get_path(), body=body)
         if response.status_code == 201:
-            return StorageConfiguration(**response.json())
+            self._invalidate_cache()
+            return self.aws_account_client._parse(StorageConfiguration, response.json())
         else:
             raise UnknownApiResponse(response)
 
@@ -60,3 +83,4 @@ class AwsStorageConfigurationClient(object):
         response = self.aws_account_client._delete(self._get_id_path(storage_configuration_id))
         if response.status_code != 200:
             raise UnknownApiResponse(response)
+        self._invalidate_cache()
@@ -1,12 +1,17 @@
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Sequence
 from uuid import UUID
 
 from databricks_sdk_python.api_client.account.aws.client import AwsAccountClient
+from databricks_sdk_python.api_client.backoff import Backoff
+from databricks_sdk_python.api_client.list_cache import IdLookupMixin
+from databricks_sdk_python.api_client.streaming import iter_json_array
 from databricks_sdk_python.api_client.utils import UnknownApiResponse
 from databricks_sdk_python.resources.account.aws.workspaces import Workspace
 
 
-class AwsWorkspacesClient(object):
+class AwsWorkspacesClient(IdLookupMixin):
+    _cache_indexes = {"id": "workspace_id", "name": "workspace_name"}
+
     def __init__(self, aws_account_client: AwsAccountClient):
         self.aws_account_client = aws_account_client
 
@@ -16,21 +21,40 @@ class AwsWorkspacesClient(object):
     def _get_id_path(self, workspace_id: int):
         return f"{self._get_path()}/{workspace_id}"
 
-    def list(self) -> List[Workspace]:
-        """List all workspace found on databricks account"""
+    def list(self, lazy: bool = False, fields: Optional[Sequence[str]] = None) -> List[Workspace]:
+        """
+        List all workspace found on databricks account.
+        With `lazy` fields are only converted when read, with `fields` records of only those fields are returned.
+        """
         response = self.aws_account_client._get(self._get_path())
         if response.status_code == 200:
-            return [Workspace(**x) for x in response.json()]
+            return [self.aws_account_client._parse(Workspace, x, lazy=lazy, fields=fields) for x in response.json()]
         elif response.status_code == 404:
             return []
         else:
             raise UnknownApiResponse(response)
 
+    def iter(self, lazy: bool = False, fields: Optional[Sequence[str]] = None) -> Iterator[Workspace]:
+        """Iterate over all workspaces found on databricks account, parsing the response while it is downloaded"""
+        response = self.aws_account_client._get(self._get_path(), stream=True)
+        try:
+            if response.status_code == 200:
+                for x in iter_json_array(response):
+                    yield self.aws_account_client._parse(Workspace, x, lazy=lazy, fields=fields)
+            elif response.status_code == 404:
+                return
+            else:
+                raise UnknownApiResponse(response)
+        finally:
+            response.close()
+
     def get_by_id(self, workspace_id: int) -> Optional[Workspace]:
         """Fetch a single workspace by id"""
+        if self._cache is not None:
+            return self._cache.get("id", workspace_id)
         response = self.aws_account_client._get(self._get_id_path(workspace_id))
         if response.status_code == 200:
-            return Workspace(**response.json())
+            return self.aws_account_client._parse(Workspace, response.json())
         if response.status_code == 404:
             return None
         else:
@@ -38,11 +62,44 @@ class AwsWorkspacesClient(object):
 
     def get_by_name(self, workspace_name: str) -> Optional[Workspace]:
         """Fetch a single workspace by name"""
-        for s in self.list():
+        if self._cache is not None:
+            return self._cache.get("name", workspace_name)
+        for s in self.iter():
             if s.workspace_name == workspace_name:
                 return s
         return None
 
+    def wait_for_workspaces(
+        self, workspace_ids: Iterable[int], timeout: Optional[float] = None, backoff: Optional[Backoff] = None
+    ) -> Iterator[Workspace]:
+        """
+        Yields every workspace as soon as it is no longer provisioning, polling all of them with a single list call
+        per tick and jittered exponential backoff between ticks. The list is read completely before anything is
+        yielded, so no response is kept open while the caller handles a workspace.
+        Raises RuntimeError for workspaces that do not exist and TimeoutError when some are still provisioning after
+        `timeout` seconds.
+        """
+        pending = {int(i) for i in workspace_ids}
+        polls = (backoff or Backoff()).sleeps(timeout)
+        while pending:
+            found = set()
+            for w in self.list():
+                if w.workspace_id in pending:
+                    found.add(w.workspace_id)
+                    if w.workspace_status != "PROVISIONING":
+                        pending.discard(w.workspace_id)
+                        yield w
+            missing = pending - found
+            if missing:
+                raise RuntimeError(f"{', '.join(str(i) for i in sorted(missing))} do not exist anymore")
+            if pending:
+                try:
+                    next(polls)
+                except TimeoutError:
+                    raise TimeoutError(
+                        f"{', '.join(str(i) for i in sorted(pending))} still provisioning after {timeout} seconds"
+                    ) from None
+
     def create(
         self,
         workspace_name: str,
@@ -76,7 +133,8 @@ class AwsWorkspacesClient(object):
             body["deployment_name"] = str(deployment_name)
         response = self.aws_account_client._post(self._get_path(), body=body)
         if response.status_code == 201:
-            return Workspace(**response.json())
+            self._invalidate_cache()
+            return self.aws_account_client._parse(Workspace, response.json())
         else:
             raise UnknownApiResponse(response)
 
@@ -109,7 +167,8 @@ class AwsWorkspacesClient(object):
             body["private_access_settings_id"] = str(private_access_settings_id)
         response = self.aws_account_client._patch(self._get_id_path(workspace_id), body=body)
         if response.status_code == 200:
-            return Workspace(**response.json())
+            self._invalidate_cache()
+            return self.aws_account_client._parse(Workspace, response.json())
         else:
             raise UnknownApiResponse(response)
 
@@ -118,3 +177,4 @@ class AwsWorkspacesClient(object):
         response = self.aws_account_client._delete(self._get_id_path(workspace_id))
         if response.status_code != 200:
             raise UnknownApiResponse(response)
+        self._invalidate_cache()
@@ -0,0 +1,104 @@
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from databricks_sdk_python.api_client.client import BaseClient
+
+DEFAULT_MAX_WORKERS = 32
+
+# methods returning context managers bound to the thread that entered them (like `permissions.batch()`), calls made
+# from coroutines run on other executor threads and would not be seen by them
+NOT_WRAPPED = frozenset({"batch"})
+
+
+class AsyncSubClient(object):
+    """
+    Awaitable view on a blocking sub client.
+    Every public method of the wrapped client is exposed as a coroutine function that runs on the executor
+    of the owning async client, generator methods become async generators and nested sub clients
+    (like `unity_catalog.metastores`) are wrapped as well.
+    The returned resources are the same pydantic models the blocking client returns.
+    Methods in NOT_WRAPPED are not available, use them on the blocking client inside a single executor call.
+    """
+
+    def __init__(self, client: Any, executor: ThreadPoolExecutor):
+        self._client = client
+        self._executor = executor
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name in NOT_WRAPPED:
+            raise AttributeError(f"{name} is bound to the calling thread and not available on the async client")
+        value = getattr(self._client, name)
+        if inspect.isgeneratorfunction(value):
+            return self._wrap_generator(value)
+        if callable(value):
+            return self._wrap(value)
+        if not isinstance(value, BaseClient) and type(value).__module__.startswith("databricks_sdk_python.api_client"):
+            return AsyncSubClient(value, self._executor)
+        return value
+
+    def _wrap(self, method):
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
+
+        return wrapper
+
+    def _wrap_generator(self, method):
+        """Generators like `iter` become async generators, every item is pulled on the executor"""
+
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            iterator = method(*args, **kwargs)
+            done = object()
+            try:
+                while True:
+                    item = await loop.run_in_executor(self._executor, next, iterator, done)
+                    if item is done:
+                        return
+                    yield item
+            finally:
+                iterator.close()
+
+        return wrapper
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._client!r})"
+
+
+class AsyncBaseClient(object):
+    """
+    Base of the asyncio clients.
+    This is not an asyncio http transport: the blocking calls of the requests based client are executed on a bounded
+    thread pool sharing its connection pool. Every call in flight occupies one worker thread, so any number of
+    coroutines can await calls while at most `max_workers` calls (and connections, when the pool is at least as large)
+    run at the same time and the others wait for a free worker.
+    The returned models are the regular blocking models, their `refresh`, `update` and `delete` block the event loop
+    and should be awaited through `loop.run_in_executor` or made through the async sub clients instead.
+    """
+
+    def __init__(self, client: BaseClient, max_workers: Optional[int] = None):
+        self.client = client
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or DEFAULT_MAX_WORKERS, thread_name_prefix="databricks-sdk-python"
+        )
+
+    def _sub_client(self, client: Any) -> AsyncSubClient:
+        return AsyncSubClient(client, self.executor)
+
+    async def aclose(self):
+        """Shuts down the executor without blocking the event loop, the blocking client and its session stay usable"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self.executor.shutdown, wait=True))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
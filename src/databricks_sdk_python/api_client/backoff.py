@@ -0,0 +1,46 @@
+import random
+import time
+from typing import Iterator, Optional
+
+
+class Backoff(object):
+    """
+    Jittered exponential delays for polling: the n-th delay is `initial * factor ** n` capped at `maximum`, reduced
+    by a random part of up to `jitter` of it so many pollers started together spread out.
+    """
+
+    def __init__(self, initial: float = 2.0, maximum: float = 30.0, factor: float = 2.0, jitter: float = 0.5):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before poll `attempt`, starting at 0"""
+        base = min(self.maximum, self.initial * self.factor**attempt)
+        return base * (1 - self.jitter * random.random())
+
+    def sleeps(self, timeout: Optional[float] = None) -> Iterator[int]:
+        """
+        Sleeps the next delay before yielding the attempt number, never past the deadline.
+        Raises TimeoutError once `timeout` seconds have passed since `sleeps` was called, so the work done before
+        the first sleep counts against the timeout.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        return self._sleeps(deadline, timeout)
+
+    def _sleeps(self, deadline: Optional[float], timeout: Optional[float]) -> Iterator[int]:
+        attempt = 0
+        while True:
+            delay = self.delay(attempt)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Timed out after {timeout} seconds")
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            yield attempt
+            attempt += 1
+
+    def __repr__(self):
+        return f"Backoff(initial={self.initial}, maximum={self.maximum}, factor={self.factor}, jitter={self.jitter})"
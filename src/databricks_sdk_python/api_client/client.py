@@ -1,6 +1,6 @@
 import logging
 import ssl
-from typing import Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Type, TypeVar
 
 import requests
 from requests import Response
@@ -8,34 +8,88 @@ from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase, HTTPBasicAuth
 from requests.utils import get_netrc_auth
 
+from databricks_sdk_python.api_client.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    MapResult,
+    ProgressCallback,
+    imap,
+    map_concurrently,
+)
+from databricks_sdk_python.api_client.connection_pool import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    MetricsPoolManager,
+    PoolMetrics,
+    keepalive_socket_options,
+)
+from databricks_sdk_python.api_client.identity_map import IdentityMap
+from databricks_sdk_python.api_client.rate_limit import RateLimiter, get_default_rate_limiter
+
 try:
-    from requests.packages.urllib3.poolmanager import PoolManager
     from requests.packages.urllib3.util.retry import Retry
 except ImportError:
-    from urllib3.poolmanager import PoolManager
     from urllib3.util.retry import Retry
 
 
 logger = logging.getLogger("databricks-sdk-python")
 
+T = TypeVar("T")
+R = TypeVar("R")
+M = TypeVar("M")
+
 
 class TlsV1HttpAdapter(HTTPAdapter):
     """
     A HTTP adapter implementation that specifies the ssl version to be TLS1.
     This avoids problems with openssl versions that
     use SSL3 as a default (which is not supported by the server side).
+    Connection reuse and pool wait time are reported to `metrics`.
     """
 
+    def __init__(self, metrics: Optional[PoolMetrics] = None, socket_options: Optional[list] = None, **kwargs):
+        self.metrics = metrics or PoolMetrics()
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
     def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
-        self.poolmanager = PoolManager(
-            num_pools=connections, maxsize=maxsize, block=block, ssl_version=ssl.PROTOCOL_TLSv1_2
+        if self.socket_options is not None:
+            pool_kwargs["socket_options"] = self.socket_options
+        self.poolmanager = MetricsPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            ssl_version=ssl.PROTOCOL_TLSv1_2,
+            metrics=self.metrics,
+            **pool_kwargs,
         )
 
 
 class BaseClient(object):
-    def __init__(self, host: str, auth: Optional[AuthBase] = None):
+    def __init__(
+        self,
+        host: str,
+        auth: Optional[AuthBase] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        tcp_keepalive: bool = False,
+        trusted: bool = False,
+        identity_map: bool = False,
+    ):
+        """
+        `pool_maxsize` is the number of connections kept open per host, it should be at least the concurrency used.
+        With `pool_block` requests wait for a free connection instead of opening one that is discarded afterwards.
+        `tcp_keepalive` enables tcp keep-alive probes so idle pooled connections are not silently dropped.
+        With `trusted` responses are turned into models without pydantic validation, which is a lot faster for large
+        lists but assumes the api returns what the models describe.
+        With `identity_map` every lookup of the same resource returns the same model instance, updated in place.
+        """
         self.host = host
         self.auth = auth
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        self.trusted = trusted
+        self.identity_map = IdentityMap() if identity_map else None
         if self.auth is None:
             net_rc = get_netrc_auth(f"https://{host}")
             if net_rc is not None:
@@ -53,7 +107,43 @@ class BaseClient(object):
             respect_retry_after_header=True,
             raise_on_status=False,  # return original response when retries have been exhausted
         )
-        self.session.mount("https://", TlsV1HttpAdapter(max_retries=retries))
+        self.pool_metrics = PoolMetrics()
+        self.session.mount(
+            "https://",
+            TlsV1HttpAdapter(
+                metrics=self.pool_metrics,
+                socket_options=keepalive_socket_options() if tcp_keepalive else None,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                max_retries=retries,
+            ),
+        )
+
+    def close(self):
+        """Closes the pooled connections of the session"""
+        self.session.close()
+
+    def _parse(
+        self, model: Type[M], data: dict, lazy: bool = False, fields: Optional[Sequence[str]] = None, **values
+    ) -> M:
+        """
+        Model of a response, validated unless the client is `trusted`.
+        With `lazy` fields are converted on access, with `fields` a record of only those fields is returned.
+        """
+        # imported here so pydantic and the models are only loaded once a response is parsed
+        from databricks_sdk_python.resources.parsing import parse_model
+
+        parsed = parse_model(model, data, trusted=self.trusted, lazy=lazy, fields=fields, **values)
+        if lazy or fields is not None:
+            return parsed
+        return self._share(parsed)
+
+    def _share(self, model: M) -> M:
+        """The instance of the resource from the identity map when enabled"""
+        if self.identity_map is not None:
+            return self.identity_map.merge(model)
+        return model
 
     def _get_url(self, path: str):
         if path.startswith("/"):
@@ -61,11 +151,20 @@ class BaseClient(object):
         else:
             return f"https://{self.host}/{path}"
 
-    def _request(self, method, path: str, params: Optional[dict] = None, body: Optional[dict] = None) -> Response:
-        return self.session.request(method, url=self._get_url(path), params=params, json=body, auth=self.auth)
+    def _request(
+        self, method, path: str, params: Optional[dict] = None, body: Optional[dict] = None, stream: bool = False
+    ) -> Response:
+        self.rate_limiter.acquire(self.host, path)
+        response = self.session.request(
+            method, url=self._get_url(path), params=params, json=body, auth=self.auth, stream=stream
+        )
+        self.rate_limiter.record(self.host, path, response)
+        return response
 
-    def _get(self, path: str, params: Optional[dict] = None, body: Optional[dict] = None) -> Response:
-        return self._request("GET", path, params=params, body=body)
+    def _get(
+        self, path: str, params: Optional[dict] = None, body: Optional[dict] = None, stream: bool = False
+    ) -> Response:
+        return self._request("GET", path, params=params, body=body, stream=stream)
 
     def _post(self, path: str, params: Optional[dict] = None, body: Optional[dict] = None) -> Response:
         return self._request("POST", path, params=params, body=body)
@@ -78,3 +177,27 @@ class BaseClient(object):
 
     def _delete(self, path: str, params: Optional[dict] = None, body: Optional[dict] = None) -> Response:
         return self._request("DELETE", path, params=params, body=body)
+
+    def map(
+        self,
+        fn: Callable[[T], R],
+        items: Iterable[T],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        progress: Optional[ProgressCallback] = None,
+    ) -> List[MapResult]:
+        """
+        Calls `fn` for every item with at most `max_concurrency` calls in flight, sharing this client's session.
+        Returns a MapResult per item in input order, failures are captured per item instead of aborting the batch.
+        """
+        return map_concurrently(fn, items, max_concurrency=max_concurrency, progress=progress)
+
+    def imap(
+        self,
+        fn: Callable[[T], R],
+        items: Iterable[T],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        progress: Optional[ProgressCallback] = None,
+        ordered: bool = True,
+    ) -> Iterator[MapResult]:
+        """Lazy version of `map`, with `ordered=False` results are yielded as soon as they complete"""
+        return imap(fn, items, max_concurrency=max_concurrency, progress=progress, ordered=ordered)
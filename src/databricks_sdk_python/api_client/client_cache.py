@@ -0,0 +1,90 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from requests.auth import AuthBase, HTTPBasicAuth
+
+from databricks_sdk_python.api_client.client import BaseClient
+
+C = TypeVar("C", bound=BaseClient)
+
+DEFAULT_MAX_SIZE = 256
+DEFAULT_TTL = 3600.0
+
+
+def auth_identity(auth: Optional[AuthBase]) -> Hashable:
+    """Identity of the credentials, without keeping the secret itself in the key"""
+    if auth is None:
+        return None
+    if isinstance(auth, HTTPBasicAuth):
+        password = auth.password if isinstance(auth.password, bytes) else str(auth.password).encode()
+        return "basic", auth.username, hashlib.sha256(password).hexdigest()
+    return type(auth), id(auth)
+
+
+class ClientCache(Generic[C]):
+    """
+    Thread safe LRU of clients keyed on (host or account, credentials).
+    Clients that were not used for `ttl` seconds or that fall out of the `max_size` most recently used are
+    evicted and their session is closed.
+    A lookup without credentials returns the most recently used client of the host, whatever its credentials.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: Optional[float] = DEFAULT_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[Hashable, Hashable], Tuple[C, float]]" = OrderedDict()
+        self._latest: Dict[Hashable, Tuple[Hashable, Hashable]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, auth: Optional[AuthBase], factory: Callable[[], C]) -> C:
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired(now)
+            entry_key = self._latest.get(key) if auth is None else (key, auth_identity(auth))
+            entry = self._entries.get(entry_key) if entry_key is not None else None
+            if entry is not None:
+                client = entry[0]
+            else:
+                client = factory()
+                entry_key = (key, auth_identity(client.auth))
+                previous = self._entries.get(entry_key)
+                if previous is not None:
+                    previous[0].close()
+            self._entries[entry_key] = (client, now)
+            self._entries.move_to_end(entry_key)
+            self._latest[key] = entry_key
+            while len(self._entries) > self.max_size:
+                self._evict(next(iter(self._entries)))
+            return client
+
+    def _evict_expired(self, now: float):
+        if self.ttl is None:
+            return
+        while self._entries:
+            entry_key, (_, last_used) = next(iter(self._entries.items()))
+            if now - last_used < self.ttl:
+                return
+            self._evict(entry_key)
+
+    def _evict(self, entry_key: Tuple[Hashable, Hashable]):
+        client, _ = self._entries.pop(entry_key)
+        client.close()
+        key = entry_key[0]
+        if self._latest.get(key) == entry_key:
+            del self._latest[key]
+            for other in reversed(self._entries):
+                if other[0] == key:
+                    self._latest[key] = other
+                    break
+
+    def clear(self):
+        """Evicts all clients"""
+        with self._lock:
+            for entry_key in list(self._entries):
+                self._evict(entry_key)
+
+    def __len__(self):
+        return len(self._entries)
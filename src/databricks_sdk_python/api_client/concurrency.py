@@ -0,0 +1,122 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Generic, Iterable, Iterator, List, Optional, TypeVar, cast
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class MapResult(Generic[T, R]):
+    """Outcome of a single item of a concurrent map, either a result or the exception raised for the item"""
+
+    __slots__ = ("index", "item", "result", "exception")
+
+    def __init__(self, index: int, item: T, result: Optional[R] = None, exception: Optional[BaseException] = None):
+        self.index = index
+        self.item = item
+        self.result = result
+        self.exception = exception
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+    def get(self) -> R:
+        """Returns the result or raises the exception of this item"""
+        if self.exception is not None:
+            raise self.exception
+        return cast(R, self.result)
+
+    def __repr__(self):
+        if self.ok:
+            return f"MapResult(item={self.item!r}, result={self.result!r})"
+        return f"MapResult(item={self.item!r}, exception={self.exception!r})"
+
+
+def _call(fn: Callable[[T], R], index: int, item: T) -> MapResult[T, R]:
+    try:
+        return MapResult(index, item, result=fn(item))
+    except Exception as e:
+        return MapResult(index, item, exception=e)
+
+
+def imap(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    progress: Optional[ProgressCallback] = None,
+    ordered: bool = True,
+) -> Iterator[MapResult]:
+    """
+    Runs `fn` for every item on a bounded thread pool and yields a MapResult per item.
+    Exceptions are captured per item so one failure does not abort the batch.
+    When `ordered` is False results are yielded as soon as they complete.
+    Only a window of twice the concurrency is submitted ahead, so results are not kept around until the end.
+    `progress` is called with (done, total) from the worker threads after each item.
+    """
+    items = list(items)
+    total = len(items)
+    if total == 0:
+        return
+    done = 0
+    lock = threading.Lock()
+
+    def on_done(_: Future) -> None:
+        nonlocal done
+        with lock:
+            done += 1
+            current = done
+        if progress is not None:
+            progress(current, total)
+
+    workers = max(1, min(max_concurrency, total))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="databricks-sdk")
+    pending: Deque["Future[MapResult[T, R]]"] = deque()
+    # futures in the order they complete, for unordered results
+    completed: "queue.SimpleQueue[Future[MapResult[T, R]]]" = queue.SimpleQueue()
+    remaining = iter(enumerate(items))
+
+    def submit() -> bool:
+        entry = next(remaining, None)
+        if entry is None:
+            return False
+        index, item = entry
+        future = executor.submit(_call, fn, index, item)
+        if progress is not None:
+            future.add_done_callback(on_done)
+        if not ordered:
+            future.add_done_callback(completed.put)
+        pending.append(future)
+        return True
+
+    try:
+        while len(pending) < 2 * workers and submit():
+            pass
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                future = completed.get()
+                pending.remove(future)
+            submit()
+            yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def map_concurrently(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    progress: Optional[ProgressCallback] = None,
+) -> List[MapResult]:
+    """Same as `imap` but collects all results, in the order of `items`"""
+    return list(imap(fn, items, max_concurrency=max_concurrency, progress=progress))
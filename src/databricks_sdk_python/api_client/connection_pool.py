@@ -0,0 +1,106 @@
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from requests.packages.urllib3.connection import HTTPConnection
+    from requests.packages.urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+    from requests.packages.urllib3.poolmanager import PoolManager
+except ImportError:
+    from urllib3.connection import HTTPConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+    from urllib3.poolmanager import PoolManager
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class PoolMetrics(object):
+    """Counters of the connection pools of a client"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.new_connections = 0
+            self.reused_connections = 0
+            self.discarded_connections = 0
+            self.pool_wait_time = 0.0
+            self.max_pool_wait_time = 0.0
+
+    def _checked_out(self, reused: bool, wait_time: float):
+        with self._lock:
+            if reused:
+                self.reused_connections += 1
+            else:
+                self.new_connections += 1
+            self.pool_wait_time += wait_time
+            self.max_pool_wait_time = max(self.max_pool_wait_time, wait_time)
+
+    def _discarded(self):
+        with self._lock:
+            self.discarded_connections += 1
+
+    def as_dict(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+                "discarded_connections": self.discarded_connections,
+                "pool_wait_time": self.pool_wait_time,
+                "max_pool_wait_time": self.max_pool_wait_time,
+            }
+
+    def __repr__(self):
+        return f"PoolMetrics({self.as_dict()})"
+
+
+class _MetricsPoolMixin(object):
+    metrics: Optional[PoolMetrics] = None
+
+    def _get_conn(self, timeout=None):
+        start = time.monotonic()
+        conn = super()._get_conn(timeout=timeout)
+        if self.metrics is not None:
+            # a connection without socket still needs a tcp connect and tls handshake
+            self.metrics._checked_out(getattr(conn, "sock", None) is not None, time.monotonic() - start)
+        return conn
+
+    def _put_conn(self, conn):
+        if self.metrics is not None and self.pool is not None and self.pool.full():
+            self.metrics._discarded()
+        super()._put_conn(conn)
+
+
+class MetricsHTTPConnectionPool(_MetricsPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class MetricsHTTPSConnectionPool(_MetricsPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class MetricsPoolManager(PoolManager):
+    """PoolManager that reports connection reuse and pool wait time to a PoolMetrics"""
+
+    def __init__(self, *args, metrics: PoolMetrics, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics
+        self.pool_classes_by_scheme = {"http": MetricsHTTPConnectionPool, "https": MetricsHTTPSConnectionPool}
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        pool.metrics = self.metrics
+        return pool
+
+
+def keepalive_socket_options(idle: int = 60, interval: int = 10, count: int = 6) -> List[Tuple[int, int, int]]:
+    """Socket options enabling tcp keep-alive, where the platform supports tuning it"""
+    options = list(HTTPConnection.default_socket_options) + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    for name, value in (("TCP_KEEPIDLE", idle), ("TCP_KEEPINTVL", interval), ("TCP_KEEPCNT", count)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
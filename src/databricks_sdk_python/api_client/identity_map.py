@@ -0,0 +1,40 @@
+import threading
+import weakref
+from typing import Any, Tuple, TypeVar
+
+M = TypeVar("M")
+
+
+class IdentityMap(object):
+    """
+    Keeps one model instance per resource, so every lookup of the same resource returns the same object.
+    A newer response of a known resource updates the existing instance in place, like `refresh()` does, local
+    changes that were not sent with `update()` are discarded.
+    Instances are weakly referenced and disappear from the map once nothing else refers to them.
+    """
+
+    def __init__(self):
+        self._instances: "weakref.WeakValueDictionary[Tuple[Any, ...], Any]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def merge(self, model: M) -> M:
+        """Returns the known instance of the resource updated with `model`, or registers `model` as that instance"""
+        identity = model.identity()
+        if identity is None:
+            return model
+        key = (type(model), identity)
+        with self._lock:
+            existing = self._instances.get(key)
+            if existing is None:
+                self._instances[key] = model
+                return model
+        if existing is not model:
+            existing._sync(model)
+        return existing
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def clear(self):
+        with self._lock:
+            self._instances.clear()
@@ -0,0 +1,157 @@
+import abc
+import threading
+import time
+from operator import attrgetter
+from typing import Callable, Dict, Generic, Hashable, Iterable, Iterator, List, Optional, TypeVar, Union
+
+from databricks_sdk_python.api_client.backoff import Backoff
+from databricks_sdk_python.api_client.concurrency import DEFAULT_MAX_CONCURRENCY, imap
+from databricks_sdk_python.api_client.planner import LookupPlanner
+from databricks_sdk_python.api_client.watch import ChangeEvent, Watcher
+
+M = TypeVar("M")
+
+DEFAULT_CACHE_TTL = 60.0
+
+
+def build_index(items: Iterable[M], indexes: Dict[str, Callable[[M], Hashable]]) -> Dict[str, Dict[str, M]]:
+    """Hash index per index name, when keys collide the first item wins like the linear scans it replaces"""
+    index: Dict[str, Dict[str, M]] = {name: {} for name in indexes}
+    for item in items:
+        for name, key in indexes.items():
+            value = key(item)
+            if value is not None:
+                index[name].setdefault(str(value), item)
+    return index
+
+
+class ListCache(Generic[M]):
+    """
+    Result of a single list call with hash indexes on top of it.
+    The list is loaded on first use and reloaded once it is older than `ttl` seconds or has been invalidated.
+    Keys are compared as strings, so an id can be given as UUID, int or str.
+    """
+
+    def __init__(self, loader: Callable[[], List[M]], indexes: Dict[str, Callable[[M], Hashable]], ttl: float):
+        self.loader = loader
+        self.indexes = indexes
+        self.ttl = ttl
+        self._items: Optional[List[M]] = None
+        self._index: Dict[str, Dict[str, M]] = {}
+        self._loaded_at = 0.0
+        self._lock = threading.RLock()
+
+    def index(self) -> Dict[str, Dict[str, M]]:
+        """The indexes, loading the list when needed"""
+        with self._lock:
+            if self._items is None or time.monotonic() - self._loaded_at >= self.ttl:
+                self._items = self.loader()
+                self._index = build_index(self._items, self.indexes)
+                self._loaded_at = time.monotonic()
+            return self._index
+
+    def get(self, index: str, key: Hashable) -> Optional[M]:
+        return self.index()[index].get(str(key))
+
+    def items(self) -> List[M]:
+        with self._lock:
+            self.index()
+            return list(self._items)
+
+    def invalidate(self):
+        with self._lock:
+            self._items = None
+            self._index = {}
+
+
+class ListCacheMixin(abc.ABC):
+    """
+    Opt-in caching of the `list()` result of a sub client, used by `get_by_id` and `get_by_name`, and bulk lookups
+    by name with a single list call.
+    `_cache_indexes` maps the index name to the attribute of the resource, or a function of it, the index is built from.
+    Writes through the same sub client invalidate the cache.
+    """
+
+    _cache_indexes: Dict[str, Union[str, Callable[[M], Hashable]]] = {}
+    _cache: Optional[ListCache] = None
+    _planner: Optional[LookupPlanner] = None
+    # attribute that changes with every update of a resource, `watch` compares whole resources without it
+    _watch_version: Optional[str] = None
+
+    @abc.abstractmethod
+    def list(self) -> list:
+        """All resources of the sub client"""
+
+    def _get_cache_indexes(self) -> Dict[str, Callable[[M], Hashable]]:
+        return {name: attrgetter(key) if isinstance(key, str) else key for name, key in self._cache_indexes.items()}
+
+    def enable_cache(self, ttl: float = DEFAULT_CACHE_TTL):
+        """Serve lookups from one cached `list()` call for `ttl` seconds"""
+        self._cache = ListCache(self.list, self._get_cache_indexes(), ttl=ttl)
+
+    def _get_planner(self) -> LookupPlanner:
+        if self._planner is None:
+            self._planner = LookupPlanner()
+        return self._planner
+
+    def _get_index(self) -> Dict[str, Dict[str, M]]:
+        """Indexes from the cache when enabled, otherwise from a fresh `list()` call which is timed for the planner"""
+        if self._cache is not None:
+            return self._cache.index()
+        start = time.monotonic()
+        items = self.list()
+        self._get_planner().record_list(time.monotonic() - start, len(items))
+        return build_index(items, self._get_cache_indexes())
+
+    def get_by_names(self, names: Iterable[str]) -> Dict[str, Optional[M]]:
+        """Resources by name with a single list call, the api has no lookup by name. Names not found map to None"""
+        index = self._get_index()["name"]
+        return {n: index.get(str(n)) for n in names}
+
+    def watch(self, backoff: Optional[Backoff] = None, include_existing: bool = True) -> Iterator[ChangeEvent]:
+        """
+        Polls `list()` and yields a ChangeEvent for every resource created, updated or deleted since the previous
+        poll, polling fast after changes and slower while nothing changes (see `Watcher`).
+        With `include_existing` the resources of the first poll are yielded as created.
+        """
+        # the first index is the id of the resource
+        key = next(iter(self._get_cache_indexes().values()))
+        version = attrgetter(self._watch_version) if self._watch_version is not None else None
+        yield from Watcher(self.list, key, version=version, backoff=backoff, include_existing=include_existing)
+
+    def disable_cache(self):
+        self._cache = None
+
+    def _invalidate_cache(self):
+        if self._cache is not None:
+            self._cache.invalidate()
+
+
+class IdLookupMixin(ListCacheMixin):
+    """
+    List cache of a sub client that can also get a single resource by id, adding bulk lookups by id that pick
+    between one list call and concurrent get calls. `_cache_indexes` needs an "id" index.
+    """
+
+    @abc.abstractmethod
+    def get_by_id(self, resource_id: Hashable) -> Optional[M]:
+        """The resource with the id, None when it does not exist"""
+
+    def _timed_get_by_id(self, resource_id: Hashable) -> Optional[M]:
+        start = time.monotonic()
+        result = self.get_by_id(resource_id)
+        self._get_planner().record_get(time.monotonic() - start)
+        return result
+
+    def get_by_ids(
+        self, resource_ids: Iterable[Hashable], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> Dict[Hashable, Optional[M]]:
+        """
+        Resources by id with a single list call or concurrent get calls, whichever is expected to be faster from
+        the number of ids, the size of the collection and the latencies seen so far. Ids not found map to None.
+        """
+        resource_ids = list(dict.fromkeys(resource_ids))
+        if self._cache is not None or self._get_planner().use_list(len(resource_ids), max_concurrency):
+            index = self._get_index()["id"]
+            return {i: index.get(str(i)) for i in resource_ids}
+        return {r.item: r.get() for r in imap(self._timed_get_by_id, resource_ids, max_concurrency=max_concurrency)}
@@ -0,0 +1,36 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+Page = Tuple[List[T], Optional[str]]
+
+
+def iter_pages(fetch_page: Callable[[Optional[str]], Page], prefetch: bool = True) -> Iterator[T]:
+    """
+    Yields the items of all pages, `fetch_page` gets the page token (None for the first page) and returns
+    the items of the page and the token of the next page.
+    With `prefetch` the next page is requested in the background while the caller consumes the current one.
+    """
+    if not prefetch:
+        token = None
+        while True:
+            items, token = fetch_page(token)
+            yield from items
+            if not token:
+                return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="databricks-sdk-prefetch")
+    future: Optional[Future] = None
+    try:
+        items, token = fetch_page(None)
+        while True:
+            future = executor.submit(fetch_page, token) if token else None
+            yield from items
+            if future is None:
+                return
+            items, token = future.result()
+    finally:
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,63 @@
+import math
+import threading
+from typing import Optional
+
+# assumed latencies in seconds until calls of the endpoint have been observed
+DEFAULT_GET_LATENCY = 0.2
+# a list call is assumed to take this many times a get call until one has been observed
+LIST_LATENCY_FACTOR = 2.0
+# weight of the newest observation in the moving averages
+SMOOTHING = 0.3
+
+
+def _average(current: Optional[float], observed: float) -> float:
+    return observed if current is None else current + SMOOTHING * (observed - current)
+
+
+class LookupPlanner(object):
+    """
+    Chooses between a single list call and concurrent get calls for a bulk lookup of one sub client.
+    The cost of either is estimated from the moving average latency of the calls made so far and the size of the
+    collection returned by the last list call.
+    """
+
+    def __init__(self):
+        self.get_latency: Optional[float] = None
+        self.list_latency: Optional[float] = None
+        self.collection_size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def record_get(self, seconds: float):
+        with self._lock:
+            self.get_latency = _average(self.get_latency, seconds)
+
+    def record_list(self, seconds: float, size: int):
+        with self._lock:
+            self.list_latency = _average(self.list_latency, seconds)
+            self.collection_size = size
+
+    def estimate_get(self, count: int, max_concurrency: int) -> float:
+        """Expected seconds to fetch `count` resources with get calls, `max_concurrency` at a time"""
+        latency = self.get_latency if self.get_latency is not None else DEFAULT_GET_LATENCY
+        return math.ceil(count / max(1, max_concurrency)) * latency
+
+    def estimate_list(self) -> float:
+        """Expected seconds of a list call"""
+        if self.list_latency is not None:
+            return self.list_latency
+        latency = self.get_latency if self.get_latency is not None else DEFAULT_GET_LATENCY
+        return latency * LIST_LATENCY_FACTOR
+
+    def use_list(self, count: int, max_concurrency: int) -> bool:
+        """Whether a list call is expected to be faster than get calls for `count` resources"""
+        if count == 0:
+            return False
+        if self.collection_size is not None and count >= self.collection_size:
+            return True
+        return self.estimate_list() <= self.estimate_get(count, max_concurrency)
+
+    def __repr__(self):
+        return (
+            f"LookupPlanner(get_latency={self.get_latency}, list_latency={self.list_latency}, "
+            f"collection_size={self.collection_size})"
+        )
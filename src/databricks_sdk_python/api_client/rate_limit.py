@@ -0,0 +1,173 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+from requests import Response
+
+DEFAULT_RATE = 25.0
+DEFAULT_BURST = 50.0
+
+BucketKey = Tuple[Optional[str], Optional[str]]
+
+
+def endpoint_family(path: str) -> str:
+    """
+    Groups a path by the api it belongs to, `api/2.0/policies/clusters/list` gives `policies` and
+    `api/2.0/accounts/<account_id>/workspaces/1` gives `workspaces`
+    """
+    parts = [p for p in path.split("?", 1)[0].split("/") if p]
+    if parts and parts[0] == "api":
+        parts = parts[2:]
+    if parts and parts[0] == "accounts":
+        parts = parts[2:]
+    return parts[0] if parts else ""
+
+
+def parse_retry_after(response: Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket(object):
+    """
+    Token bucket that adapts its rate: every throttled response halves the rate (down to `min_rate`) and every
+    successful response recovers a small step towards the configured rate.
+    With `rate=None` the bucket does not limit, it only honours Retry-After.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        burst: Optional[float] = None,
+        min_rate: float = 1.0,
+        decrease_factor: float = 0.5,
+        recovery_step: float = 0.05,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        # at least one whole token, otherwise a fractional rate or burst never allows a request
+        self.burst = max(1.0, burst if burst is not None else (rate or 0.0))
+        self.min_rate = min(min_rate, rate) if rate is not None else min_rate
+        self.decrease_factor = decrease_factor
+        self.recovery_step = recovery_step
+        self.tokens = self.burst
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        if self.rate is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Blocks until a request may be sent, returns the time waited in seconds"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif self.rate is None:
+                    return waited
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                else:
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def throttled(self, retry_after: Optional[float] = None):
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self.rate is not None:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                self.tokens = min(self.tokens, 0.0)
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+    def succeeded(self):
+        if self.rate is None or self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.recovery_step)
+
+
+class RateLimiter(object):
+    """
+    Client side rate limiting per host and endpoint family.
+    Limits can be configured for a host, for an endpoint family or for the combination, the most specific one wins.
+    """
+
+    def __init__(self, rate: Optional[float] = DEFAULT_RATE, burst: Optional[float] = DEFAULT_BURST):
+        self._limits: Dict[BucketKey, Tuple[Optional[float], Optional[float]]] = {(None, None): (rate, burst)}
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        rate: Optional[float],
+        burst: Optional[float] = None,
+        host: Optional[str] = None,
+        family: Optional[str] = None,
+    ):
+        """Sets the limit for a host and/or endpoint family, existing buckets that match are replaced"""
+        with self._lock:
+            self._limits[(host, family)] = (rate, burst)
+            for key in list(self._buckets):
+                if host in (None, key[0]) and family in (None, key[1]):
+                    del self._buckets[key]
+
+    def _limit(self, host: str, family: str) -> Tuple[Optional[float], Optional[float]]:
+        for key in ((host, family), (host, None), (None, family), (None, None)):
+            if key in self._limits:
+                return self._limits[key]
+        return None, None
+
+    def bucket(self, host: str, path: str) -> TokenBucket:
+        key = (host, endpoint_family(path))
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    rate, burst = self._limit(*key)
+                    bucket = TokenBucket(rate=rate, burst=burst)
+                    self._buckets[key] = bucket
+        return bucket
+
+    def acquire(self, host: str, path: str) -> float:
+        return self.bucket(host, path).acquire()
+
+    def record(self, host: str, path: str, response: Response):
+        """Adapts the bucket to the response, including throttled attempts that were retried by urllib3"""
+        bucket = self.bucket(host, path)
+        retries = getattr(response.raw, "retries", None)
+        history = getattr(retries, "history", None) or ()
+        if response.status_code == 429 or any(h.status == 429 for h in history):
+            bucket.throttled(parse_retry_after(response) if response.status_code == 429 else None)
+        else:
+            bucket.succeeded()
+
+
+# does not limit until configured, it only honours Retry-After of throttled responses
+_default_rate_limiter = RateLimiter(rate=None, burst=None)
+
+
+def get_default_rate_limiter() -> RateLimiter:
+    """The limiter shared by all clients in the process that are not given their own, unlimited until configured"""
+    return _default_rate_limiter
@@ -0,0 +1,129 @@
+import time
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+from databricks_sdk_python.api_client.concurrency import DEFAULT_MAX_CONCURRENCY, imap
+from databricks_sdk_python.api_client.planner import LookupPlanner
+from databricks_sdk_python.resources.base import RefreshableMixin
+
+M = TypeVar("M")
+
+
+class RefreshResult(Generic[M]):
+    """Outcome of `refresh_all`, every model ends up in exactly one of `refreshed`, `missing` or `failed`"""
+
+    __slots__ = ("refreshed", "missing", "failed", "requests")
+
+    def __init__(self):
+        self.refreshed: List[M] = []
+        self.missing: List[M] = []
+        self.failed: List[Tuple[M, BaseException]] = []
+        # list and get calls that were made, a paginated list call counts once
+        self.requests = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def __repr__(self):
+        return (
+            f"RefreshResult(refreshed={len(self.refreshed)}, missing={len(self.missing)}, "
+            f"failed={len(self.failed)}, requests={self.requests})"
+        )
+
+
+class _RefreshTask(object):
+    """
+    Refreshes models with one list call when `list_all` is given, otherwise the single model with a get call.
+    The latency of the call is recorded in `planner` for the next plan.
+    """
+
+    __slots__ = ("models", "list_all", "planner")
+
+    def __init__(
+        self,
+        models: List[Any],
+        list_all: Optional[Callable[[], Iterable[Any]]] = None,
+        planner: Optional[LookupPlanner] = None,
+    ):
+        self.models = models
+        self.list_all = list_all
+        self.planner = planner
+
+    def __call__(self) -> List[Tuple[Any, Optional[Any]]]:
+        start = time.monotonic()
+        if self.list_all is None:
+            result = [(m, m._fetch()) for m in self.models]
+            if self.planner is not None:
+                self.planner.record_get(time.monotonic() - start)
+            return result
+        current = {c.identity(): c for c in self.list_all()}
+        if self.planner is not None:
+            self.planner.record_list(time.monotonic() - start, len(current))
+        return [(m, current.get(m.identity())) for m in self.models]
+
+
+def _planner_of(key: Hashable) -> LookupPlanner:
+    """Planner of the sub client of a list scope, with the default latencies for sub clients without one"""
+    client = key[0] if isinstance(key, tuple) else key
+    get_planner = getattr(client, "_get_planner", None)
+    return get_planner() if get_planner is not None else LookupPlanner()
+
+
+def plan_refresh(
+    models: Iterable[M], max_concurrency: int = DEFAULT_MAX_CONCURRENCY, use_list: bool = True
+) -> List[_RefreshTask]:
+    """
+    Groups the models by the list call that returns them. A group uses that list call when the planner of its sub
+    client expects it to be faster than get calls for each model, `max_concurrency` at a time, the other models get a
+    get call each. Without `use_list` no list calls are used.
+    """
+    groups: Dict[Hashable, Tuple[Callable[[], Iterable[Any]], List[Any]]] = {}
+    singles: List[Any] = []
+    seen = set()
+    for model in models:
+        if id(model) in seen:
+            continue
+        seen.add(id(model))
+        if not isinstance(model, RefreshableMixin):
+            raise TypeError(f"{type(model).__name__} can not be refreshed")
+        scope = model._list_scope() if use_list else None
+        if scope is None:
+            singles.append(model)
+        else:
+            key, list_all = scope
+            groups.setdefault(key, (list_all, []))[1].append(model)
+    tasks = [_RefreshTask([m]) for m in singles]
+    for key, (list_all, group) in groups.items():
+        planner = _planner_of(key)
+        if planner.use_list(len(group), max_concurrency):
+            tasks.append(_RefreshTask(group, list_all, planner))
+        else:
+            tasks.extend(_RefreshTask([m], planner=planner) for m in group)
+    return tasks
+
+
+def refresh_all(
+    models: Iterable[M],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    use_list: bool = True,
+) -> RefreshResult[M]:
+    """
+    Refreshes all models in place like `refresh()` does, with a single list call per kind of resource (and account,
+    workspace or catalog) when that is expected to be faster than concurrent get calls (see `plan_refresh`).
+    Models whose resource does not exist anymore are left as they are and reported as missing instead of raising.
+    """
+    result: RefreshResult[M] = RefreshResult()
+    tasks = plan_refresh(models, max_concurrency=max_concurrency, use_list=use_list)
+    result.requests = len(tasks)
+    for task_result in imap(lambda task: task(), tasks, max_concurrency=max_concurrency):
+        exception = task_result.exception
+        if exception is not None:
+            result.failed.extend((m, exception) for m in task_result.item.models)
+            continue
+        for model, current in task_result.get():
+            if current is None:
+                result.missing.append(model)
+            else:
+                model._sync(current)
+                result.refreshed.append(model)
+    return result
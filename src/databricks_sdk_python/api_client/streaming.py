@@ -0,0 +1,110 @@
+import codecs
+import json
+from typing import Any, Iterator, Optional
+
+from requests import Response
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# characters that can continue a number, raw_decode accepts a prefix of a number split by a chunk boundary
+_NUMBER = ".eE+-0123456789"
+
+
+class _Buffer(object):
+    """Text of a streamed response body that is read on demand"""
+
+    def __init__(self, response: Response, chunk_size: int):
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        self._decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def read_more(self) -> bool:
+        """Appends the next chunk, returns False at the end of the body"""
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.eof = True
+            self.text += self._decoder.decode(b"", final=True)
+            return False
+        # drop what has been consumed so the buffer stays at about one chunk
+        self.text = self.text[self.pos :] + self._decoder.decode(chunk)
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non whitespace character, empty at the end of the body"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.read_more():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.text, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decodes the next json value, reading more of the body until it is complete"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self.read_more():
+                    continue
+                raise
+            # a number is only complete once something else follows it, otherwise it may continue in the next chunk
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and (end == len(self.text) or self.text[end] in _NUMBER)
+                and self.read_more()
+            ):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(response: Response, key: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator:
+    """
+    Yields the elements of the json array in the body while it is downloaded, without building the whole tree.
+    With `key` the array is taken from that field of the top level object, a missing field yields nothing.
+    The response should be requested with `stream=True`.
+    """
+    buffer = _Buffer(response, chunk_size)
+    try:
+        if key is not None:
+            buffer.expect("{")
+            while True:
+                if buffer.peek() == "}":
+                    return
+                name = buffer.value()
+                buffer.expect(":")
+                if name == key:
+                    break
+                buffer.value()
+                if buffer.peek() == ",":
+                    buffer.pos += 1
+        if buffer.peek() == "n":
+            buffer.value()  # null
+            return
+        buffer.expect("[")
+        if buffer.peek() == "]":
+            return
+        while True:
+            yield buffer.value()
+            if buffer.peek() == ",":
+                buffer.pos += 1
+            else:
+                buffer.expect("]")
+                return
+    finally:
+        response.close()
@@ -8,3 +8,7 @@ class UnknownApiResponse(Exception):
             f"Response: {self.response.json()}, Status code: {response.status_code}, Url: {response.request.url}"
         )
         super().__init__(self.message)
+
+
+class PermissionDenied(UnknownApiResponse):
+    """The caller is not allowed to access the resource (403)"""
@@ -0,0 +1,82 @@
+import copy
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from databricks_sdk_python.api_client.backoff import Backoff
+
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+
+class ChangeEvent(NamedTuple):
+    """
+    A change of a resource between two polls, `kind` is one of CREATED, UPDATED or DELETED.
+    `resource` is the current state, for deleted resources the last state seen, `previous` is the state before an update.
+    """
+
+    kind: str
+    key: str
+    resource: Any
+    previous: Optional[Any] = None
+
+
+class Watcher(object):
+    """
+    Polls a collection with `list_all` and yields what changed since the previous poll.
+    Resources are matched by `key` and compared by `version` (like `updated_at`), or as a whole without it.
+    Every poll keeps a deep copy of the resources, so models updated in place by the identity map of a client are
+    still compared with, and reported as `previous` in, the state they had at the previous poll.
+    The interval between polls is the delay of `backoff`, restarting at its shortest delay after every poll with
+    changes and growing while the collection stays the same.
+    """
+
+    def __init__(
+        self,
+        list_all: Callable[[], Iterable[Any]],
+        key: Callable[[Any], Hashable],
+        version: Optional[Callable[[Any], Hashable]] = None,
+        backoff: Optional[Backoff] = None,
+        include_existing: bool = True,
+    ):
+        self.list_all = list_all
+        self.key = key
+        self.version = version
+        self.backoff = backoff or Backoff(initial=5.0, maximum=120.0)
+        self.include_existing = include_existing
+        self._snapshot: Optional[Dict[str, Tuple[Any, Any]]] = None
+
+    def poll(self) -> List[ChangeEvent]:
+        """Lists the collection once and returns the changes since the previous poll"""
+        resources: Dict[str, Any] = {}
+        current: Dict[str, Tuple[Any, Any]] = {}
+        for resource in self.list_all():
+            key = str(self.key(resource))
+            resources[key] = resource
+            state = copy.deepcopy(resource)
+            current[key] = (self.version(state) if self.version is not None else state, state)
+        previous = self._snapshot
+        self._snapshot = current
+        if previous is None:
+            if not self.include_existing:
+                return []
+            previous = {}
+        events = []
+        for key, (version, _) in current.items():
+            known = previous.get(key)
+            if known is None:
+                events.append(ChangeEvent(CREATED, key, resources[key]))
+            elif known[0] != version:
+                events.append(ChangeEvent(UPDATED, key, resources[key], known[1]))
+        for key, (_, state) in previous.items():
+            if key not in current:
+                events.append(ChangeEvent(DELETED, key, state))
+        return events
+
+    def __iter__(self) -> Iterator[ChangeEvent]:
+        quiet_polls = 0
+        while True:
+            events = self.poll()
+            yield from events
+            quiet_polls = 0 if events else quiet_polls + 1
+            time.sleep(self.backoff.delay(quiet_polls))
@@ -0,0 +1,40 @@
+from functools import cached_property
+from typing import Optional
+
+from requests.auth import AuthBase
+
+from databricks_sdk_python.api_client.async_client import DEFAULT_MAX_WORKERS, AsyncBaseClient, AsyncSubClient
+from databricks_sdk_python.api_client.workspace.client import WorkspaceClient, get_workspace_client
+
+
+class AsyncWorkspaceClient(AsyncBaseClient):
+    client: WorkspaceClient
+
+    def __init__(self, client: WorkspaceClient, max_workers: Optional[int] = None):
+        super().__init__(client=client, max_workers=max_workers)
+        self.workspace_host = client.workspace_host
+
+    @cached_property
+    def cluster_policies(self) -> AsyncSubClient:
+        return self._sub_client(self.client.cluster_policies)
+
+    @cached_property
+    def unity_catalog(self) -> AsyncSubClient:
+        return self._sub_client(self.client.unity_catalog)
+
+    @cached_property
+    def permissions(self) -> AsyncSubClient:
+        return self._sub_client(self.client.permissions)
+
+    @cached_property
+    def instance_profiles(self) -> AsyncSubClient:
+        return self._sub_client(self.client.instance_profiles)
+
+
+def get_async_workspace_client(
+    workspace_host: str, auth: Optional[AuthBase] = None, max_workers: Optional[int] = None
+) -> AsyncWorkspaceClient:
+    """The cached blocking client of the host is made with a connection per worker when it does not exist yet"""
+    max_workers = max_workers or DEFAULT_MAX_WORKERS
+    client = get_workspace_client(workspace_host=workspace_host, auth=auth, pool_maxsize=max_workers)
+    return AsyncWorkspaceClient(client, max_workers=max_workers)
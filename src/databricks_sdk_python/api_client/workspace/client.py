@@ -1,32 +1,56 @@
-from typing import Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
 
 from requests.auth import AuthBase
 
 from databricks_sdk_python.api_client.client import BaseClient
+from databricks_sdk_python.api_client.client_cache import ClientCache
+
+if TYPE_CHECKING:
+    from databricks_sdk_python.api_client.workspace.cluster_policies import ClusterPoliciesClient
+    from databricks_sdk_python.api_client.workspace.instance_profiles import InstanceProfilesClient
+    from databricks_sdk_python.api_client.workspace.permissions import PermissionsClient
+    from databricks_sdk_python.api_client.workspace.unity_catalog.client import UnityCatalogClient
 
 
 class WorkspaceClient(BaseClient):
-    def __init__(self, workspace_host: str, auth: Optional[AuthBase] = None):
-        super().__init__(host=workspace_host, auth=auth)
+    def __init__(self, workspace_host: str, auth: Optional[AuthBase] = None, **kwargs):
+        """Extra keyword arguments like `rate_limiter` and `pool_maxsize` are passed to BaseClient"""
+        super().__init__(host=workspace_host, auth=auth, **kwargs)
         self.workspace_host = workspace_host
 
+    # sub clients and their resource models are only imported and created on first use
+
+    @cached_property
+    def cluster_policies(self) -> "ClusterPoliciesClient":
         from databricks_sdk_python.api_client.workspace.cluster_policies import ClusterPoliciesClient
-        from databricks_sdk_python.api_client.workspace.instance_profiles import InstanceProfilesClient
-        from databricks_sdk_python.api_client.workspace.permissions import PermissionsClient
+
+        return ClusterPoliciesClient(self)
+
+    @cached_property
+    def unity_catalog(self) -> "UnityCatalogClient":
         from databricks_sdk_python.api_client.workspace.unity_catalog.client import UnityCatalogClient
 
-        self.cluster_policies = ClusterPoliciesClient(self)
-        self.unity_catalog = UnityCatalogClient(self)
-        self.permissions = PermissionsClient(self)
-        self.instance_profiles = InstanceProfilesClient(self)
+        return UnityCatalogClient(self)
+
+    @cached_property
+    def permissions(self) -> "PermissionsClient":
+        from databricks_sdk_python.api_client.workspace.permissions import PermissionsClient
+
+        return PermissionsClient(self)
+
+    @cached_property
+    def instance_profiles(self) -> "InstanceProfilesClient":
+        from databricks_sdk_python.api_client.workspace.instance_profiles import InstanceProfilesClient
+
+        return InstanceProfilesClient(self)
 
 
-_client_cache = {}
+client_cache: ClientCache[WorkspaceClient] = ClientCache()
 
 
-def get_workspace_client(workspace_host: str, auth: Optional[AuthBase] = None) -> WorkspaceClient:
-    client = _client_cache.get(workspace_host)
-    if client is not None and (auth is None or client.auth == auth):
-        return client
-    _client_cache[workspace_host] = WorkspaceClient(workspace_host=workspace_host, auth=auth)
-    return _client_cache[workspace_host]
+def get_workspace_client(workspace_host: str, auth: Optional[AuthBase] = None, **kwargs) -> WorkspaceClient:
+    """Returns the cached client of the host, `kwargs` like `pool_maxsize` are only used when a new client is made"""
+    return client_cache.get(
+        workspace_host, auth, lambda: WorkspaceClient(workspace_host=workspace_host, auth=auth, **kwargs)
+    )
@@ -1,45 +1,86 @@
-import json
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence
 
+from databricks_sdk_python.api_client.list_cache import IdLookupMixin
+from databricks_sdk_python.api_client.streaming import iter_json_array
 from databricks_sdk_python.api_client.utils import UnknownApiResponse
 from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
-from databricks_sdk_python.resources.workspace.cluster_policies import ClusterPolicy, PolicyElement
+from databricks_sdk_python.resources.workspace.cluster_policies import (
+    ClusterPolicy,
+    PolicyElement,
+    serialize_definition,
+)
 
 
-class ClusterPoliciesClient(object):
+class ClusterPoliciesClient(IdLookupMixin):
+    _cache_indexes = {"id": "policy_id", "name": "name"}
+
     def __init__(self, workspace_client: WorkspaceClient):
         self.workspace_client = workspace_client
 
-    def list(self, sort_order: Optional[str] = None, sort_column: Optional[str] = None) -> List[ClusterPolicy]:
-        """list all instance profiles"""
+    def _parse_policy(self, data: dict, fields: Optional[Sequence[str]] = None) -> ClusterPolicy:
+        policy = ClusterPolicy.parse_json(
+            data, workspace_host=self.workspace_client.host, trusted=self.workspace_client.trusted, fields=fields
+        )
+        return self.workspace_client._share(policy) if fields is None else policy
+
+    def list(
+        self,
+        sort_order: Optional[str] = None,
+        sort_column: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[ClusterPolicy]:
+        """list all cluster policies, with `fields` records of only those fields are returned"""
         body = {
             "sort_order": sort_order,
             "sort_column": sort_column,
         }
         response = self.workspace_client._get("/api/2.0/policies/clusters/list", body=body)
         if response.status_code == 200:
-            return [
-                ClusterPolicy.parse_json(i, workspace_host=self.workspace_client.host)
-                for i in response.json().get("policies", [])
-            ]
+            return [self._parse_policy(i, fields=fields) for i in response.json().get("policies", [])]
         elif response.status_code == 404:
             return []
         else:
             raise UnknownApiResponse(response)
 
+    def iter(
+        self,
+        sort_order: Optional[str] = None,
+        sort_column: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[ClusterPolicy]:
+        """Iterate over all cluster policies, parsing the response while it is downloaded"""
+        body = {
+            "sort_order": sort_order,
+            "sort_column": sort_column,
+        }
+        response = self.workspace_client._get("/api/2.0/policies/clusters/list", body=body, stream=True)
+        try:
+            if response.status_code == 200:
+                for i in iter_json_array(response, "policies"):
+                    yield self._parse_policy(i, fields=fields)
+            elif response.status_code == 404:
+                return
+            else:
+                raise UnknownApiResponse(response)
+        finally:
+            response.close()
+
     def get_by_id(self, policy_id: str) -> Optional[ClusterPolicy]:
+        if self._cache is not None:
+            return self._cache.get("id", policy_id)
         body = {"policy_id": policy_id}
         response = self.workspace_client._get("/api/2.0/policies/clusters/get", body=body)
         if response.status_code == 200:
-            return ClusterPolicy.parse_json(response.json(), workspace_host=self.workspace_client.host)
+            return self._parse_policy(response.json())
         elif response.status_code == 404:
             return None
         else:
             raise UnknownApiResponse(response)
 
     def get_by_name(self, policy_name: str) -> Optional[ClusterPolicy]:
-        policies = self.list()
-        for p in policies:
+        if self._cache is not None:
+            return self._cache.get("name", policy_name)
+        for p in self.iter():
             if p.name == policy_name:
                 return p
         return None
@@ -59,13 +100,12 @@ class ClusterPoliciesClient(object):
         if policy_family_id is not None:
             body["policy_family_id"] = policy_family_id
         if definition is not None:
-            body["definition"] = json.dumps({k: d.dict(skip_defaults=True) for k, d in definition.items()})
+            body["definition"] = serialize_definition(definition)
         if policy_family_definition_overrides is not None:
-            body["policy_family_definition_overrides"] = json.dumps(
-                {k: d.dict(skip_defaults=True) for k, d in policy_family_definition_overrides.items()}
-            )
+            body["policy_family_definition_overrides"] = serialize_definition(policy_family_definition_overrides)
         response = self.workspace_client._post("/api/2.0/policies/clusters/create", body=body)
         if response.status_code == 200:
+            self._invalidate_cache()
             return self.get_by_id(response.json().get("policy_id"))
         else:
             raise UnknownApiResponse(response)
@@ -100,18 +140,19 @@ class ClusterPoliciesClient(object):
         policy_family_id: Optional[str] = None,
         policy_family_definition_overrides: Optional[Dict[str, PolicyElement]] = None,
     ):
-        body = {"policy_id": policy_id, "name": policy_name, "description": description}
+        body = {"policy_id": policy_id, "name": policy_name}
+        if description is not None:
+            body["description"] = description
         if policy_family_id is not None:
             body["policy_family_id"] = policy_family_id
         if definition is not None:
-            body["definition"] = json.dumps({k: d.dict(skip_defaults=True) for k, d in definition.items()})
+            body["definition"] = serialize_definition(definition)
         if policy_family_definition_overrides is not None:
-            body["policy_family_definition_overrides"] = json.dumps(
-                {k: d.dict(skip_defaults=True) for k, d in policy_family_definition_overrides.items()}
-            )
+            body["policy_family_definition_overrides"] = serialize_definition(policy_family_definition_overrides)
         response = self.workspace_client._post("/api/2.0/policies/clusters/edit", body=body)
         if response.status_code != 200:
             raise UnknownApiResponse(response)
+        self._invalidate_cache()
 
     def delete(self, policy_id: str):
         """Deletes a policy"""
@@ -121,3 +162,4 @@ class ClusterPoliciesClient(object):
         response = self.workspace_client._post("/api/2.0/policies/clusters/delete", body=body)
         if response.status_code != 200:
             raise UnknownApiResponse(response)
+        self._invalidate_cache()
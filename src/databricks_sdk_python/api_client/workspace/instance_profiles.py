@@ -1,11 +1,19 @@
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
+from databricks_sdk_python.api_client.list_cache import ListCacheMixin
+from databricks_sdk_python.api_client.streaming import iter_json_array
 from databricks_sdk_python.api_client.utils import UnknownApiResponse
 from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
 from databricks_sdk_python.resources.workspace.instance_profiles import InstanceProfile
 
 
-class InstanceProfilesClient(object):
+def _profile_name(instance_profile: InstanceProfile) -> str:
+    return instance_profile.instance_profile_arn.rsplit("/", 1)[-1]
+
+
+class InstanceProfilesClient(ListCacheMixin):
+    _cache_indexes = {"arn": "instance_profile_arn", "name": _profile_name}
+
     def __init__(self, workspace_client: WorkspaceClient):
         self.workspace_client = workspace_client
 
@@ -14,7 +22,7 @@ class InstanceProfilesClient(object):
         response = self.workspace_client._get("/api/2.0/instance-profiles/list")
         if response.status_code == 200:
             return [
-                InstanceProfile(**i, workspace_host=self.workspace_client.host)
+                self.workspace_client._parse(InstanceProfile, i, workspace_host=self.workspace_client.host)
                 for i in response.json().get("instance_profiles", [])
             ]
         elif response.status_code == 404:
@@ -22,12 +30,38 @@ class InstanceProfilesClient(object):
         else:
             raise UnknownApiResponse(response)
 
+    def iter(self) -> Iterator[InstanceProfile]:
+        """Iterate over all instance profiles, parsing the response while it is downloaded"""
+        response = self.workspace_client._get("/api/2.0/instance-profiles/list", stream=True)
+        try:
+            if response.status_code == 200:
+                for i in iter_json_array(response, "instance_profiles"):
+                    yield self.workspace_client._parse(InstanceProfile, i, workspace_host=self.workspace_client.host)
+            elif response.status_code == 404:
+                return
+            else:
+                raise UnknownApiResponse(response)
+        finally:
+            response.close()
+
+    @staticmethod
+    def _find(index: Dict[str, Dict[str, InstanceProfile]], instance_profile: str) -> Optional[InstanceProfile]:
+        result = index["arn"].get(instance_profile) or index["name"].get(instance_profile)
+        if result is None and "/" in instance_profile:
+            # name including the path of the profile
+            for arn, i in index["arn"].items():
+                if arn.endswith(f"/{instance_profile}"):
+                    return i
+        return result
+
     def get(self, instance_profile: str) -> Optional[InstanceProfile]:
         """Get instance profile by arn or name"""
-        for i in self.list():
-            if i.instance_profile_arn == instance_profile or i.instance_profile_arn.endswith(f"/{instance_profile}"):
-                return i
-        return None
+        return self._find(self._get_index(), instance_profile)
+
+    def get_many(self, instance_profiles: Iterable[str]) -> Dict[str, Optional[InstanceProfile]]:
+        """Get instance profiles by arn or name with a single list call, profiles that are not found map to None"""
+        index = self._get_index()
+        return {i: self._find(index, i) for i in instance_profiles}
 
     def create(
         self,
@@ -45,6 +79,7 @@ class InstanceProfilesClient(object):
         }
         response = self.workspace_client._post("/api/2.0/instance-profiles/add", body=body)
         if response.status_code == 200:
+            self._invalidate_cache()
             return InstanceProfile(
                 instance_profile_arn=instance_profile_arn,
                 iam_role_arn=iam_role_arn,
@@ -68,6 +103,7 @@ class InstanceProfilesClient(object):
         }
         response = self.workspace_client._post("/api/2.0/instance-profiles/edit", body=body)
         if response.status_code == 200:
+            self._invalidate_cache()
             return InstanceProfile(
                 instance_profile_arn=instance_profile_arn,
                 iam_role_arn=iam_role_arn,
@@ -83,3 +119,4 @@ class InstanceProfilesClient(object):
         response = self.workspace_client._post("/api/2.0/instance-profiles/remove", body=body)
         if response.status_code != 200:
             raise UnknownApiResponse(response)
+        self._invalidate_cache()
@@ -1,33 +1,204 @@
-from typing import List, Optional, Union
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-from databricks_sdk_python.api_client.utils import UnknownApiResponse
+from databricks_sdk_python.api_client.concurrency import DEFAULT_MAX_CONCURRENCY, MapResult, ProgressCallback
+from databricks_sdk_python.api_client.utils import PermissionDenied, UnknownApiResponse
 from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
+from databricks_sdk_python.resources.workspace.compact_permissions import (
+    CompactPermissions,
+    Grant,
+    grant_of,
+    requested_grants,
+)
 from databricks_sdk_python.resources.workspace.permissions import (
     GroupObjectPermission,
+    ObjectPermission,
     PermissionLevels,
     Permissions,
     ServicePrincipalObjectPermission,
     UserObjectPermission,
 )
+from databricks_sdk_python.resources.workspace.permissions_index import PermissionsIndex
+
+
+class _PendingChange(object):
+    """Merged `grant` and `replace` calls of one object, entries are kept once per grant in call order"""
+
+    __slots__ = ("replace", "entries", "skip_unchanged")
+
+    def __init__(self):
+        self.replace = False
+        self.entries: Dict[Grant, ObjectPermission] = {}
+        self.skip_unchanged = True
+
+    def add(self, replace: bool, access_control_list: Iterable[ObjectPermission], skip_unchanged: bool):
+        if replace:
+            # a replace drops everything requested before it, grants after it add to it
+            self.replace = True
+            self.entries = {}
+        for entry in access_control_list:
+            self.entries.setdefault(grant_of(entry), entry)
+        self.skip_unchanged = self.skip_unchanged and skip_unchanged
+
+
+class PermissionsBatch(object):
+    """
+    Buffers the `grant` and `replace` calls made through the permissions client by the current thread, merges them
+    per object and sends one request per object concurrently when the `with` block exits.
+    Buffered calls return None, `results` has a MapResult per (object_type, object_id) after the flush. When any of
+    the requests failed the first error is raised after all of them were sent. Nothing is sent when the block raises.
+    """
+
+    def __init__(self, client: "PermissionsClient", max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.results: List[MapResult] = []
+        self._pending: Dict[Tuple[str, str], _PendingChange] = {}
+        self._previous: Optional["PermissionsBatch"] = None
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        replace: bool,
+        object_type: str,
+        object_id: str,
+        access_control_list: Iterable[ObjectPermission],
+        skip_unchanged: bool = False,
+    ):
+        with self._lock:
+            change = self._pending.setdefault((object_type, str(object_id)), _PendingChange())
+            change.add(replace, access_control_list, skip_unchanged)
+
+    def __len__(self) -> int:
+        """Number of objects with buffered changes"""
+        return len(self._pending)
+
+    def flush(self) -> List[MapResult]:
+        """Sends the buffered changes, one request per object"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        def send(key: Tuple[str, str]) -> Permissions:
+            change = pending[key]
+            method = self.client._replace if change.replace else self.client._grant
+            return method(*key, list(change.entries.values()), skip_unchanged=change.skip_unchanged)
+
+        results = list(self.client.workspace_client.imap(send, pending, max_concurrency=self.max_concurrency))
+        self.results.extend(results)
+        return results
+
+    def __enter__(self) -> "PermissionsBatch":
+        self._previous = getattr(self.client._local, "batch", None)
+        self.client._local.batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.client._local.batch = self._previous
+        if exc_type is not None:
+            self._pending = {}
+            return
+        for result in self.flush():
+            result.get()
 
 
 class PermissionsClient(object):
     def __init__(self, workspace_client: WorkspaceClient):
         self.workspace_client = workspace_client
+        # when set, every access control list fetched or changed through this client is added to the index
+        self.index: Optional[PermissionsIndex] = None
+        self._local = threading.local()
+
+    def batch(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> PermissionsBatch:
+        """Context in which `grant` and `replace` calls are merged per object and sent together on exit"""
+        return PermissionsBatch(self, max_concurrency=max_concurrency)
+
+    def _indexed(self, permissions: Union[Permissions, CompactPermissions]):
+        if self.index is not None:
+            self.index.add(permissions)
+        return permissions
+
+    def _cached(self, object_type: str, object_id: str) -> Optional[CompactPermissions]:
+        if self.index is None:
+            return None
+        return self.index.get(f"/{object_type}/{object_id}")
+
+    def _current(self, object_type: str, object_id: str) -> Optional[CompactPermissions]:
+        """The ACL of the object in `index`, fetched once when there is no index or the object is not in it"""
+        cached = self._cached(object_type, object_id)
+        if cached is None:
+            cached = self.get_compact(object_type, object_id)
+        return cached
 
     def get(self, object_type: str, object_id: str) -> Optional[Permissions]:
         response = self.workspace_client._get(f"/api/2.0/permissions/{object_type}/{object_id}")
         if response.status_code == 200:
-            return Permissions(**response.json(), workspace_host=self.workspace_client.host)
+            return self._indexed(
+                self.workspace_client._parse(Permissions, response.json(), workspace_host=self.workspace_client.host)
+            )
         elif response.status_code == 404:
             return None
+        elif response.status_code == 403:
+            raise PermissionDenied(response)
         else:
             raise UnknownApiResponse(response)
 
+    def get_many(
+        self,
+        objects: Iterable[Tuple[str, str]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[MapResult]:
+        """
+        Fetches the permissions of many (object_type, object_id) pairs concurrently, yielding a MapResult per pair as
+        soon as it completes. The result is None when the object does not exist, objects the caller may not access
+        have a PermissionDenied exception. All requests go through the rate limiter of the client.
+        """
+        return self.workspace_client.imap(
+            lambda o: self.get(o[0], str(o[1])),
+            objects,
+            max_concurrency=max_concurrency,
+            progress=progress,
+            ordered=False,
+        )
+
+    def get_compact(self, object_type: str, object_id: str) -> Optional[CompactPermissions]:
+        """Same as `get` but returns the memory efficient `CompactPermissions`"""
+        response = self.workspace_client._get(f"/api/2.0/permissions/{object_type}/{object_id}")
+        if response.status_code == 200:
+            return self._indexed(
+                CompactPermissions.from_response(response.json(), workspace_host=self.workspace_client.host)
+            )
+        elif response.status_code == 404:
+            return None
+        elif response.status_code == 403:
+            raise PermissionDenied(response)
+        else:
+            raise UnknownApiResponse(response)
+
+    def iter_compact(
+        self,
+        object_type: str,
+        object_ids: Iterable[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[MapResult]:
+        """
+        Fetches the permissions of many objects of the same type concurrently as `CompactPermissions`.
+        Yields a MapResult per object id in input order, the result is None when the object does not exist.
+        """
+        return self.workspace_client.imap(
+            lambda object_id: self.get_compact(object_type, object_id),
+            object_ids,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+
     def get_permission_levels(self, object_type: str, object_id: str) -> PermissionLevels:
         response = self.workspace_client._get(f"/api/2.0/permissions/{object_type}/{object_id}/permissionLevels")
         if response.status_code == 200:
-            return PermissionLevels(**response.json(), workspace_host=self.workspace_client.host)
+            return self.workspace_client._parse(
+                PermissionLevels, response.json(), workspace_host=self.workspace_client.host
+            )
         else:
             raise UnknownApiResponse(response)
 
@@ -36,11 +207,37 @@ class PermissionsClient(object):
         object_type: str,
         object_id: str,
         access_control_list: List[Union[UserObjectPermission, GroupObjectPermission, ServicePrincipalObjectPermission]],
-    ):
+        skip_unchanged: bool = False,
+    ) -> Optional[Permissions]:
+        """
+        Adds the entries to the access control list of the object.
+        With `skip_unchanged` no change is sent when the current ACL of the object already has all of them, it is taken
+        from `index` or else fetched first.
+        Inside a `batch` the call is buffered and None is returned.
+        """
+        batch = getattr(self._local, "batch", None)
+        if batch is not None:
+            batch.add(False, object_type, object_id, access_control_list, skip_unchanged=skip_unchanged)
+            return None
+        return self._grant(object_type, object_id, access_control_list, skip_unchanged=skip_unchanged)
+
+    def _grant(
+        self,
+        object_type: str,
+        object_id: str,
+        access_control_list: Sequence[ObjectPermission],
+        skip_unchanged: bool = False,
+    ) -> Permissions:
+        if skip_unchanged:
+            current = self._current(object_type, object_id)
+            if current is not None and requested_grants(access_control_list) <= current.direct_grants():
+                return current.to_permissions()
         body = {"access_control_list": [x.dict() for x in access_control_list]}
         response = self.workspace_client._patch(f"/api/2.0/permissions/{object_type}/{object_id}", body=body)
         if response.status_code == 200:
-            return Permissions(**response.json(), workspace_host=self.workspace_client.host)
+            return self._indexed(
+                self.workspace_client._parse(Permissions, response.json(), workspace_host=self.workspace_client.host)
+            )
         else:
             raise UnknownApiResponse(response)
 
@@ -49,11 +246,37 @@ class PermissionsClient(object):
         object_type: str,
         object_id: str,
         access_control_list: List[Union[UserObjectPermission, GroupObjectPermission, ServicePrincipalObjectPermission]],
-    ):
+        skip_unchanged: bool = False,
+    ) -> Optional[Permissions]:
+        """
+        Replaces the access control list of the object with the entries.
+        With `skip_unchanged` no change is sent when the current ACL of the object already is exactly that, it is taken
+        from `index` or else fetched first.
+        Inside a `batch` the call is buffered and None is returned.
+        """
+        batch = getattr(self._local, "batch", None)
+        if batch is not None:
+            batch.add(True, object_type, object_id, access_control_list, skip_unchanged=skip_unchanged)
+            return None
+        return self._replace(object_type, object_id, access_control_list, skip_unchanged=skip_unchanged)
+
+    def _replace(
+        self,
+        object_type: str,
+        object_id: str,
+        access_control_list: Sequence[ObjectPermission],
+        skip_unchanged: bool = False,
+    ) -> Permissions:
+        if skip_unchanged:
+            current = self._current(object_type, object_id)
+            if current is not None and requested_grants(access_control_list) == current.direct_grants():
+                return current.to_permissions()
         body = {"access_control_list": [x.dict() for x in access_control_list]}
         response = self.workspace_client._put(f"/api/2.0/permissions/{object_type}/{object_id}", body=body)
         if response.status_code == 200:
-            return Permissions(**response.json(), workspace_host=self.workspace_client.host)
+            return self._indexed(
+                self.workspace_client._parse(Permissions, response.json(), workspace_host=self.workspace_client.host)
+            )
         else:
             raise UnknownApiResponse(response)
 
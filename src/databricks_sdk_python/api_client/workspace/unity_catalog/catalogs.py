@@ -1,5 +1,6 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence
 
+from databricks_sdk_python.api_client.pagination import Page, iter_pages
 from databricks_sdk_python.api_client.utils import UnknownApiResponse
 from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
 from databricks_sdk_python.resources.workspace.unity_catalog.catalogs import Catalog
@@ -9,23 +10,70 @@ class UnityCatalogCatalogClient(object):
     def __init__(self, workspace_client: WorkspaceClient):
         self.workspace_client = workspace_client
 
-    def list(self) -> List[Catalog]:
-        """List all catalogs on the databricks account"""
-        response = self.workspace_client._get("/api/2.1/unity-catalog/catalogs")
+    def _get_page(
+        self,
+        max_results: Optional[int],
+        page_token: Optional[str],
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page:
+        params = {}
+        if max_results is not None:
+            params["max_results"] = max_results
+        if page_token is not None:
+            params["page_token"] = page_token
+        response = self.workspace_client._get("/api/2.1/unity-catalog/catalogs", params=params)
         if response.status_code == 200:
-            return [
-                Catalog(**r, workspace_host=self.workspace_client.host) for r in response.json().get("catalogs", [])
+            data = response.json()
+            catalogs = [
+                self.workspace_client._parse(
+                    Catalog, r, lazy=lazy, fields=fields, workspace_host=self.workspace_client.host
+                )
+                for r in data.get("catalogs", [])
             ]
+            return catalogs, data.get("next_page_token")
         elif response.status_code == 404:
-            return []
+            return [], None
         else:
             raise UnknownApiResponse(response)
 
+    def iter_catalogs(
+        self,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Catalog]:
+        """
+        Iterate over all catalogs, following `next_page_token` with pages of at most `max_results`.
+        With `prefetch` the next page is requested while the current one is consumed.
+        With `lazy` fields are only converted when read, with `fields` records of only those fields are returned.
+        """
+        yield from iter_pages(
+            lambda token: self._get_page(max_results, token, lazy=lazy, fields=fields), prefetch=prefetch
+        )
+
+    def iter(
+        self,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Catalog]:
+        """Same as `iter_catalogs`"""
+        yield from self.iter_catalogs(max_results=max_results, prefetch=prefetch, lazy=lazy, fields=fields)
+
+    def list(
+        self, max_results: Optional[int] = None, lazy: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> List[Catalog]:
+        """List all catalogs on the databricks account"""
+        return list(self.iter_catalogs(max_results=max_results, lazy=lazy, fields=fields))
+
     def get_by_name(self, catalog_name: str) -> Optional[Catalog]:
         """Get catalog by id"""
         response = self.workspace_client._get(f"/api/2.1/unity-catalog/catalogs/{catalog_name}")
         if response.status_code == 200:
-            return Catalog(**response.json(), workspace_host=self.workspace_client.host)
+            return self.workspace_client._parse(Catalog, response.json(), workspace_host=self.workspace_client.host)
         elif response.status_code == 404:
             return None
         else:
@@ -51,7 +99,7 @@ class UnityCatalogCatalogClient(object):
         }
         response = self.workspace_client._post("/api/2.1/unity-catalog/catalogs", body=body)
         if response.status_code == 200:
-            return Catalog(**response.json(), workspace_host=self.workspace_client.host)
+            return self.workspace_client._parse(Catalog, response.json(), workspace_host=self.workspace_client.host)
         else:
             raise UnknownApiResponse(response)
 
@@ -70,9 +118,10 @@ class UnityCatalogCatalogClient(object):
             "properties": properties,
             "owner": owner,
         }
+        body = {k: v for k, v in body.items() if v is not None}
         response = self.workspace_client._patch(f"/api/2.1/unity-catalog/catalogs/{name}", body=body)
         if response.status_code == 200:
-            return Catalog(**response.json(), workspace_host=self.workspace_client.host)
+            return self.workspace_client._parse(Catalog, response.json(), workspace_host=self.workspace_client.host)
         else:
             raise UnknownApiResponse(response)
 
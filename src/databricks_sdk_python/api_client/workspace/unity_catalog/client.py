@@ -1,14 +1,32 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
 
+if TYPE_CHECKING:
+    from databricks_sdk_python.api_client.workspace.unity_catalog.catalogs import UnityCatalogCatalogClient
+    from databricks_sdk_python.api_client.workspace.unity_catalog.metastores import UnityCatalogMetastoreClient
+    from databricks_sdk_python.api_client.workspace.unity_catalog.schemas import UnityCatalogSchemaClient
+
 
 class UnityCatalogClient(object):
     def __init__(self, workspace_client: WorkspaceClient):
         self.workspace_client = workspace_client
 
-        from databricks_sdk_python.api_client.workspace.unity_catalog.catalogs import UnityCatalogCatalogClient
+    @cached_property
+    def metastores(self) -> "UnityCatalogMetastoreClient":
         from databricks_sdk_python.api_client.workspace.unity_catalog.metastores import UnityCatalogMetastoreClient
+
+        return UnityCatalogMetastoreClient(self.workspace_client)
+
+    @cached_property
+    def catalogs(self) -> "UnityCatalogCatalogClient":
+        from databricks_sdk_python.api_client.workspace.unity_catalog.catalogs import UnityCatalogCatalogClient
+
+        return UnityCatalogCatalogClient(self.workspace_client)
+
+    @cached_property
+    def schemas(self) -> "UnityCatalogSchemaClient":
         from databricks_sdk_python.api_client.workspace.unity_catalog.schemas import UnityCatalogSchemaClient
 
-        self.metastores = UnityCatalogMetastoreClient(self.workspace_client)
-        self.catalogs = UnityCatalogCatalogClient(self.workspace_client)
-        self.schemas = UnityCatalogSchemaClient(self.workspace_client)
+        return UnityCatalogSchemaClient(self.workspace_client)
@@ -1,12 +1,17 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 from uuid import UUID
 
+from databricks_sdk_python.api_client.list_cache import IdLookupMixin
+from databricks_sdk_python.api_client.streaming import iter_json_array
 from databricks_sdk_python.api_client.utils import UnknownApiResponse
 from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
 from databricks_sdk_python.resources.workspace.unity_catalog.metastores import Metastore, WorkspaceMetastoreAssignment
 
 
-class UnityCatalogMetastoreClient(object):
+class UnityCatalogMetastoreClient(IdLookupMixin):
+    _cache_indexes = {"id": "metastore_id", "name": "name"}
+    _watch_version = "updated_at"
+
     def __init__(self, workspace_client: WorkspaceClient):
         self.workspace_client = workspace_client
 
@@ -16,27 +21,53 @@ class UnityCatalogMetastoreClient(object):
         if response.status_code == 404:
             return None
         elif response.status_code == 200:
-            return WorkspaceMetastoreAssignment(**response.json(), workspace_host=self.workspace_client.workspace_host)
+            return self.workspace_client._parse(
+                WorkspaceMetastoreAssignment, response.json(), workspace_host=self.workspace_client.workspace_host
+            )
         else:
             raise UnknownApiResponse(response)
 
-    def list(self) -> List[Metastore]:
-        """List all metastores on the databricks account"""
+    def list(self, lazy: bool = False, fields: Optional[Sequence[str]] = None) -> List[Metastore]:
+        """
+        List all metastores on the databricks account.
+        With `lazy` fields are only converted when read, with `fields` records of only those fields are returned.
+        """
         response = self.workspace_client._get("/api/2.1/unity-catalog/metastores")
         if response.status_code == 200:
             return [
-                Metastore(**r, workspace_host=self.workspace_client.host) for r in response.json().get("metastores", [])
+                self.workspace_client._parse(
+                    Metastore, r, lazy=lazy, fields=fields, workspace_host=self.workspace_client.host
+                )
+                for r in response.json().get("metastores", [])
             ]
         elif response.status_code == 404:
             return []
         else:
             raise UnknownApiResponse(response)
 
+    def iter(self, lazy: bool = False, fields: Optional[Sequence[str]] = None) -> Iterator[Metastore]:
+        """Iterate over all metastores on the databricks account, parsing the response while it is downloaded"""
+        response = self.workspace_client._get("/api/2.1/unity-catalog/metastores", stream=True)
+        try:
+            if response.status_code == 200:
+                for r in iter_json_array(response, "metastores"):
+                    yield self.workspace_client._parse(
+                        Metastore, r, lazy=lazy, fields=fields, workspace_host=self.workspace_client.host
+                    )
+            elif response.status_code == 404:
+                return
+            else:
+                raise UnknownApiResponse(response)
+        finally:
+            response.close()
+
     def get_by_id(self, metastore_id: UUID) -> Optional[Metastore]:
         """Get metastore by id"""
+        if self._cache is not None:
+            return self._cache.get("id", metastore_id)
         response = self.workspace_client._get(f"/api/2.1/unity-catalog/metastores/{metastore_id}")
         if response.status_code == 200:
-            return Metastore(**response.json(), workspace_host=self.workspace_client.host)
+            return self.workspace_client._parse(Metastore, response.json(), workspace_host=self.workspace_client.host)
         elif response.status_code == 404:
             return None
         else:
@@ -44,7 +75,9 @@ class UnityCatalogMetastoreClient(object):
 
     def get_by_name(self, metastore_name: str) -> Optional[Metastore]:
         """Get metastore by name"""
-        for m in self.list():
+        if self._cache is not None:
+            return self._cache.get("name", metastore_name)
+        for m in self.iter():
             if m.name == metastore_name:
                 return m
         return None
@@ -58,7 +91,8 @@ class UnityCatalogMetastoreClient(object):
         }
         response = self.workspace_client._post("/api/2.1/unity-catalog/metastores", body=body)
         if response.status_code == 200:
-            return Metastore(**response.json(), workspace_host=self.workspace_client.host)
+            self._invalidate_cache()
+            return self.workspace_client._parse(Metastore, response.json(), workspace_host=self.workspace_client.host)
         else:
             raise UnknownApiResponse(response)
 
@@ -77,15 +111,17 @@ class UnityCatalogMetastoreClient(object):
         body = {
             "name": name,
             "delta_sharing_scope": delta_sharing_scope,
-            "storage_root_credential_id": str(storage_root_credential_id),
+            "storage_root_credential_id": str(storage_root_credential_id) if storage_root_credential_id else None,
             "privilege_model_version": privilege_model_version,
             "delta_sharing_recipient_token_lifetime_in_seconds": delta_sharing_recipient_token_lifetime_in_seconds,
             "delta_sharing_organization_name": delta_sharing_organization_name,
             "owner": owner,
         }
+        body = {k: v for k, v in body.items() if v is not None}
         response = self.workspace_client._patch(f"/api/2.1/unity-catalog/metastores/{metastore_id}", body=body)
         if response.status_code == 200:
-            return Metastore(**response.json(), workspace_host=self.workspace_client.host)
+            self._invalidate_cache()
+            return self.workspace_client._parse(Metastore, response.json(), workspace_host=self.workspace_client.host)
         else:
             raise UnknownApiResponse(response)
 
@@ -96,6 +132,7 @@ class UnityCatalogMetastoreClient(object):
         )
         if response.status_code != 200:
             raise UnknownApiResponse(response)
+        self._invalidate_cache()
 
     def create_assignment(
         self,
@@ -1,5 +1,6 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence
 
+from databricks_sdk_python.api_client.pagination import Page, iter_pages
 from databricks_sdk_python.api_client.utils import UnknownApiResponse
 from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
 from databricks_sdk_python.resources.workspace.unity_catalog.schemas import Schema
@@ -9,21 +10,77 @@ class UnityCatalogSchemaClient(object):
     def __init__(self, workspace_client: WorkspaceClient):
         self.workspace_client = workspace_client
 
-    def list(self, catalog_name: str) -> List[Schema]:
-        """List all schemas on the databricks account"""
-        response = self.workspace_client._get("/api/2.1/unity-catalog/schemas", params={"catalog_name": catalog_name})
+    def _get_page(
+        self,
+        catalog_name: str,
+        max_results: Optional[int],
+        page_token: Optional[str],
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page:
+        params = {"catalog_name": catalog_name}
+        if max_results is not None:
+            params["max_results"] = max_results
+        if page_token is not None:
+            params["page_token"] = page_token
+        response = self.workspace_client._get("/api/2.1/unity-catalog/schemas", params=params)
         if response.status_code == 200:
-            return [Schema(**r, workspace_host=self.workspace_client.host) for r in response.json().get("schemas", [])]
+            data = response.json()
+            schemas = [
+                self.workspace_client._parse(
+                    Schema, r, lazy=lazy, fields=fields, workspace_host=self.workspace_client.host
+                )
+                for r in data.get("schemas", [])
+            ]
+            return schemas, data.get("next_page_token")
         elif response.status_code == 404:
-            return []
+            return [], None
         else:
             raise UnknownApiResponse(response)
 
+    def iter_schemas(
+        self,
+        catalog_name: str,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Schema]:
+        """
+        Iterate over all schemas of a catalog, following `next_page_token` with pages of at most `max_results`.
+        With `prefetch` the next page is requested while the current one is consumed.
+        With `lazy` fields are only converted when read, with `fields` records of only those fields are returned.
+        """
+        yield from iter_pages(
+            lambda token: self._get_page(catalog_name, max_results, token, lazy=lazy, fields=fields), prefetch=prefetch
+        )
+
+    def iter(
+        self,
+        catalog_name: str,
+        max_results: Optional[int] = None,
+        prefetch: bool = True,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Schema]:
+        """Same as `iter_schemas`"""
+        yield from self.iter_schemas(catalog_name, max_results=max_results, prefetch=prefetch, lazy=lazy, fields=fields)
+
+    def list(
+        self,
+        catalog_name: str,
+        max_results: Optional[int] = None,
+        lazy: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Schema]:
+        """List all schemas of a catalog"""
+        return list(self.iter_schemas(catalog_name, max_results=max_results, lazy=lazy, fields=fields))
+
     def get_by_name(self, catalog_name: str, schema_name: str) -> Optional[Schema]:
         """Get schema by id"""
         response = self.workspace_client._get(f"/api/2.1/unity-catalog/schemas/{catalog_name}.{schema_name}")
         if response.status_code == 200:
-            return Schema(**response.json(), workspace_host=self.workspace_client.host)
+            return self.workspace_client._parse(Schema, response.json(), workspace_host=self.workspace_client.host)
         elif response.status_code == 404:
             return None
         else:
@@ -47,7 +104,7 @@ class UnityCatalogSchemaClient(object):
         }
         response = self.workspace_client._post("/api/2.1/unity-catalog/schemas", body=body)
         if response.status_code == 200:
-            return Schema(**response.json(), workspace_host=self.workspace_client.host)
+            return self.workspace_client._parse(Schema, response.json(), workspace_host=self.workspace_client.host)
         else:
             raise UnknownApiResponse(response)
 
@@ -67,11 +124,12 @@ class UnityCatalogSchemaClient(object):
             "properties": properties,
             "owner": owner,
         }
+        body = {k: v for k, v in body.items() if v is not None}
         response = self.workspace_client._patch(
             f"/api/2.1/unity-catalog/schemas/{catalog_name}.{schema_name}", body=body
         )
         if response.status_code == 200:
-            return Schema(**response.json(), workspace_host=self.workspace_client.host)
+            return self.workspace_client._parse(Schema, response.json(), workspace_host=self.workspace_client.host)
         else:
             raise UnknownApiResponse(response)
 
@@ -1,8 +1,9 @@
+from typing import Callable, Hashable, Iterable, Optional, Tuple
 from uuid import UUID
 
 from pydantic import BaseModel
 
-from databricks_sdk_python.resources.base import AwsAccountModel
+from databricks_sdk_python.resources.base import AwsAccountModel, RefreshableMixin
 
 
 class StsRole(BaseModel):
@@ -14,21 +15,29 @@ class AwsCredentials(BaseModel):
     sts_role: StsRole
 
 
-class Credentials(AwsAccountModel):
+class Credentials(AwsAccountModel, RefreshableMixin):
+    _identity_fields = ("credentials_id",)
+
     credentials_id: UUID
     credentials_name: str
     aws_credentials: AwsCredentials
     account_id: UUID
     creation_time: int
 
+    def _fetch(self) -> Optional["Credentials"]:
+        client = self.get_account_client()
+        return client.credentials.get_by_id(self.credentials_id)
+
+    def _list_scope(self) -> Tuple[Hashable, Callable[[], Iterable["Credentials"]]]:
+        client = self.get_account_client()
+        return client.credentials, client.credentials.iter
+
     def refresh(self):
         """Update to current state"""
-        client = self.get_account_client()
-        result = client.credentials.get_by_id(self.credentials_id)
+        result = self._fetch()
         if result is None:
             raise RuntimeError(f"{self.credentials_id} does not exists anymore")
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def delete(self):
         """Deletes credential"""
@@ -1,9 +1,9 @@
-from typing import List, Optional
+from typing import Callable, Hashable, Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from pydantic import BaseModel
 
-from databricks_sdk_python.resources.base import AwsAccountModel
+from databricks_sdk_python.resources.base import AwsAccountModel, RefreshableMixin
 
 
 class NetworkWarning(BaseModel):
@@ -21,7 +21,9 @@ class NetworkVpcEndpoints(BaseModel):
     dataplane_relay: List[str]
 
 
-class Network(AwsAccountModel):
+class Network(AwsAccountModel, RefreshableMixin):
+    _identity_fields = ("network_id",)
+
     network_id: UUID
     network_name: str
     vpc_id: str
@@ -34,14 +36,20 @@ class Network(AwsAccountModel):
     creation_time: int
     vpc_endpoints: Optional[NetworkVpcEndpoints]
 
+    def _fetch(self) -> Optional["Network"]:
+        client = self.get_account_client()
+        return client.networks.get_by_id(self.network_id)
+
+    def _list_scope(self) -> Tuple[Hashable, Callable[[], Iterable["Network"]]]:
+        client = self.get_account_client()
+        return client.networks, client.networks.iter
+
     def refresh(self):
         """Update to current state"""
-        client = self.get_account_client()
-        result = client.networks.get_by_id(self.network_id)
+        result = self._fetch()
         if result is None:
             raise RuntimeError(f"{self.network_id} does not exists anymore")
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def delete(self):
         """Deletes network config"""
@@ -1,29 +1,38 @@
+from typing import Callable, Hashable, Iterable, Optional, Tuple
 from uuid import UUID
 
 from pydantic import BaseModel
 
-from databricks_sdk_python.resources.base import AwsAccountModel
+from databricks_sdk_python.resources.base import AwsAccountModel, RefreshableMixin
 
 
 class RootBucketInfo(BaseModel):
     bucket_name: str
 
 
-class StorageConfiguration(AwsAccountModel):
+class StorageConfiguration(AwsAccountModel, RefreshableMixin):
+    _identity_fields = ("storage_configuration_id",)
+
     storage_configuration_id: UUID
     storage_configuration_name: str
     root_bucket_info: RootBucketInfo
     account_id: UUID
     creation_time: int
 
+    def _fetch(self) -> Optional["StorageConfiguration"]:
+        client = self.get_account_client()
+        return client.storage_configuration.get_by_id(self.storage_configuration_id)
+
+    def _list_scope(self) -> Tuple[Hashable, Callable[[], Iterable["StorageConfiguration"]]]:
+        client = self.get_account_client()
+        return client.storage_configuration, client.storage_configuration.iter
+
     def refresh(self):
         """Update to current state"""
-        client = self.get_account_client()
-        result = client.storage_configuration.get_by_id(self.storage_configuration_id)
+        result = self._fetch()
         if result is None:
             raise RuntimeError(f"{self.storage_configuration_id} does not exists anymore")
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def delete(self):
         """Deletes storage configuration"""
@@ -1,15 +1,18 @@
-from time import sleep
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, Optional, Tuple
 from uuid import UUID
 
-from requests.auth import AuthBase
+from databricks_sdk_python.resources.base import AwsAccountModel, RefreshableMixin
 
-from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
-from databricks_sdk_python.api_client.workspace.client import get_workspace_client as base_get_workspace_client
-from databricks_sdk_python.resources.base import AwsAccountModel
+if TYPE_CHECKING:
+    from requests.auth import AuthBase
 
+    from databricks_sdk_python.api_client.backoff import Backoff
+    from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
+
+
+class Workspace(AwsAccountModel, RefreshableMixin):
+    _identity_fields = ("workspace_id",)
 
-class Workspace(AwsAccountModel):
     workspace_id: int
     workspace_name: str
     deployment_name: str
@@ -29,23 +32,38 @@ class Workspace(AwsAccountModel):
     def get_workspace_host(self):
         return f"{self.deployment_name}.cloud.databricks.com"
 
-    def get_workspace_client(self, auth: Optional[AuthBase] = None) -> WorkspaceClient:
-        return base_get_workspace_client(workspace_host=self.get_workspace_host(), auth=auth)
+    def get_workspace_client(self, auth: Optional["AuthBase"] = None) -> "WorkspaceClient":
+        from databricks_sdk_python.api_client.workspace.client import get_workspace_client
+
+        return get_workspace_client(workspace_host=self.get_workspace_host(), auth=auth)
 
-    def wait_on_provisioning(self):
+    def wait_on_provisioning(self, timeout: Optional[float] = None, backoff: Optional["Backoff"] = None):
+        """
+        Refreshes until the workspace is no longer provisioning, polling with jittered exponential backoff.
+        Raises TimeoutError when it is still provisioning after `timeout` seconds.
+        """
+        from databricks_sdk_python.api_client.backoff import Backoff
+
+        polls = (backoff or Backoff()).sleeps(timeout)
         self.refresh()
         while self.workspace_status == "PROVISIONING":
-            sleep(10)
+            next(polls)
             self.refresh()
 
+    def _fetch(self) -> Optional["Workspace"]:
+        client = self.get_account_client()
+        return client.workspaces.get_by_id(self.workspace_id)
+
+    def _list_scope(self) -> Tuple[Hashable, Callable[[], Iterable["Workspace"]]]:
+        client = self.get_account_client()
+        return client.workspaces, client.workspaces.iter
+
     def refresh(self):
         """Update to current state"""
-        client = self.get_account_client()
-        result = client.workspaces.get_by_id(self.workspace_id)
+        result = self._fetch()
         if result is None:
             raise RuntimeError(f"{self.workspace_id} does not exists anymore")
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def update(
         self,
@@ -57,10 +75,8 @@ class Workspace(AwsAccountModel):
         storage_customer_managed_key_id: Optional[UUID] = None,
         private_access_settings_id: Optional[UUID] = None,
     ):
-        """Updates fields that can be updated"""
-        client = self.get_account_client()
-        result = client.workspaces.update(
-            self.workspace_id,
+        """Updates the given fields and fields assigned since the last sync, does nothing when nothing changed"""
+        changes = self._assign(
             aws_region=aws_region,
             credentials_id=credentials_id,
             storage_configuration_id=storage_configuration_id,
@@ -69,8 +85,11 @@ class Workspace(AwsAccountModel):
             storage_customer_managed_key_id=storage_customer_managed_key_id,
             private_access_settings_id=private_access_settings_id,
         )
-        for key, value in result:
-            self.__dict__[key] = value
+        if not changes:
+            return
+        client = self.get_account_client()
+        result = client.workspaces.update(self.workspace_id, **changes)
+        self._sync(result)
 
     def delete(self):
         """Deletes workspace config"""
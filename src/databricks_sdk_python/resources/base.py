@@ -1,9 +1,94 @@
+import abc
+from typing import Any, Callable, ClassVar, Dict, Hashable, Iterable, Optional, Tuple
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
+_MISSING = object()
 
-class AccountBase(BaseModel):
+
+class TrackedModel(BaseModel):
+    """
+    Remembers the original value of every field that is assigned a different value since the model was loaded or
+    last synced with the api, so `update()` can send only what changed.
+    Changes made in place (like adding a key to a dict field) are not seen, assign the field or use `mark_dirty`.
+    """
+
+    # weakly referenceable for the identity map of the clients
+    __slots__ = ("__weakref__",)
+
+    # fields that identify the resource, empty for models that are not shared by the identity map
+    _identity_fields: ClassVar[Tuple[str, ...]] = ()
+
+    _original_values: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def identity(self) -> Optional[Tuple[Any, ...]]:
+        """Values of the identity fields, None when the model has none"""
+        if not self._identity_fields:
+            return None
+        return tuple(self.original_value(name) for name in self._identity_fields)
+
+    def _sync(self, current: "TrackedModel"):
+        """Takes over the fields of the current state of the resource"""
+        for key, value in current:
+            self.__dict__[key] = value
+        self.__fields_set__.update(current.__fields_set__)
+        self._mark_clean()
+
+    def __setattr__(self, name: str, value: Any):
+        if name in self.__fields__:
+            original = self._original_values.get(name, _MISSING)
+            if original is _MISSING:
+                if getattr(self, name) != value:
+                    self._original_values[name] = getattr(self, name)
+            elif original == value:
+                del self._original_values[name]
+        super().__setattr__(name, value)
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self._original_values)
+
+    @property
+    def dirty_fields(self) -> Dict[str, Any]:
+        """Current values of the fields changed since the last sync"""
+        return {name: getattr(self, name) for name in self._original_values}
+
+    def mark_dirty(self, *names: str):
+        """Marks fields that were changed in place as changed"""
+        for name in names:
+            self._original_values.setdefault(name, getattr(self, name))
+
+    def original_value(self, name: str) -> Any:
+        """Value of the field at the last sync with the api"""
+        return self._original_values.get(name, getattr(self, name))
+
+    def _assign(self, **values: Any) -> Dict[str, Any]:
+        """Assigns the values that are not None, returns which of these fields changed since the last sync"""
+        for name, value in values.items():
+            if value is not None:
+                setattr(self, name, value)
+        return {name: getattr(self, name) for name in values if name in self._original_values}
+
+    def _mark_clean(self):
+        self._original_values.clear()
+
+
+class RefreshableMixin(abc.ABC):
+    """Models of resources that can be fetched again from the api, used by `refresh()` and `refresh_all`"""
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def _fetch(self) -> Optional["TrackedModel"]:
+        """Current state of the resource from the api, None when it does not exist anymore"""
+
+    def _list_scope(self) -> Optional[Tuple[Hashable, Callable[[], Iterable["TrackedModel"]]]]:
+        """Key and list call of the resources that one list call refreshes together with this one, None without"""
+        return None
+
+
+class AccountBase(TrackedModel):
     account_id: UUID
 
 
@@ -14,7 +99,7 @@ class AwsAccountModel(AccountBase):
         return get_aws_account_client(self.account_id)
 
 
-class WorkspaceModel(BaseModel):
+class WorkspaceModel(TrackedModel):
     workspace_host: str
 
     def get_workspace_client(self):
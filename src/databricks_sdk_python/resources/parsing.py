@@ -0,0 +1,291 @@
+from collections import namedtuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    SupportsIndex,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+from uuid import UUID
+
+from pydantic import BaseModel, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+from pydantic.fields import MAPPING_LIKE_SHAPES, SHAPE_SINGLETON, ModelField
+
+M = TypeVar("M", bound=BaseModel)
+
+Converter = Callable[[Any], Any]
+
+# per model: (name, alias, converter or None when the json value can be used as is, field)
+_plans: Dict[Type[BaseModel], List[Tuple[str, str, Optional[Converter], ModelField]]] = {}
+_converters: Dict[ModelField, Optional[Converter]] = {}
+_MISSING: Any = object()
+
+
+def _uuid(value: Any) -> Any:
+    return UUID(value) if isinstance(value, str) else value
+
+
+def _model_converter(model: Type[BaseModel]) -> Converter:
+    def convert(value: Any) -> Any:
+        return construct_model(model, value) if isinstance(value, dict) else value
+
+    return convert
+
+
+def _union_converter(field: ModelField) -> Converter:
+    models = [f.type_ for f in field.sub_fields or []]
+    if not models or not all(isinstance(m, type) and issubclass(m, BaseModel) for m in models):
+        return lambda value: field.validate(value, {}, loc=field.alias)[0]
+    required = [(m, {f.alias for f in m.__fields__.values() if f.required}) for m in models]
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, dict):
+            # first member which has all its required fields present, like pydantic tries the members in order
+            for model, aliases in required:
+                if aliases.issubset(value):
+                    return construct_model(model, value)
+        return field.validate(value, {}, loc=field.alias)[0]
+
+    return convert
+
+
+def _value_converter(field: ModelField) -> Optional[Converter]:
+    type_ = field.type_
+    if getattr(type_, "__origin__", None) is Union:
+        return _union_converter(field)
+    if isinstance(type_, type):
+        if issubclass(type_, BaseModel):
+            return _model_converter(type_)
+        if issubclass(type_, UUID):
+            return _uuid
+    return None
+
+
+def _field_converter(field: ModelField) -> Optional[Converter]:
+    if field.shape == SHAPE_SINGLETON:
+        return _value_converter(field)
+    inner = _value_converter(field.sub_fields[0]) if field.sub_fields else None
+    if inner is None:
+        return None
+    if field.shape in MAPPING_LIKE_SHAPES:
+        return lambda value: {k: inner(v) for k, v in value.items()}
+    return lambda value: [inner(v) for v in value]
+
+
+def _get_plan(model: Type[BaseModel]) -> List[Tuple[str, str, Optional[Converter], ModelField]]:
+    plan = _plans.get(model)
+    if plan is None:
+        plan = [(name, field.alias, _field_converter(field), field) for name, field in model.__fields__.items()]
+        _plans[model] = plan
+    return plan
+
+
+def construct_model(model: Type[M], data: Dict[str, Any], **values: Any) -> M:
+    """
+    Builds the model without validation, for responses of the api that are trusted to match the model.
+    Nested models, unions of models and UUIDs are still converted, unknown keys are dropped like validation does.
+    """
+    if values:
+        data = {**data, **values}
+    fields = {}
+    fields_set = set()
+    for name, alias, converter, field in _get_plan(model):
+        if alias in data:
+            value = data[alias]
+            fields[name] = value if converter is None or value is None else converter(value)
+            fields_set.add(name)
+        elif not field.required:
+            fields[name] = field.get_default()
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", fields)
+    object.__setattr__(instance, "__fields_set__", fields_set)
+    instance._init_private_attributes()
+    return instance
+
+
+def _convert_field(model: Type[BaseModel], field: ModelField, raw: Dict[str, Any], trusted: bool) -> Any:
+    """Single field of a response, validated unless `trusted`"""
+    if field.alias not in raw:
+        if field.required:
+            raise ValidationError([ErrorWrapper(MissingError(), loc=field.alias)], model)
+        return field.get_default()
+    value = raw[field.alias]
+    if trusted:
+        converter = _converters.get(field, _MISSING)
+        if converter is _MISSING:
+            converter = _converters[field] = _field_converter(field)
+        return value if converter is None or value is None else converter(value)
+    value, error = field.validate(value, {}, loc=field.alias)
+    if error:
+        raise ValidationError([error], model)
+    return value
+
+
+def _restore_model(model: Type[M], fields: Dict[str, Any], fields_set: set) -> M:
+    return model.construct(_fields_set=fields_set, **fields)
+
+
+class LazyModelMixin(object):
+    """
+    Keeps the raw response and converts a field when it is first read, so listings where only a few fields of
+    every resource are used do not pay for converting and storing all of them.
+    Converted fields are stored like on the regular model and their raw value is released, `dict()`, `json()`,
+    comparison and iteration first convert the remaining fields.
+    `__fields_set__` and private attributes are only initialized when first used, they are slots of the model that
+    fall back to `__getattr__` while unset.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any], trusted: bool = False, **values: Any):
+        instance = cls.__new__(cls)
+        # a copy, the raw values are released from it as they are converted
+        object.__setattr__(instance, "__dict__", {})
+        object.__setattr__(instance, "_raw", {**data, **values})
+        object.__setattr__(instance, "_trusted", trusted)
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        field = self.__fields__.get(name)
+        if field is None:
+            if name == "__fields_set__":
+                # the keys stay in the raw response when their values are released
+                fields_set = {n for n, f in self.__fields__.items() if f.alias in self._raw}
+                object.__setattr__(self, name, fields_set)
+                return fields_set
+            private = self.__private_attributes__.get(name)
+            if private is not None:
+                default = private.get_default()
+                object.__setattr__(self, name, default)
+                return default
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        raw = self._raw
+        value = _convert_field(cast(Type[BaseModel], type(self)), field, raw, self._trusted)
+        self.__dict__[name] = value
+        if field.alias in raw:
+            raw[field.alias] = None
+        if len(self.__dict__) == len(self.__fields__):
+            self._materialize()
+        return value
+
+    def _materialize(self):
+        if len(self.__dict__) < len(self.__fields__):
+            # in field order, like the regular model
+            fields = {
+                name: self.__dict__[name] if name in self.__dict__ else getattr(self, name) for name in self.__fields__
+            }
+            object.__setattr__(self, "__dict__", fields)
+        if self._raw is not None:
+            # which fields were set is taken from the raw response before it is dropped
+            self.__fields_set__
+            object.__setattr__(self, "_raw", None)
+
+    def _iter(self, *args, **kwargs):
+        self._materialize()
+        return super()._iter(*args, **kwargs)
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self._materialize()
+        return super().__repr_args__()
+
+    def __reduce_ex__(self, protocol: SupportsIndex):
+        """Pickles as the regular model, the lazy subclasses are created at runtime and can not be looked up"""
+        self._materialize()
+        model = type(self).__bases__[1]
+        return _restore_model, (model, dict(self.__dict__), set(self.__fields_set__))
+
+    def __eq__(self, other: Any) -> bool:
+        self._materialize()
+        return super().__eq__(other)
+
+
+_lazy_models: Dict[Type[BaseModel], Type[BaseModel]] = {}
+
+# models with fewer fields are parsed as usual with `lazy`, converting on access costs more than it saves for them
+LAZY_MIN_FIELDS = 8
+
+
+def lazy_model(model: Type[M]) -> Type[M]:
+    """Subclass of the model with lazily converted fields, so `refresh`, `update` and `delete` behave the same"""
+    lazy = _lazy_models.get(model)
+    if lazy is None:
+        lazy = type(
+            f"Lazy{model.__name__}",
+            (LazyModelMixin, model),
+            {"__module__": model.__module__, "__slots__": ("_raw", "_trusted")},
+        )
+        _lazy_models[model] = lazy
+    return cast(Type[M], lazy)
+
+
+class RecordType(Protocol):
+    """Named tuple class of the records of a model, created at runtime by `record_type`"""
+
+    _fields: Tuple[str, ...]
+
+    def _make(self, iterable: Iterable[Any]) -> Tuple[Any, ...]:
+        ...
+
+
+_record_types: Dict[Tuple[Type[BaseModel], Tuple[str, ...]], RecordType] = {}
+
+
+def record_type(model: Type[BaseModel], fields: Sequence[str]) -> RecordType:
+    """Named tuple with only the given fields of the model"""
+    key = (model, tuple(fields))
+    record = _record_types.get(key)
+    if record is None:
+        unknown = [f for f in fields if f not in model.__fields__]
+        if unknown:
+            raise ValueError(f"{model.__name__} has no fields {', '.join(unknown)}")
+        # the name is only known at runtime, which the namedtuple support of type checkers does not allow
+        make_record_type: Callable[..., Any] = namedtuple
+        record = cast(RecordType, make_record_type(f"{model.__name__}Record", fields))
+        _record_types[key] = record
+    return record
+
+
+def parse_record(model: Type[BaseModel], data: Dict[str, Any], fields: Sequence[str], trusted: bool = False):
+    """Record of only the given fields of a response, the other fields are neither validated nor kept"""
+    record = record_type(model, fields)
+    model_fields = model.__fields__
+    return record._make([_convert_field(model, model_fields[name], data, trusted) for name in record._fields])
+
+
+def parse_model(
+    model: Type[M],
+    data: Dict[str, Any],
+    trusted: bool = False,
+    lazy: bool = False,
+    fields: Optional[Sequence[str]] = None,
+    **values: Any,
+) -> M:
+    """
+    Validated model of a response, constructed without validation when `trusted` or converted on access when `lazy`
+    and the model has at least LAZY_MIN_FIELDS fields.
+    With `fields` a record of just those fields is returned instead of the model.
+    """
+    if fields is not None:
+        return parse_record(model, {**data, **values} if values else data, fields, trusted=trusted)
+    if lazy and len(model.__fields__) >= LAZY_MIN_FIELDS:
+        lazy_type = cast(Type[LazyModelMixin], lazy_model(model))
+        return cast(M, lazy_type.from_response(data, trusted=trusted, **values))
+    if trusted:
+        return construct_model(model, data, **values)
+    return model(**data, **values)
@@ -1,9 +1,12 @@
+import copy
 import json
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
 
 from pydantic import BaseModel
 
-from databricks_sdk_python.resources.base import WorkspaceModel
+from databricks_sdk_python.resources.base import RefreshableMixin, WorkspaceModel
+from databricks_sdk_python.resources.parsing import parse_model
 from databricks_sdk_python.resources.workspace.permissions import (
     GroupObjectPermission,
     Permissions,
@@ -24,7 +27,45 @@ class PolicyElement(BaseModel):
     pattern: Optional[str]
 
 
-class ClusterPolicy(WorkspaceModel):
+DEFINITION_CACHE_SIZE = 1024
+
+
+def _clone(element: PolicyElement) -> PolicyElement:
+    """Copy that does not share lists or dicts (like a dict `value` or `defaultValue`) with the cached element"""
+    clone = element.copy()
+    for key, value in clone.__dict__.items():
+        if isinstance(value, (list, dict)):
+            clone.__dict__[key] = copy.deepcopy(value)
+    return clone
+
+
+@lru_cache(maxsize=DEFINITION_CACHE_SIZE)
+def _parse_definition(definition: str, trusted: bool) -> Optional[Tuple[Tuple[str, PolicyElement], ...]]:
+    elements = json.loads(definition)
+    if elements is None:
+        return None
+    return tuple((k, parse_model(PolicyElement, v, trusted=trusted)) for k, v in elements.items())
+
+
+def parse_definition(definition: str, trusted: bool = False) -> Optional[Dict[str, PolicyElement]]:
+    """
+    Parses a policy definition json string, memoized on the string as many policies share the same definition.
+    The elements are copies, so changing them does not affect other policies.
+    """
+    elements = _parse_definition(definition, trusted)
+    if elements is None:
+        return None
+    return {k: _clone(e) for k, e in elements}
+
+
+def serialize_definition(definition: Dict[str, PolicyElement]) -> str:
+    """Json string of a policy definition as the api expects it"""
+    return json.dumps({k: d.dict(exclude_unset=True) for k, d in definition.items()})
+
+
+class ClusterPolicy(WorkspaceModel, RefreshableMixin):
+    _identity_fields = ("policy_id",)
+
     policy_id: str
     name: str
     description: Optional[str]
@@ -37,15 +78,26 @@ class ClusterPolicy(WorkspaceModel):
     created_at_timestamp: int
 
     @staticmethod
-    def parse_json(json_dict: dict, workspace_host: str) -> "ClusterPolicy":
-        definition = json_dict.get("definition")
-        json_dict["definition"] = {k: PolicyElement(**v) for k, v in json.loads(definition).items()}
+    def parse_json(
+        json_dict: dict, workspace_host: str, trusted: bool = False, fields: Optional[Sequence[str]] = None
+    ) -> "ClusterPolicy":
+        """
+        Parses the api response, `definition` and `policy_family_definition_overrides` are json strings in there.
+        With `fields` a record of only those fields is returned and the definitions are only decoded when requested.
+        """
+        if fields is None or "definition" in fields:
+            definition = json_dict.get("definition")
+            json_dict["definition"] = parse_definition(definition, trusted=trusted)
 
         policy_family_definition_overrides = json_dict.get("policy_family_definition_overrides")
-        if policy_family_definition_overrides is not None:
-            json_dict["policy_family_definition_overrides"] = json.loads(policy_family_definition_overrides)
+        if policy_family_definition_overrides is not None and (
+            fields is None or "policy_family_definition_overrides" in fields
+        ):
+            json_dict["policy_family_definition_overrides"] = parse_definition(
+                policy_family_definition_overrides, trusted=trusted
+            )
 
-        return ClusterPolicy(**json_dict, workspace_host=workspace_host)
+        return parse_model(ClusterPolicy, json_dict, trusted=trusted, fields=fields, workspace_host=workspace_host)
 
     def get_permissions(self) -> Permissions:
         """Get permissions of cluster policy"""
@@ -60,8 +112,13 @@ class ClusterPolicy(WorkspaceModel):
         user_name: Optional[str] = None,
         group_name: Optional[str] = None,
         service_principal_name: Optional[str] = None,
-    ) -> Permissions:
-        """Grant user, group or service_principal to be able to use the policy"""
+        skip_unchanged: bool = False,
+    ) -> Optional[Permissions]:
+        """
+        Grant user, group or service_principal to be able to use the policy, in a single request.
+        With `skip_unchanged` no change is sent when the ACL of the policy already has the grants, it is taken from the
+        `index` of the permissions client or else fetched first. Inside a `permissions.batch()` the grant is buffered and None is returned.
+        """
         acl = []
         if user_name is not None:
             acl.append(UserObjectPermission(user_name=user_name, permission_level="CAN_USE"))
@@ -73,12 +130,21 @@ class ClusterPolicy(WorkspaceModel):
                     service_principal_name=service_principal_name, permission_level="CAN_USE"
                 )
             )
-        return self.get_permissions().grant(acl)
+        client = self.get_workspace_client()
+        return client.permissions.grant("cluster-policies", self.policy_id, acl, skip_unchanged=skip_unchanged)
 
     def replace_permissions(
-        self, user_names: List[str] = None, group_names: List[str] = None, service_principal_names: List[str] = None
-    ) -> Permissions:
-        """Replace users, groups and service_principals to be able to use the policy"""
+        self,
+        user_names: List[str] = None,
+        group_names: List[str] = None,
+        service_principal_names: List[str] = None,
+        skip_unchanged: bool = False,
+    ) -> Optional[Permissions]:
+        """
+        Replace users, groups and service_principals to be able to use the policy, in a single request.
+        With `skip_unchanged` no change is sent when the ACL of the policy already is exactly that, it is taken from the
+        `index` of the permissions client or else fetched first. Inside a `permissions.batch()` the replace is buffered and None is returned.
+        """
         acl = []
         if user_names is not None:
             for user_name in user_names:
@@ -93,16 +159,23 @@ class ClusterPolicy(WorkspaceModel):
                         service_principal_name=service_principal_name, permission_level="CAN_USE"
                     )
                 )
-        return self.get_permissions().replace(acl)
+        client = self.get_workspace_client()
+        return client.permissions.replace("cluster-policies", self.policy_id, acl, skip_unchanged=skip_unchanged)
+
+    def _fetch(self) -> Optional["ClusterPolicy"]:
+        client = self.get_workspace_client()
+        return client.cluster_policies.get_by_id(self.policy_id)
+
+    def _list_scope(self) -> Tuple[Hashable, Callable[[], Iterable["ClusterPolicy"]]]:
+        client = self.get_workspace_client()
+        return client.cluster_policies, client.cluster_policies.iter
 
     def refresh(self):
         """Refresh to current state"""
-        client = self.get_workspace_client()
-        result = client.cluster_policies.get_by_id(self.policy_id)
+        result = self._fetch()
         if result is None:
             raise RuntimeError(f"{self.policy_id} does not exists anymore")
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def update(
         self,
@@ -112,30 +185,33 @@ class ClusterPolicy(WorkspaceModel):
         policy_family_id: Optional[str] = None,
         policy_family_definition_overrides: Optional[Dict[str, PolicyElement]] = None,
     ) -> "ClusterPolicy":
+        """
+        Updates the given fields and fields assigned since the last sync.
+        Does nothing when nothing changed, definitions changed in place have to be marked with `mark_dirty`.
+        The edit endpoint replaces the policy, so any change sends the full current name, description and definition
+        (or definition overrides for policies of a family).
+        """
+        changes = self._assign(
+            name=policy_name,
+            definition=definition,
+            description=description,
+            policy_family_id=policy_family_id,
+            policy_family_definition_overrides=policy_family_definition_overrides,
+        )
+        if not changes:
+            return self
         client = self.get_workspace_client()
-        self.name = policy_name or self.name
-        self.description = description or self.description
-        if self.policy_family_id is None:
-            self.definition = definition or self.definition
-            client.cluster_policies.update(
-                self.policy_id,
-                policy_name=self.name,
-                description=self.description,
-                definition=self.definition,
-            )
-        else:
-            self.policy_family_id = policy_family_id or self.policy_family_id
-            self.policy_family_definition_overrides = (
-                policy_family_definition_overrides or self.policy_family_definition_overrides
-            )
-            client.cluster_policies.update(
-                self.policy_id,
-                policy_name=policy_name or self.name,
-                description=description or self.description,
-                policy_family_id=policy_family_id or self.policy_family_id,
-                policy_family_definition_overrides=policy_family_definition_overrides
-                or self.policy_family_definition_overrides,
-            )
+        client.cluster_policies.update(
+            self.policy_id,
+            policy_name=self.name,
+            description=self.description,
+            definition=self.definition if self.policy_family_id is None else None,
+            policy_family_id=self.policy_family_id,
+            policy_family_definition_overrides=(
+                self.policy_family_definition_overrides if self.policy_family_id is not None else None
+            ),
+        )
+        self._mark_clean()
         return self
 
     def delete(self):
@@ -0,0 +1,168 @@
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from databricks_sdk_python.resources.workspace.permissions import ObjectPermission, Permissions
+
+PRINCIPAL_KEYS = ("user_name", "group_name", "service_principal_name")
+
+# (principal_type, principal, permission_level)
+Grant = Tuple[str, str, str]
+
+
+class CompactAclEntry(NamedTuple):
+    """A single permission of a principal, `principal_type` is the key of the principal in the api"""
+
+    principal_type: str
+    principal: str
+    permission_level: str
+    inherited: bool
+    inherited_from_object: Optional[Tuple[str, ...]]
+
+
+def grant_of(entry: ObjectPermission) -> Grant:
+    """Grant of an entry of a `grant` or `replace` request"""
+    principal_type = next(k for k in PRINCIPAL_KEYS if k in entry.__fields__)
+    return principal_type, getattr(entry, principal_type), entry.permission_level
+
+
+def requested_grants(access_control_list: Iterable[ObjectPermission]) -> Set[Grant]:
+    """Grants of the entries of a `grant` or `replace` request"""
+    return {grant_of(entry) for entry in access_control_list}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def _entry(
+    principal_type: str,
+    principal: str,
+    permission_level: str,
+    inherited: bool,
+    inherited_from_object: Optional[List[str]],
+) -> CompactAclEntry:
+    return CompactAclEntry(
+        principal_type,
+        principal,
+        sys.intern(permission_level),
+        bool(inherited),
+        tuple(_intern(o) for o in inherited_from_object) if inherited_from_object is not None else None,
+    )
+
+
+class CompactPermissions(object):
+    """
+    Memory efficient alternative to `Permissions` for bulk audits.
+    The access control list is flattened to one tuple per principal and permission, principal names and permission
+    levels are interned so the same strings are shared by all objects.
+    Principals without any permission are not kept.
+    """
+
+    __slots__ = ("workspace_host", "object_type", "object_id", "entries")
+
+    def __init__(self, workspace_host: str, object_type: str, object_id: str, entries: Tuple[CompactAclEntry, ...]):
+        self.workspace_host = workspace_host
+        self.object_type = object_type
+        self.object_id = object_id
+        self.entries = entries
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any], workspace_host: str) -> "CompactPermissions":
+        entries = []
+        for access_control in data.get("access_control_list") or []:
+            principal_type = next((k for k in PRINCIPAL_KEYS if k in access_control), None)
+            if principal_type is None:
+                raise ValueError(f"No principal found in {access_control}")
+            principal = sys.intern(access_control[principal_type])
+            for permission in access_control.get("all_permissions") or []:
+                entries.append(
+                    _entry(
+                        principal_type,
+                        principal,
+                        permission["permission_level"],
+                        permission["inherited"],
+                        permission.get("inherited_from_object"),
+                    )
+                )
+        return cls(
+            workspace_host=workspace_host,
+            object_type=_intern(data["object_type"]),
+            object_id=data["object_id"],
+            entries=tuple(entries),
+        )
+
+    @classmethod
+    def from_permissions(cls, permissions: Permissions) -> "CompactPermissions":
+        """Converts the regular `Permissions` model"""
+        entries = []
+        for access_control in permissions.access_control_list:
+            principal_type = next(k for k in PRINCIPAL_KEYS if k in access_control.__fields__)
+            principal = sys.intern(getattr(access_control, principal_type))
+            for permission in access_control.all_permissions:
+                entries.append(
+                    _entry(
+                        principal_type,
+                        principal,
+                        permission.permission_level,
+                        permission.inherited,
+                        permission.inherited_from_object,
+                    )
+                )
+        return cls(
+            workspace_host=permissions.workspace_host,
+            object_type=_intern(permissions.object_type),
+            object_id=permissions.object_id,
+            entries=tuple(entries),
+        )
+
+    def __iter__(self) -> Iterator[CompactAclEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactPermissions):
+            return NotImplemented
+        return (self.workspace_host, self.object_type, self.object_id, self.entries) == (
+            other.workspace_host,
+            other.object_type,
+            other.object_id,
+            other.entries,
+        )
+
+    def __repr__(self):
+        return (
+            f"CompactPermissions(object_type={self.object_type!r}, object_id={self.object_id!r}, entries={len(self)})"
+        )
+
+    def direct_grants(self) -> Set[Grant]:
+        """Grants set on the object itself, the ones `grant` and `replace` change"""
+        return {(e.principal_type, e.principal, e.permission_level) for e in self.entries if not e.inherited}
+
+    def permission_levels(self, principal: str) -> List[str]:
+        """Permission levels the principal has on the object"""
+        return [e.permission_level for e in self.entries if e.principal == principal]
+
+    def to_permissions(self) -> Permissions:
+        """Converts to the regular `Permissions` model"""
+        access_control_list: Dict[Tuple[str, str], List[dict]] = {}
+        for entry in self.entries:
+            access_control_list.setdefault((entry.principal_type, entry.principal), []).append(
+                {
+                    "permission_level": entry.permission_level,
+                    "inherited": entry.inherited,
+                    "inherited_from_object": (
+                        list(entry.inherited_from_object) if entry.inherited_from_object is not None else None
+                    ),
+                }
+            )
+        return Permissions(
+            workspace_host=self.workspace_host,
+            object_type=self.object_type,
+            object_id=self.object_id,
+            access_control_list=[
+                {principal_type: principal, "all_permissions": all_permissions}
+                for (principal_type, principal), all_permissions in access_control_list.items()
+            ],
+        )
@@ -1,21 +1,29 @@
-from typing import Optional
+from typing import Callable, Hashable, Iterable, Optional, Tuple
 
-from databricks_sdk_python.resources.base import WorkspaceModel
+from databricks_sdk_python.resources.base import RefreshableMixin, WorkspaceModel
 
 
-class InstanceProfile(WorkspaceModel):
+class InstanceProfile(WorkspaceModel, RefreshableMixin):
+    _identity_fields = ("instance_profile_arn",)
+
     instance_profile_arn: str
     iam_role_arn: Optional[str]
     is_meta_instance_profile: bool
 
+    def _fetch(self) -> Optional["InstanceProfile"]:
+        client = self.get_workspace_client()
+        return client.instance_profiles.get(self.instance_profile_arn)
+
+    def _list_scope(self) -> Tuple[Hashable, Callable[[], Iterable["InstanceProfile"]]]:
+        client = self.get_workspace_client()
+        return client.instance_profiles, client.instance_profiles.iter
+
     def refresh(self):
         """Refresh to current state"""
-        client = self.get_workspace_client()
-        result = client.instance_profiles.get(self.instance_profile_arn)
+        result = self._fetch()
         if result is None:
             raise RuntimeError(f"{self.instance_profile_arn} does not exists anymore")
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def update(self, iam_role_arn: Optional[str] = None, is_meta_instance_profile: Optional[bool] = None):
         """Update instance profile"""
@@ -25,8 +33,7 @@ class InstanceProfile(WorkspaceModel):
             iam_role_arn=iam_role_arn,
             is_meta_instance_profile=is_meta_instance_profile,
         )
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def delete(self):
         """Deletes instance profile from workspace"""
@@ -65,20 +65,39 @@ class Permissions(WorkspaceModel):
         client = self.get_workspace_client()
         return client.permissions.get_permission_levels(**self._get_url_objets())
 
+    def _direct_grants(self):
+        from databricks_sdk_python.resources.workspace.compact_permissions import CompactPermissions
+
+        return CompactPermissions.from_permissions(self).direct_grants()
+
     def grant(
         self,
         access_control_list: List[Union[UserObjectPermission, GroupObjectPermission, ServicePrincipalObjectPermission]],
+        skip_unchanged: bool = False,
     ) -> "Permissions":
+        """Adds the entries, with `skip_unchanged` no request is made when this ACL already has all of them"""
+        from databricks_sdk_python.resources.workspace.compact_permissions import requested_grants
+
+        if skip_unchanged and requested_grants(access_control_list) <= self._direct_grants():
+            return self
         client = self.get_workspace_client()
         result = client.permissions.grant(**self._get_url_objets(), access_control_list=access_control_list)
-        self.access_control_list = result.access_control_list
+        if result is not None:
+            self.access_control_list = result.access_control_list
         return self
 
     def replace(
         self,
         access_control_list: List[Union[UserObjectPermission, GroupObjectPermission, ServicePrincipalObjectPermission]],
+        skip_unchanged: bool = False,
     ) -> "Permissions":
+        """Replaces the entries, with `skip_unchanged` no request is made when this ACL already is exactly that"""
+        from databricks_sdk_python.resources.workspace.compact_permissions import requested_grants
+
+        if skip_unchanged and requested_grants(access_control_list) == self._direct_grants():
+            return self
         client = self.get_workspace_client()
         result = client.permissions.replace(**self._get_url_objets(), access_control_list=access_control_list)
-        self.access_control_list = result.access_control_list
+        if result is not None:
+            self.access_control_list = result.access_control_list
         return self
@@ -0,0 +1,120 @@
+import threading
+from typing import Any, Dict, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from databricks_sdk_python.resources.workspace.compact_permissions import CompactPermissions
+from databricks_sdk_python.resources.workspace.permissions import Permissions
+
+
+class IndexedPermission(NamedTuple):
+    """A single permission of a principal on an object, `object_id` is the path like `/clusters/<id>`"""
+
+    principal_type: str
+    principal: str
+    object_type: str
+    object_id: str
+    permission_level: str
+    inherited: bool
+    inherited_from_object: Optional[Tuple[str, ...]]
+
+
+class PermissionsIndex(object):
+    """
+    In memory index of the permissions of many objects, with lookups by principal, by object and by permission level
+    that do not scan the access control lists.
+    `add` replaces everything known about an object, so the results of `grant` and `replace` keep the index up to date.
+    """
+
+    def __init__(self, permissions: Iterable[Union[Permissions, CompactPermissions]] = ()):
+        self._permissions: Dict[str, CompactPermissions] = {}
+        self._by_object: Dict[str, Tuple[IndexedPermission, ...]] = {}
+        # keyed by (principal_type, principal) as a group and a service principal may share a name
+        self._by_principal: Dict[Tuple[str, str], Set[IndexedPermission]] = {}
+        self._by_level: Dict[str, Set[IndexedPermission]] = {}
+        self._by_object_type: Dict[str, Set[IndexedPermission]] = {}
+        self._lock = threading.RLock()
+        for p in permissions:
+            self.add(p)
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[IndexedPermission]], key: Hashable, entry: IndexedPermission):
+        entries = index.get(key)
+        if entries is not None:
+            entries.discard(entry)
+            if not entries:
+                del index[key]
+
+    def add(self, permissions: Union[Permissions, CompactPermissions]):
+        """Indexes the permissions of an object, replacing what was indexed for it before"""
+        if isinstance(permissions, Permissions):
+            permissions = CompactPermissions.from_permissions(permissions)
+        entries = tuple(
+            IndexedPermission(
+                e.principal_type,
+                e.principal,
+                permissions.object_type,
+                permissions.object_id,
+                e.permission_level,
+                e.inherited,
+                e.inherited_from_object,
+            )
+            for e in permissions.entries
+        )
+        with self._lock:
+            self.remove(permissions.object_id)
+            self._permissions[permissions.object_id] = permissions
+            self._by_object[permissions.object_id] = entries
+            for entry in entries:
+                self._by_principal.setdefault((entry.principal_type, entry.principal), set()).add(entry)
+                self._by_level.setdefault(entry.permission_level, set()).add(entry)
+                self._by_object_type.setdefault(entry.object_type, set()).add(entry)
+
+    def remove(self, object_id: str):
+        """Drops the permissions of an object, like when it was deleted"""
+        with self._lock:
+            self._permissions.pop(object_id, None)
+            for entry in self._by_object.pop(object_id, ()):
+                self._discard(self._by_principal, (entry.principal_type, entry.principal), entry)
+                self._discard(self._by_level, entry.permission_level, entry)
+                self._discard(self._by_object_type, entry.object_type, entry)
+
+    def get(self, object_id: str) -> Optional[CompactPermissions]:
+        """The indexed access control list of an object"""
+        return self._permissions.get(object_id)
+
+    def for_object(self, object_id: str) -> List[IndexedPermission]:
+        return list(self._by_object.get(object_id, ()))
+
+    def for_principal(
+        self, principal_type: str, principal: str, object_type: Optional[str] = None
+    ) -> List[IndexedPermission]:
+        """
+        What a user, group or service principal can do, optionally on objects of one type only.
+        `principal_type` is `user_name`, `group_name` or `service_principal_name`.
+        """
+        with self._lock:
+            entries = self._by_principal.get((principal_type, principal), set())
+            if object_type is not None:
+                entries = entries & self._by_object_type.get(object_type, set())
+            return list(entries)
+
+    def with_level(self, permission_level: str, object_type: Optional[str] = None) -> List[IndexedPermission]:
+        """Every permission of the level, optionally on objects of one type only"""
+        with self._lock:
+            entries = self._by_level.get(permission_level, set())
+            if object_type is not None:
+                entries = entries & self._by_object_type.get(object_type, set())
+            return list(entries)
+
+    def principals(self, permission_level: str, object_type: Optional[str] = None) -> Set[Tuple[str, str]]:
+        """(principal_type, principal) pairs with the permission level on any object, optionally of one type only"""
+        return {(e.principal_type, e.principal) for e in self.with_level(permission_level, object_type=object_type)}
+
+    def __contains__(self, object_id: str) -> bool:
+        return object_id in self._by_object
+
+    def __len__(self) -> int:
+        """Number of indexed objects"""
+        return len(self._by_object)
+
+    def __repr__(self):
+        return f"PermissionsIndex(objects={len(self)}, principals={len(self._by_principal)})"
@@ -1,11 +1,13 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 from uuid import UUID
 
-from databricks_sdk_python.resources.base import WorkspaceModel
+from databricks_sdk_python.resources.base import RefreshableMixin, WorkspaceModel
 from databricks_sdk_python.resources.workspace.unity_catalog.schemas import Schema
 
 
-class Catalog(WorkspaceModel):
+class Catalog(WorkspaceModel, RefreshableMixin):
+    _identity_fields = ("name",)
+
     name: str
     metastore_id: UUID
     comment: Optional[str]
@@ -23,14 +25,20 @@ class Catalog(WorkspaceModel):
     updated_at: int
     updated_by: str
 
+    def _fetch(self) -> Optional["Catalog"]:
+        client = self.get_workspace_client()
+        return client.unity_catalog.catalogs.get_by_name(self.original_value("name"))
+
+    def _list_scope(self) -> Tuple[Hashable, Callable[[], Iterable["Catalog"]]]:
+        client = self.get_workspace_client()
+        return client.unity_catalog.catalogs, client.unity_catalog.catalogs.iter
+
     def refresh(self):
         """Refresh to current state"""
-        client = self.get_workspace_client()
-        result = client.unity_catalog.catalogs.get_by_name(self.name)
+        result = self._fetch()
         if result is None:
             raise RuntimeError(f"{self.name} does not exists anymore")
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def update(
         self,
@@ -39,17 +47,19 @@ class Catalog(WorkspaceModel):
         properties: Optional[dict] = None,
         owner: Optional[str] = None,
     ):
-        """Updates fields that can be updated"""
+        """Updates the given fields and fields assigned since the last sync, does nothing when nothing changed"""
+        changes = self._assign(name=name, comment=comment, properties=properties, owner=owner)
+        if not changes:
+            return
         client = self.get_workspace_client()
         result = client.unity_catalog.catalogs.update(
-            self.name,
-            new_name=name,
-            comment=comment,
-            properties=properties,
-            owner=owner,
+            self.original_value("name"),
+            new_name=changes.get("name"),
+            comment=changes.get("comment"),
+            properties=changes.get("properties"),
+            owner=changes.get("owner"),
         )
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def list_schemas(self) -> List[Schema]:
         """List schema in current catalog"""
@@ -1,7 +1,7 @@
-from typing import Optional
+from typing import Callable, Hashable, Iterable, Optional, Tuple
 from uuid import UUID
 
-from databricks_sdk_python.resources.base import WorkspaceModel
+from databricks_sdk_python.resources.base import RefreshableMixin, WorkspaceModel
 
 
 class WorkspaceMetastoreAssignment(WorkspaceModel):
@@ -26,7 +26,9 @@ class WorkspaceMetastoreAssignment(WorkspaceModel):
         )
 
 
-class Metastore(WorkspaceModel):
+class Metastore(WorkspaceModel, RefreshableMixin):
+    _identity_fields = ("metastore_id",)
+
     metastore_id: UUID
     global_metastore_id: str
     name: str
@@ -48,14 +50,20 @@ class Metastore(WorkspaceModel):
     updated_at: int
     updated_by: str
 
+    def _fetch(self) -> Optional["Metastore"]:
+        client = self.get_workspace_client()
+        return client.unity_catalog.metastores.get_by_id(self.metastore_id)
+
+    def _list_scope(self) -> Tuple[Hashable, Callable[[], Iterable["Metastore"]]]:
+        client = self.get_workspace_client()
+        return client.unity_catalog.metastores, client.unity_catalog.metastores.iter
+
     def refresh(self):
         """Refresh to current state"""
-        client = self.get_workspace_client()
-        result = client.unity_catalog.metastores.get_by_id(self.metastore_id)
+        result = self._fetch()
         if result is None:
             raise RuntimeError(f"{self.metastore_id} does not exists anymore")
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def update(
         self,
@@ -67,20 +75,22 @@ class Metastore(WorkspaceModel):
         delta_sharing_organization_name: Optional[str] = None,
         owner: Optional[str] = None,
     ):
-        """Updates fields that can be updated"""
-        client = self.get_workspace_client()
-        result = client.unity_catalog.metastores.update(
-            self.metastore_id,
+        """Updates the given fields and fields assigned since the last sync, does nothing when nothing changed"""
+        changes = self._assign(
             name=name,
             delta_sharing_scope=delta_sharing_scope,
             storage_root_credential_id=storage_root_credential_id,
             privilege_model_version=privilege_model_version,
             delta_sharing_recipient_token_lifetime_in_seconds=delta_sharing_recipient_token_lifetime_in_seconds,
-            delta_sharing_organization_name=delta_sharing_organization_name,
             owner=owner,
         )
-        for key, value in result:
-            self.__dict__[key] = value
+        if delta_sharing_organization_name is not None:
+            changes["delta_sharing_organization_name"] = delta_sharing_organization_name
+        if not changes:
+            return
+        client = self.get_workspace_client()
+        result = client.unity_catalog.metastores.update(self.metastore_id, **changes)
+        self._sync(result)
 
     def delete(self, force: bool = False):
         """Deletes workspace config"""
@@ -1,10 +1,12 @@
-from typing import Dict, Optional
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
 from uuid import UUID
 
-from databricks_sdk_python.resources.base import WorkspaceModel
+from databricks_sdk_python.resources.base import RefreshableMixin, WorkspaceModel
 
 
-class Schema(WorkspaceModel):
+class Schema(WorkspaceModel, RefreshableMixin):
+    _identity_fields = ("catalog_name", "name")
+
     name: str
     metastore_id: UUID
     catalog_type: str
@@ -21,14 +23,23 @@ class Schema(WorkspaceModel):
     updated_at: int
     updated_by: str
 
+    def _fetch(self) -> Optional["Schema"]:
+        client = self.get_workspace_client()
+        return client.unity_catalog.schemas.get_by_name(
+            catalog_name=self.catalog_name, schema_name=self.original_value("name")
+        )
+
+    def _list_scope(self) -> Tuple[Hashable, Callable[[], Iterable["Schema"]]]:
+        client = self.get_workspace_client()
+        catalog_name = self.catalog_name
+        return (client.unity_catalog.schemas, catalog_name), lambda: client.unity_catalog.schemas.iter(catalog_name)
+
     def refresh(self):
         """Refresh to current state"""
-        client = self.get_workspace_client()
-        result = client.unity_catalog.schemas.get_by_name(catalog_name=self.catalog_name, schema_name=self.name)
+        result = self._fetch()
         if result is None:
             raise RuntimeError(f"{self.name} does not exists anymore")
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def update(
         self,
@@ -37,18 +48,20 @@ class Schema(WorkspaceModel):
         properties: Optional[dict] = None,
         owner: Optional[str] = None,
     ):
-        """Updates fields that can be updated"""
+        """Updates the given fields and fields assigned since the last sync, does nothing when nothing changed"""
+        changes = self._assign(name=name, comment=comment, properties=properties, owner=owner)
+        if not changes:
+            return
         client = self.get_workspace_client()
         result = client.unity_catalog.schemas.update(
             catalog_name=self.catalog_name,
-            schema_name=self.name,
-            new_name=name,
-            comment=comment,
-            properties=properties,
-            owner=owner,
+            schema_name=self.original_value("name"),
+            new_name=changes.get("name"),
+            comment=changes.get("comment"),
+            properties=changes.get("properties"),
+            owner=changes.get("owner"),
         )
-        for key, value in result:
-            self.__dict__[key] = value
+        self._sync(result)
 
     def delete(self, force: bool = False):
         """Deletes workspace config"""
@@ -0,0 +1,54 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+from pydantic_factories import ModelFactory
+from requests.auth import HTTPBasicAuth
+
+from databricks_sdk_python.api_client.account.aws.async_client import (
+    AsyncAwsAccountClient,
+    get_async_aws_account_client,
+)
+from databricks_sdk_python.api_client.account.aws.client import ACCOUNT_HOST, AwsAccountClient
+from databricks_sdk_python.api_client.workspace.async_client import AsyncWorkspaceClient
+from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
+from databricks_sdk_python.resources.account.aws.workspaces import Workspace
+
+
+class WorkspaceFactory(ModelFactory):
+    __model__ = Workspace
+
+
+def test_list_workspaces(requests_mock, aws_account_client: AwsAccountClient):
+    expected = WorkspaceFactory.build()
+    requests_mock.get(
+        f"https://{ACCOUNT_HOST}/{aws_account_client.workspaces._get_path()}",
+        status_code=200,
+        json=[json.loads(expected.json())],
+    )
+
+    async def run():
+        async with AsyncAwsAccountClient(aws_account_client) as client:
+            assert client.account_id == aws_account_client.account_id
+            return await client.workspaces.list()
+
+    assert asyncio.run(run()) == [expected]
+
+
+def test_get_async_aws_account_client():
+    async def run():
+        async with get_async_aws_account_client(uuid.uuid4(), auth=HTTPBasicAuth("user", "pass"), max_workers=4) as c:
+            adapter = c.client.session.get_adapter(f"https://{ACCOUNT_HOST}")
+            assert adapter._pool_maxsize == 4
+            return c.executor
+
+    executor = asyncio.run(run())
+    assert executor._shutdown
+
+
+def test_batch_not_wrapped(workspace_client: WorkspaceClient):
+    client = AsyncWorkspaceClient(workspace_client)
+    with pytest.raises(AttributeError):
+        client.permissions.batch()
+    assert client.permissions.grant is not None
@@ -1,11 +1,18 @@
+import io
 import json
 import uuid
+from itertools import islice
 
 import pytest
+import requests
 from pydantic_factories import ModelFactory
+from requests import Response
+from requests.auth import HTTPBasicAuth
 
 from databricks_sdk_python.api_client.account.aws.client import ACCOUNT_API_PREFIX, ACCOUNT_HOST, AwsAccountClient
+from databricks_sdk_python.api_client.backoff import Backoff
 from databricks_sdk_python.api_client.utils import UnknownApiResponse
+from databricks_sdk_python.api_client.watch import CREATED, DELETED, UPDATED
 from databricks_sdk_python.resources.account.aws.networks import Network
 
 
@@ -142,3 +149,52 @@ def test_delete_networks_not_found(requests_mock, aws_account_client: AwsAccount
         aws_account_client.networks.delete(i)
     assert e.value.response.status_code == 404
     assert mock_request.called_once
+
+
+def test_watch(requests_mock, aws_account_client: AwsAccountClient):
+    first, second = NetworksFactory.batch(2)
+    requests_mock.get(
+        f"https://{ACCOUNT_HOST}/{aws_account_client.networks._get_path()}",
+        [
+            {"status_code": 200, "json": [json.loads(first.json())]},
+            {"status_code": 200, "json": [json.loads(second.json())]},
+        ],
+    )
+
+    events = islice(aws_account_client.networks.watch(backoff=Backoff(initial=0.001), include_existing=False), 2)
+    assert [(e.kind, e.key, e.resource) for e in events] == [
+        (CREATED, str(second.network_id), second),
+        (DELETED, str(first.network_id), first),
+    ]
+
+
+def test_watch_identity_map(requests_mock):
+    client = AwsAccountClient(account_id=uuid.uuid4(), auth=HTTPBasicAuth("user", "pass"), identity_map=True)
+    network: Network = NetworksFactory.build(account_id=client.account_id, network_name="a")
+    renamed = network.copy(update={"network_name": "b"})
+    requests_mock.get(
+        f"https://{ACCOUNT_HOST}/{client.networks._get_path()}",
+        [
+            {"status_code": 200, "json": [json.loads(network.json())]},
+            {"status_code": 200, "json": [json.loads(renamed.json())]},
+        ],
+    )
+
+    (event,) = islice(client.networks.watch(backoff=Backoff(initial=0.001), include_existing=False), 1)
+    assert event.kind == UPDATED
+    assert event.resource.network_name == "b"
+    assert event.previous.network_name == "a"
+
+
+def test_iter_closes_on_error(monkeypatch, aws_account_client: AwsAccountClient):
+    closed = []
+    response = Response()
+    response.status_code = 500
+    response.raw = io.BytesIO(b'{"error": "internal"}')
+    response.request = requests.Request("GET", f"https://{ACCOUNT_HOST}/").prepare()
+    monkeypatch.setattr(response, "close", lambda: closed.append(True))
+    monkeypatch.setattr(aws_account_client, "_get", lambda *args, **kwargs: response)
+
+    with pytest.raises(UnknownApiResponse):
+        list(aws_account_client.networks.iter())
+    assert closed
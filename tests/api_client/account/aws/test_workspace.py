@@ -1,10 +1,12 @@
 import json
+import time
 import uuid
 
 import pytest
 from pydantic_factories import ModelFactory
 
 from databricks_sdk_python.api_client.account.aws.client import ACCOUNT_API_PREFIX, ACCOUNT_HOST, AwsAccountClient
+from databricks_sdk_python.api_client.backoff import Backoff
 from databricks_sdk_python.api_client.utils import UnknownApiResponse
 from databricks_sdk_python.resources.account.aws.workspaces import Workspace
 
@@ -50,6 +52,24 @@ def test_list_workspaces(requests_mock, aws_account_client: AwsAccountClient):
     assert aws_account_client.workspaces.list() == [expected]
 
 
+def test_list_workspaces_fields(requests_mock, aws_account_client: AwsAccountClient):
+    expected = WorkspaceFactory.build()
+    requests_mock.get(
+        f"https://{ACCOUNT_HOST}/{aws_account_client.workspaces._get_path()}",
+        status_code=200,
+        json=[json.loads(expected.json())],
+    )
+
+    fields = ["workspace_id", "workspace_name", "workspace_status"]
+    (record,) = aws_account_client.workspaces.list(fields=fields)
+    assert record == (expected.workspace_id, expected.workspace_name, expected.workspace_status)
+    assert record.workspace_name == expected.workspace_name
+    assert record._fields == tuple(fields)
+
+    with pytest.raises(ValueError):
+        aws_account_client.workspaces.list(fields=["workspace_id", "unknown"])
+
+
 def test_get_workspaces_by_id(requests_mock, aws_account_client: AwsAccountClient):
     expected: Workspace = WorkspaceFactory.build()
     requests_mock.get(
@@ -188,3 +208,117 @@ def test_delete_workspaces_not_found(requests_mock, aws_account_client: AwsAccou
         aws_account_client.workspaces.delete(i)
     assert e.value.response.status_code == 404
     assert mock_request.called_once
+
+
+def test_cache(requests_mock, aws_account_client: AwsAccountClient):
+    expected: Workspace = WorkspaceFactory.build()
+    list_request = requests_mock.get(
+        f"https://{ACCOUNT_HOST}/{aws_account_client.workspaces._get_path()}",
+        status_code=200,
+        json=[json.loads(expected.json())],
+    )
+    aws_account_client.workspaces.enable_cache(ttl=0.05)
+
+    assert aws_account_client.workspaces.get_by_name(expected.workspace_name) == expected
+    assert aws_account_client.workspaces.get_by_id(str(expected.workspace_id)) == expected
+    assert list_request.call_count == 1
+
+    time.sleep(0.05)
+    assert aws_account_client.workspaces.get_by_id(expected.workspace_id) == expected
+    assert list_request.call_count == 2
+
+
+def test_get_by_ids(requests_mock, aws_account_client: AwsAccountClient):
+    expected = WorkspaceFactory.batch(3)
+    for w in expected[:2]:
+        requests_mock.get(
+            f"https://{ACCOUNT_HOST}/{aws_account_client.workspaces._get_id_path(w.workspace_id)}",
+            status_code=200,
+            text=w.json(),
+        )
+    requests_mock.get(
+        f"https://{ACCOUNT_HOST}/{aws_account_client.workspaces._get_id_path(expected[2].workspace_id)}",
+        status_code=404,
+    )
+    list_request = requests_mock.get(
+        f"https://{ACCOUNT_HOST}/{aws_account_client.workspaces._get_path()}",
+        status_code=200,
+        json=[json.loads(w.json()) for w in expected[:2]],
+    )
+
+    ids = [w.workspace_id for w in expected]
+    assert aws_account_client.workspaces.get_by_ids(ids) == {ids[0]: expected[0], ids[1]: expected[1], ids[2]: None}
+    assert list_request.call_count == 0
+
+    # more ids than there are workspaces
+    aws_account_client.workspaces._get_planner().record_list(0.1, size=2)
+    assert aws_account_client.workspaces.get_by_ids(ids) == {ids[0]: expected[0], ids[1]: expected[1], ids[2]: None}
+    assert list_request.call_count == 1
+
+
+def test_get_by_names(requests_mock, aws_account_client: AwsAccountClient):
+    expected = WorkspaceFactory.batch(2)
+    list_request = requests_mock.get(
+        f"https://{ACCOUNT_HOST}/{aws_account_client.workspaces._get_path()}",
+        status_code=200,
+        json=[json.loads(w.json()) for w in expected],
+    )
+
+    names = [w.workspace_name for w in expected] + ["unknown"]
+    assert aws_account_client.workspaces.get_by_names(names) == {
+        names[0]: expected[0],
+        names[1]: expected[1],
+        "unknown": None,
+    }
+    assert list_request.call_count == 1
+    assert aws_account_client.workspaces._get_planner().collection_size == 2
+
+
+def test_wait_for_workspaces(requests_mock, aws_account_client: AwsAccountClient):
+    first = WorkspaceFactory.build(workspace_status="PROVISIONING")
+    second = WorkspaceFactory.build(workspace_status="PROVISIONING")
+    other = WorkspaceFactory.build(workspace_status="PROVISIONING")
+
+    def response(*workspaces, **statuses):
+        return {
+            "status_code": 200,
+            "json": [
+                {**json.loads(w.json()), "workspace_status": statuses.get(f"w{w.workspace_id}", "PROVISIONING")}
+                for w in workspaces
+            ],
+        }
+
+    list_request = requests_mock.get(
+        f"https://{ACCOUNT_HOST}/{aws_account_client.workspaces._get_path()}",
+        [
+            response(first, second, other),
+            response(first, second, other, **{f"w{second.workspace_id}": "RUNNING"}),
+            response(first, second, other, **{f"w{first.workspace_id}": "FAILED"}),
+        ],
+    )
+
+    backoff = Backoff(initial=0.001)
+    result = list(
+        aws_account_client.workspaces.wait_for_workspaces([first.workspace_id, second.workspace_id], backoff=backoff)
+    )
+    assert [(w.workspace_id, w.workspace_status) for w in result] == [
+        (second.workspace_id, "RUNNING"),
+        (first.workspace_id, "FAILED"),
+    ]
+    assert list_request.call_count == 3
+
+
+def test_wait_for_workspaces_errors(requests_mock, aws_account_client: AwsAccountClient):
+    workspace = WorkspaceFactory.build(workspace_status="PROVISIONING")
+    requests_mock.get(
+        f"https://{ACCOUNT_HOST}/{aws_account_client.workspaces._get_path()}",
+        status_code=200,
+        json=[json.loads(workspace.json())],
+    )
+    backoff = Backoff(initial=0.001)
+
+    with pytest.raises(TimeoutError):
+        list(aws_account_client.workspaces.wait_for_workspaces([workspace.workspace_id], timeout=0.01, backoff=backoff))
+
+    with pytest.raises(RuntimeError):
+        list(aws_account_client.workspaces.wait_for_workspaces([workspace.workspace_id + 1], backoff=backoff))
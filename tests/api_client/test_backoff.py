@@ -0,0 +1,29 @@
+import time
+
+import pytest
+
+from databricks_sdk_python.api_client.backoff import Backoff
+
+
+def test_delay():
+    backoff = Backoff(initial=1.0, maximum=10.0, factor=2.0, jitter=0.5)
+    for attempt, base in enumerate([1.0, 2.0, 4.0, 8.0, 10.0, 10.0]):
+        assert base * 0.5 <= backoff.delay(attempt) <= base
+
+    assert Backoff(initial=1.0, jitter=0.0).delay(1) == 2.0
+
+
+def test_sleeps_timeout():
+    polls = Backoff(initial=0.01, jitter=0.0).sleeps(timeout=0.05)
+    attempts = []
+    with pytest.raises(TimeoutError):
+        for attempt in polls:
+            attempts.append(attempt)
+    assert attempts[:3] == [0, 1, 2]
+
+
+def test_sleeps_deadline_starts_on_call():
+    polls = Backoff(initial=0.01, jitter=0.0).sleeps(timeout=0.05)
+    time.sleep(0.06)
+    with pytest.raises(TimeoutError):
+        next(polls)
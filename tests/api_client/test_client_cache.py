@@ -0,0 +1,56 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.auth import HTTPBasicAuth
+
+from databricks_sdk_python.api_client.client_cache import ClientCache
+from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
+
+
+def factory(host: str, auth: HTTPBasicAuth):
+    return lambda: WorkspaceClient(workspace_host=host, auth=auth)
+
+
+def test_keyed_on_credentials():
+    cache = ClientCache()
+    auth_a = HTTPBasicAuth("a", "pass")
+    auth_b = HTTPBasicAuth("b", "pass")
+    client_a = cache.get("host", auth_a, factory("host", auth_a))
+    client_b = cache.get("host", auth_b, factory("host", auth_b))
+
+    assert client_a is not client_b
+    assert cache.get("host", HTTPBasicAuth("a", "pass"), factory("host", auth_a)) is client_a
+    assert cache.get("host", None, factory("host", auth_a)) is client_a
+    assert len(cache) == 2
+
+
+def test_lru_eviction_closes_session(mocker):
+    cache = ClientCache(max_size=2)
+    auth = HTTPBasicAuth("user", "pass")
+    first = cache.get("first", auth, factory("first", auth))
+    close = mocker.spy(first.session, "close")
+    cache.get("second", auth, factory("second", auth))
+    cache.get("first", None, factory("first", auth))
+    cache.get("third", auth, factory("third", auth))
+    assert close.call_count == 0
+
+    cache.get("fourth", auth, factory("fourth", auth))
+    assert close.call_count == 1
+    assert cache.get("first", auth, factory("first", auth)) is not first
+
+
+def test_ttl():
+    cache = ClientCache(ttl=0.01)
+    auth = HTTPBasicAuth("user", "pass")
+    client = cache.get("host", auth, factory("host", auth))
+    time.sleep(0.02)
+    assert cache.get("host", auth, factory("host", auth)) is not client
+    assert len(cache) == 1
+
+
+def test_concurrent_get():
+    cache = ClientCache()
+    auth = HTTPBasicAuth("user", "pass")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: cache.get("host", auth, factory("host", auth)), range(32)))
+    assert len({id(c) for c in clients}) == 1
@@ -0,0 +1,89 @@
+import threading
+import time
+
+from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
+
+
+def test_map_keeps_order_and_collects_exceptions(workspace_client: WorkspaceClient):
+    def fn(i: int) -> int:
+        time.sleep(0.01 * (5 - i))
+        if i == 2:
+            raise ValueError("boom")
+        return i * 2
+
+    results = workspace_client.map(fn, range(5), max_concurrency=5)
+
+    assert [r.item for r in results] == [0, 1, 2, 3, 4]
+    assert [r.result for r in results if r.ok] == [0, 2, 6, 8]
+    assert isinstance(results[2].exception, ValueError)
+
+
+def test_map_bounded_concurrency(workspace_client: WorkspaceClient):
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def fn(i: int) -> int:
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return i
+
+    progress = []
+    results = workspace_client.map(fn, range(12), max_concurrency=3, progress=lambda d, t: progress.append((d, t)))
+
+    assert [r.get() for r in results] == list(range(12))
+    assert max_active <= 3
+    assert sorted(progress) == [(i, 12) for i in range(1, 13)]
+
+
+def test_imap_unordered(workspace_client: WorkspaceClient):
+    def fn(i: int) -> int:
+        time.sleep(0.02 * (3 - i))
+        return i
+
+    results = list(workspace_client.imap(fn, range(3), max_concurrency=3, ordered=False))
+
+    assert [r.result for r in results] == [2, 1, 0]
+    assert list(workspace_client.imap(fn, [])) == []
+
+
+def test_imap_unordered_completion_order(workspace_client: WorkspaceClient):
+    lock = threading.Lock()
+    finished = []
+
+    def fn(i: int) -> int:
+        # item 0 finishes last, the others in reverse order of submission
+        time.sleep(0.3 if i == 0 else 0.005 * (10 - i))
+        with lock:
+            finished.append(i)
+        return i
+
+    completed = []
+    # a window of 8 for 10 items, items 8 and 9 are only submitted once results are consumed
+    for result in workspace_client.imap(fn, range(10), max_concurrency=4, ordered=False):
+        completed.append(result.get())
+        # let several items finish before the next one is requested
+        time.sleep(0.02)
+
+    assert completed == finished
+    # items submitted after the first window finished before item 0
+    assert completed[-1] == 0
+
+
+def test_imap_bounded_window(workspace_client: WorkspaceClient):
+    started = []
+
+    def fn(i: int) -> int:
+        started.append(i)
+        return i
+
+    results = workspace_client.imap(fn, range(100), max_concurrency=2)
+    assert next(results).result == 0
+    time.sleep(0.05)
+    assert len(started) <= 5
+    assert [r.result for r in results] == list(range(1, 100))
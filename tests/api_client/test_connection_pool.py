@@ -0,0 +1,59 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests.auth import HTTPBasicAuth
+
+from databricks_sdk_python.api_client.connection_pool import MetricsPoolManager, PoolMetrics
+from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_metrics_reuse(http_server: str):
+    metrics = PoolMetrics()
+    manager = MetricsPoolManager(num_pools=1, maxsize=1, metrics=metrics)
+    for _ in range(3):
+        assert manager.request("GET", f"{http_server}/").status == 200
+
+    assert metrics.new_connections == 1
+    assert metrics.reused_connections == 2
+    assert metrics.discarded_connections == 0
+    metrics.reset()
+    assert metrics.as_dict()["reused_connections"] == 0
+
+
+def test_client_pool_options():
+    client = WorkspaceClient(
+        "pool.cloud.databricks.com",
+        auth=HTTPBasicAuth("user", "pass"),
+        pool_maxsize=32,
+        pool_block=True,
+        tcp_keepalive=True,
+    )
+    adapter = client.session.get_adapter(f"https://{client.host}")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert len(adapter.poolmanager.connection_pool_kw["socket_options"]) > 1
+    assert adapter.metrics is client.pool_metrics
@@ -0,0 +1,74 @@
+import gc
+import json
+
+from pydantic_factories import ModelFactory
+from requests.auth import HTTPBasicAuth
+
+from databricks_sdk_python.api_client.identity_map import IdentityMap
+from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
+from databricks_sdk_python.resources.workspace.permissions import Permissions
+from databricks_sdk_python.resources.workspace.unity_catalog.metastores import Metastore
+
+
+class MetastoreFactory(ModelFactory):
+    __model__ = Metastore
+    workspace_host = "test.cloud.databricks.com"
+
+
+def test_merge():
+    identity_map = IdentityMap()
+    first: Metastore = MetastoreFactory.build(owner="first")
+    second: Metastore = MetastoreFactory.build(metastore_id=first.metastore_id, owner="second")
+    other: Metastore = MetastoreFactory.build()
+
+    assert identity_map.merge(first) is first
+    assert identity_map.merge(other) is other
+    assert identity_map.merge(second) is first
+    assert first.owner == "second"
+    assert len(identity_map) == 2
+
+
+def test_merge_discards_local_changes():
+    identity_map = IdentityMap()
+    first: Metastore = identity_map.merge(MetastoreFactory.build(owner="first"))
+    first.owner = "local"
+
+    identity_map.merge(MetastoreFactory.build(metastore_id=first.metastore_id, owner="remote"))
+    assert first.owner == "remote"
+    assert not first.is_dirty
+
+
+def test_weak_references():
+    identity_map = IdentityMap()
+    identity_map.merge(MetastoreFactory.build())
+    gc.collect()
+    assert len(identity_map) == 0
+
+
+def test_models_without_identity():
+    identity_map = IdentityMap()
+    permissions = ModelFactory.create_factory(Permissions).build()
+    assert identity_map.merge(permissions) is permissions
+    assert len(identity_map) == 0
+
+
+def test_client(requests_mock):
+    client = WorkspaceClient("identity.cloud.databricks.com", auth=HTTPBasicAuth("user", "pass"), identity_map=True)
+    expected: Metastore = MetastoreFactory.build(workspace_host=client.host)
+    updated: Metastore = MetastoreFactory.build(workspace_host=client.host, metastore_id=expected.metastore_id)
+    requests_mock.get(
+        f"https://{client.host}/api/2.1/unity-catalog/metastores",
+        status_code=200,
+        json={"metastores": [json.loads(expected.json(exclude={"workspace_host"}))]},
+    )
+    requests_mock.get(
+        f"https://{client.host}/api/2.1/unity-catalog/metastores/{expected.metastore_id}",
+        status_code=200,
+        text=updated.json(exclude={"workspace_host"}),
+    )
+
+    (listed,) = client.unity_catalog.metastores.list()
+    fetched = client.unity_catalog.metastores.get_by_id(expected.metastore_id)
+    assert fetched is listed
+    assert listed == updated
+    assert client.unity_catalog.metastores.list(lazy=True)[0] is not listed
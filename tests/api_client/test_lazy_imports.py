@@ -0,0 +1,32 @@
+import json
+import subprocess
+import sys
+
+SCRIPT = """
+import json
+import sys
+
+from requests.auth import HTTPBasicAuth
+
+from databricks_sdk_python.api_client.workspace.client import get_workspace_client
+
+client = get_workspace_client("lazy.cloud.databricks.com", auth=HTTPBasicAuth("user", "pass"))
+before = sorted(m for m in sys.modules if m.startswith("databricks_sdk_python.resources") or m == "pydantic")
+client.unity_catalog.metastores
+after = sorted(m for m in sys.modules if m.startswith("databricks_sdk_python.resources"))
+print(json.dumps({"before": before, "after": after}))
+"""
+
+
+def test_workspace_client_does_not_import_resources():
+    output = subprocess.run([sys.executable, "-c", SCRIPT], check=True, capture_output=True, text=True).stdout
+    result = json.loads(output)
+
+    assert result["before"] == []
+    assert result["after"] == [
+        "databricks_sdk_python.resources",
+        "databricks_sdk_python.resources.base",
+        "databricks_sdk_python.resources.workspace",
+        "databricks_sdk_python.resources.workspace.unity_catalog",
+        "databricks_sdk_python.resources.workspace.unity_catalog.metastores",
+    ]
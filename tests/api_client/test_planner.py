@@ -0,0 +1,27 @@
+from databricks_sdk_python.api_client.planner import LookupPlanner
+
+
+def test_defaults():
+    planner = LookupPlanner()
+    assert not planner.use_list(0, max_concurrency=8)
+    assert not planner.use_list(8, max_concurrency=8)
+    assert planner.use_list(17, max_concurrency=8)
+
+
+def test_observed_latency():
+    planner = LookupPlanner()
+    planner.record_get(0.1)
+    planner.record_list(1.0, size=1000)
+    assert not planner.use_list(64, max_concurrency=8)
+    assert planner.use_list(100, max_concurrency=8)
+
+    planner.record_list(0.1, size=1000)
+    assert planner.list_latency < 1.0
+    assert planner.use_list(64, max_concurrency=8)
+
+
+def test_collection_size():
+    planner = LookupPlanner()
+    planner.record_list(10.0, size=3)
+    assert not planner.use_list(2, max_concurrency=8)
+    assert planner.use_list(3, max_concurrency=8)
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+from requests.auth import HTTPBasicAuth
+
+from databricks_sdk_python.api_client.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    endpoint_family,
+    get_default_rate_limiter,
+)
+from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("/api/2.0/policies/clusters/list", "policies"),
+        ("api/2.1/unity-catalog/metastores/1", "unity-catalog"),
+        ("api/2.0/accounts/1234/workspaces/1", "workspaces"),
+        ("/api/2.0/permissions/clusters/1?x=1", "permissions"),
+    ],
+)
+def test_endpoint_family(path: str, expected: str):
+    assert endpoint_family(path) == expected
+
+
+def test_bucket_limits_rate():
+    bucket = TokenBucket(rate=100, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.04
+
+
+def test_bucket_fractional_rate():
+    bucket = TokenBucket(rate=0.5)
+    assert bucket.burst == 1
+    assert bucket.acquire() == 0
+
+    bucket = TokenBucket(rate=20, burst=0.5)
+    start = time.monotonic()
+    bucket.acquire()
+    bucket.acquire()
+    assert 0.04 <= time.monotonic() - start < 1
+
+    limiter = RateLimiter()
+    limiter.configure(rate=0.5, host="fractional.cloud.databricks.com")
+    assert limiter.acquire("fractional.cloud.databricks.com", "/api/2.0/policies/clusters/list") == 0
+
+
+def test_bucket_adapts():
+    bucket = TokenBucket(rate=10, burst=10, min_rate=2)
+    bucket.throttled()
+    assert bucket.rate == 5
+    bucket.throttled()
+    bucket.throttled()
+    assert bucket.rate == 2
+    for _ in range(100):
+        bucket.succeeded()
+    assert bucket.rate == 10
+
+
+def test_bucket_retry_after():
+    bucket = TokenBucket(rate=None)
+    bucket.throttled(retry_after=0.05)
+    assert bucket.acquire() >= 0.04
+    assert bucket.acquire() == 0
+
+
+def test_configure_most_specific():
+    limiter = RateLimiter(rate=10)
+    limiter.configure(rate=5, family="permissions")
+    limiter.configure(rate=1, host="a", family="permissions")
+    assert limiter.bucket("a", "api/2.0/permissions/x/y").max_rate == 1
+    assert limiter.bucket("b", "api/2.0/permissions/x/y").max_rate == 5
+    assert limiter.bucket("b", "api/2.0/policies/clusters/list").max_rate == 10
+
+
+def test_default_limiter_does_not_limit():
+    client = WorkspaceClient("default.cloud.databricks.com", auth=HTTPBasicAuth("user", "pass"))
+    assert client.rate_limiter is get_default_rate_limiter()
+    assert client.rate_limiter.bucket(client.host, "/api/2.0/permissions/a/b").rate is None
+
+
+def test_client_records_throttling(requests_mock):
+    limiter = RateLimiter(rate=20, burst=20)
+    client = WorkspaceClient("limited.cloud.databricks.com", auth=HTTPBasicAuth("user", "pass"), rate_limiter=limiter)
+    requests_mock.get(
+        f"https://{client.host}/api/2.0/policies/clusters/list",
+        status_code=429,
+        headers={"Retry-After": "0"},
+        json={},
+    )
+    client._get("/api/2.0/policies/clusters/list")
+
+    bucket = limiter.bucket(client.host, "/api/2.0/policies/clusters/list")
+    assert bucket.rate == 10
+    assert limiter.bucket(client.host, "/api/2.0/permissions/a/b").rate == 20
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+from pydantic_factories import ModelFactory
+
+from databricks_sdk_python.api_client.planner import LookupPlanner
+from databricks_sdk_python.api_client.refresh import plan_refresh, refresh_all
+from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
+from databricks_sdk_python.resources.base import RefreshableMixin, WorkspaceModel
+from databricks_sdk_python.resources.workspace.permissions import Permissions
+from databricks_sdk_python.resources.workspace.unity_catalog.metastores import Metastore
+
+
+class MetastoreFactory(ModelFactory):
+    __model__ = Metastore
+    workspace_host = "test.cloud.databricks.com"
+
+
+def _response(metastore: Metastore) -> dict:
+    return json.loads(metastore.json(exclude={"workspace_host"}))
+
+
+def _planner(
+    workspace_client: WorkspaceClient, monkeypatch, list_latency: float, collection_size: int
+) -> LookupPlanner:
+    """Planner of the metastores client with known latencies, restored after the test"""
+    planner = LookupPlanner()
+    planner.record_get(0.2)
+    planner.record_list(list_latency, collection_size)
+    monkeypatch.setattr(workspace_client.unity_catalog.metastores, "_planner", planner)
+    return planner
+
+
+def test_plan_refresh(workspace_client: WorkspaceClient, monkeypatch):
+    metastores = MetastoreFactory.batch(3)
+    # a list call takes longer than two rounds of get calls and less than three
+    planner = _planner(workspace_client, monkeypatch, list_latency=0.5, collection_size=100)
+
+    (task,) = plan_refresh(metastores + metastores[:1], max_concurrency=1)
+    assert task.models == metastores
+    assert task.list_all is not None
+    assert task.planner is planner
+
+    tasks = plan_refresh(metastores, max_concurrency=2)
+    assert [t.models for t in tasks] == [[m] for m in metastores]
+    assert all(t.list_all is None for t in tasks)
+
+    # the whole collection is always listed
+    _planner(workspace_client, monkeypatch, list_latency=10, collection_size=3)
+    assert len(plan_refresh(metastores, max_concurrency=8)) == 1
+
+    assert len(plan_refresh(metastores, max_concurrency=1, use_list=False)) == 3
+
+
+def test_refresh_all_list(workspace_client: WorkspaceClient, requests_mock, monkeypatch):
+    metastores = MetastoreFactory.batch(4)
+    current = [MetastoreFactory.build(metastore_id=m.metastore_id) for m in metastores[:3]]
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.1/unity-catalog/metastores",
+        status_code=200,
+        json={"metastores": [_response(m) for m in current + MetastoreFactory.batch(2)]},
+    )
+    planner = _planner(workspace_client, monkeypatch, list_latency=0.1, collection_size=100)
+
+    result = refresh_all(metastores)
+    assert result.ok
+    assert result.requests == 1
+    assert result.refreshed == metastores[:3]
+    assert result.missing == metastores[3:]
+    assert metastores[:3] == current
+    assert requests_mock.call_count == 1
+    assert planner.collection_size == 5
+
+
+def test_refresh_all_get(workspace_client: WorkspaceClient, requests_mock, monkeypatch):
+    metastores = MetastoreFactory.batch(2)
+    current = MetastoreFactory.build(metastore_id=metastores[0].metastore_id)
+    path = f"https://{workspace_client.host}/api/2.1/unity-catalog/metastores"
+    requests_mock.get(f"{path}/{current.metastore_id}", status_code=200, json=_response(current))
+    requests_mock.get(f"{path}/{metastores[1].metastore_id}", status_code=500, json={"error": "boom"})
+    _planner(workspace_client, monkeypatch, list_latency=1.0, collection_size=100)
+
+    result = refresh_all(metastores)
+    assert result.requests == 2
+    assert result.refreshed == [metastores[0]]
+    assert metastores[0] == current
+    assert [m for m, _ in result.failed] == [metastores[1]]
+    assert not result.ok
+
+
+def test_plan_refresh_not_refreshable():
+    permissions = ModelFactory.create_factory(Permissions).build()
+    with pytest.raises(TypeError):
+        plan_refresh([permissions])
+
+
+def test_fetch_is_abstract():
+    class Unfetchable(WorkspaceModel, RefreshableMixin):
+        pass
+
+    with pytest.raises(TypeError):
+        Unfetchable(workspace_host="test.cloud.databricks.com")
@@ -0,0 +1,70 @@
+import io
+import json
+
+import pytest
+from requests import Response
+
+from databricks_sdk_python.api_client.streaming import iter_json_array
+
+
+class CountingBytesIO(io.BytesIO):
+    bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def response_of(body: str) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.raw = CountingBytesIO(body.encode())
+    return response
+
+
+ITEMS = [{"id": i, "name": f"näme {i}", "values": [1.5, None, True, {"x": "]}"}]} for i in range(20)] + [12345]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64 * 1024])
+def test_array(chunk_size: int):
+    body = json.dumps(ITEMS, indent=2)
+    assert list(iter_json_array(response_of(body), chunk_size=chunk_size)) == ITEMS
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64 * 1024])
+def test_array_in_object(chunk_size: int):
+    body = json.dumps({"before": {"items": [1, 2]}, "items": ITEMS, "next_page_token": "abc"})
+    assert list(iter_json_array(response_of(body), key="items", chunk_size=chunk_size)) == ITEMS
+
+
+@pytest.mark.parametrize("body", ["[]", "{}", '{"other": [1]}', '{"items": []}', '{"items": null}'])
+def test_empty(body: str):
+    assert list(iter_json_array(response_of(body), key="items" if body.startswith("{") else None)) == []
+
+
+def test_stops_reading_early():
+    body = json.dumps(ITEMS)
+    response = response_of(body)
+    items = iter_json_array(response, chunk_size=16)
+    assert next(items) == ITEMS[0]
+    items.close()
+    assert response.raw.closed
+    assert response.raw.bytes_read < len(body)
+
+
+def test_truncated():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(response_of(json.dumps(ITEMS)[:-10]), chunk_size=8))
+
+
+NUMBERS = [1.5, 2, -0.25, 1e20, 3.5e-7, -12345678901234567890, 0, 1.0]
+
+
+def test_numbers_split_by_chunks():
+    body = json.dumps({"items": NUMBERS}) + " "
+    for chunk_size in range(1, len(body) + 1):
+        assert list(iter_json_array(response_of(body), key="items", chunk_size=chunk_size)) == NUMBERS
+    for body in ["[1.5, 2]", "[1e5,2E-3]", "[-1.5e+2]", "[10]"]:
+        for chunk_size in range(1, len(body) + 1):
+            assert list(iter_json_array(response_of(body), chunk_size=chunk_size)) == json.loads(body)
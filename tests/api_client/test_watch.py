@@ -0,0 +1,47 @@
+from itertools import islice
+from types import SimpleNamespace
+
+from databricks_sdk_python.api_client.backoff import Backoff
+from databricks_sdk_python.api_client.watch import CREATED, DELETED, UPDATED, ChangeEvent, Watcher
+
+
+def _resource(resource_id: int, updated_at: int, name: str = "name"):
+    return SimpleNamespace(id=resource_id, updated_at=updated_at, name=name)
+
+
+def test_poll():
+    first, second = _resource(1, 1), _resource(2, 1)
+    collection = [first, second]
+    watcher = Watcher(lambda: list(collection), key=lambda r: r.id, version=lambda r: r.updated_at)
+
+    assert watcher.poll() == [ChangeEvent(CREATED, "1", first), ChangeEvent(CREATED, "2", second)]
+    assert watcher.poll() == []
+
+    updated, third = _resource(1, 2), _resource(3, 1)
+    collection[:] = [updated, third]
+    assert watcher.poll() == [
+        ChangeEvent(UPDATED, "1", updated, first),
+        ChangeEvent(CREATED, "3", third),
+        ChangeEvent(DELETED, "2", second),
+    ]
+
+    # without a version change the resource is not seen as updated
+    collection[:] = [_resource(1, 2, name="other"), third]
+    assert watcher.poll() == []
+
+
+def test_poll_without_version():
+    collection = [_resource(1, 1)]
+    watcher = Watcher(lambda: list(collection), key=lambda r: r.id, include_existing=False)
+
+    assert watcher.poll() == []
+    changed = _resource(1, 1, name="other")
+    collection[:] = [changed]
+    assert [(e.kind, e.resource) for e in watcher.poll()] == [(UPDATED, changed)]
+
+
+def test_iter():
+    polls = iter([[], [_resource(1, 1)], [_resource(1, 1)], [_resource(1, 2)], []])
+    watcher = Watcher(lambda: next(polls), key=lambda r: r.id, backoff=Backoff(initial=0.001))
+
+    assert [e.kind for e in islice(watcher, 3)] == [CREATED, UPDATED, DELETED]
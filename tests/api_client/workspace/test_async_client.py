@@ -0,0 +1,61 @@
+import asyncio
+import json
+
+from pydantic_factories import ModelFactory
+
+from databricks_sdk_python.api_client.workspace.async_client import AsyncWorkspaceClient
+from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
+from databricks_sdk_python.resources.workspace.unity_catalog.metastores import Metastore
+
+
+class MetastoreFactory(ModelFactory):
+    __model__ = Metastore
+    workspace_host = "test.cloud.databricks.com"
+
+
+def test_list_metastores(workspace_client: WorkspaceClient, requests_mock):
+    expected: Metastore = MetastoreFactory.build()
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.1/unity-catalog/metastores",
+        status_code=200,
+        json={"metastores": [json.loads(expected.json(exclude={"workspace_host"}))]},
+    )
+
+    async def run():
+        async with AsyncWorkspaceClient(workspace_client, max_workers=2) as client:
+            return await client.unity_catalog.metastores.list()
+
+    assert asyncio.run(run()) == [expected]
+
+
+def test_gather(workspace_client: WorkspaceClient, requests_mock):
+    metastores = MetastoreFactory.batch(5)
+    for m in metastores:
+        requests_mock.get(
+            f"https://{workspace_client.host}/api/2.1/unity-catalog/metastores/{m.metastore_id}",
+            status_code=200,
+            text=m.json(exclude={"workspace_host"}),
+        )
+
+    async def run():
+        async with AsyncWorkspaceClient(workspace_client, max_workers=2) as client:
+            return await asyncio.gather(
+                *[client.unity_catalog.metastores.get_by_id(m.metastore_id) for m in metastores]
+            )
+
+    assert asyncio.run(run()) == metastores
+
+
+def test_iter_metastores(workspace_client: WorkspaceClient, requests_mock):
+    expected = MetastoreFactory.batch(3)
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.1/unity-catalog/metastores",
+        status_code=200,
+        json={"metastores": [json.loads(m.json(exclude={"workspace_host"})) for m in expected]},
+    )
+
+    async def run():
+        async with AsyncWorkspaceClient(workspace_client) as client:
+            return [m async for m in client.unity_catalog.metastores.iter()]
+
+    assert asyncio.run(run()) == expected
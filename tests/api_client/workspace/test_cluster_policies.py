@@ -3,7 +3,7 @@ import json
 from pydantic_factories import ModelFactory
 
 from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
-from databricks_sdk_python.resources.workspace.cluster_policies import ClusterPolicy
+from databricks_sdk_python.resources.workspace.cluster_policies import ClusterPolicy, PolicyElement
 
 
 class ClusterPolicyFactory(ModelFactory):
@@ -45,6 +45,37 @@ def test_list(workspace_client: WorkspaceClient, requests_mock):
     assert metastores == [expected]
 
 
+def test_list_trusted(workspace_client: WorkspaceClient, requests_mock, monkeypatch):
+    monkeypatch.setattr(workspace_client, "trusted", True)
+    expected: ClusterPolicy = ClusterPolicyFactory.build()
+    response_json = json.loads(expected.json(exclude={"workspace_host"}))
+    response_json["definition"] = json.dumps(response_json["definition"])
+    response_json["policy_family_definition_overrides"] = json.dumps(
+        response_json["policy_family_definition_overrides"]
+    )
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.0/policies/clusters/list",
+        status_code=200,
+        json={"policies": [response_json]},
+    )
+    policies = workspace_client.cluster_policies.list()
+    assert policies == [expected]
+    assert all(isinstance(e, PolicyElement) for e in policies[0].definition.values())
+
+
+def test_list_fields(workspace_client: WorkspaceClient, requests_mock):
+    expected: ClusterPolicy = ClusterPolicyFactory.build()
+    response_json = json.loads(expected.json(exclude={"workspace_host"}))
+    response_json["definition"] = "not decoded"
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.0/policies/clusters/list",
+        status_code=200,
+        json={"policies": [response_json]},
+    )
+    records = workspace_client.cluster_policies.list(fields=["policy_id", "name", "workspace_host"])
+    assert records == [(expected.policy_id, expected.name, workspace_client.host)]
+
+
 def test_get_by_name(workspace_client: WorkspaceClient, requests_mock):
     expected: ClusterPolicy = ClusterPolicyFactory.build()
     response_json = json.loads(expected.json(exclude={"workspace_host"}))
@@ -160,11 +191,12 @@ def test_update(workspace_client: WorkspaceClient, requests_mock):
         description=expected.description,
     )
 
-    assert mock_request.last_request.json() == {
+    body = {
         "policy_id": expected.policy_id,
         "name": expected.name,
         "description": expected.description,
     }
+    assert mock_request.last_request.json() == {k: v for k, v in body.items() if v is not None}
 
 
 def test_delete(workspace_client: WorkspaceClient, requests_mock):
@@ -179,3 +211,31 @@ def test_delete(workspace_client: WorkspaceClient, requests_mock):
     assert mock_request.last_request.json() == {
         "policy_id": expected.policy_id,
     }
+
+
+def test_cache(workspace_client: WorkspaceClient, requests_mock):
+    expected: ClusterPolicy = ClusterPolicyFactory.build()
+    response_json = json.loads(expected.json(exclude={"workspace_host"}))
+    response_json["definition"] = json.dumps(response_json["definition"])
+    response_json["policy_family_definition_overrides"] = json.dumps(
+        response_json["policy_family_definition_overrides"]
+    )
+    list_request = requests_mock.get(
+        f"https://{workspace_client.host}/api/2.0/policies/clusters/list",
+        status_code=200,
+        json={"policies": [response_json]},
+    )
+    requests_mock.post(f"https://{workspace_client.host}/api/2.0/policies/clusters/delete", status_code=200)
+    client = workspace_client.cluster_policies
+    client.enable_cache(ttl=60)
+    try:
+        assert client.get_by_name(expected.name) == expected
+        assert client.get_by_id(expected.policy_id) == expected
+        assert client.get_by_name("do_not_exist") is None
+        assert list_request.call_count == 1
+
+        client.delete(expected.policy_id)
+        assert client.get_by_name(expected.name) == expected
+        assert list_request.call_count == 2
+    finally:
+        client.disable_cache()
@@ -118,3 +118,45 @@ def test_delete(workspace_client: WorkspaceClient, requests_mock):
     assert mock_request.last_request.json() == {
         "instance_profile_arn": expected.instance_profile_arn,
     }
+
+
+def test_get_many(workspace_client: WorkspaceClient, requests_mock):
+    profiles = InstanceProfileFactory.batch(3)
+    for i, p in enumerate(profiles):
+        p.instance_profile_arn = f"arn:aws:iam::123:instance-profile/path/profile-{i}"
+    mock_request = requests_mock.get(
+        f"https://{workspace_client.host}/api/2.0/instance-profiles/list",
+        status_code=200,
+        json={"instance_profiles": [json.loads(p.json(exclude={"workspace_host"})) for p in profiles]},
+    )
+    result = workspace_client.instance_profiles.get_many(
+        ["profile-0", profiles[1].instance_profile_arn, "path/profile-2", "unknown"]
+    )
+    assert result == {
+        "profile-0": profiles[0],
+        profiles[1].instance_profile_arn: profiles[1],
+        "path/profile-2": profiles[2],
+        "unknown": None,
+    }
+    assert mock_request.call_count == 1
+
+
+def test_refresh_cached(workspace_client: WorkspaceClient, requests_mock):
+    profiles = InstanceProfileFactory.batch(3)
+    mock_request = requests_mock.get(
+        f"https://{workspace_client.host}/api/2.0/instance-profiles/list",
+        status_code=200,
+        json={"instance_profiles": [json.loads(p.json(exclude={"workspace_host"})) for p in profiles]},
+    )
+    workspace_client.instance_profiles.enable_cache()
+    try:
+        for p in profiles:
+            p.refresh()
+        assert mock_request.call_count == 1
+    finally:
+        workspace_client.instance_profiles.disable_cache()
+
+
+def test_no_lookup_by_id(workspace_client: WorkspaceClient):
+    assert not hasattr(workspace_client.instance_profiles, "get_by_ids")
+    assert hasattr(workspace_client.unity_catalog.metastores, "get_by_ids")
@@ -1,7 +1,18 @@
+import json
+
+import pytest
 from pydantic_factories import ModelFactory
 
+from databricks_sdk_python.api_client.utils import PermissionDenied, UnknownApiResponse
 from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
-from databricks_sdk_python.resources.workspace.permissions import PermissionLevels, Permissions
+from databricks_sdk_python.resources.workspace.compact_permissions import CompactPermissions
+from databricks_sdk_python.resources.workspace.permissions import (
+    GroupObjectPermission,
+    PermissionLevels,
+    Permissions,
+    UserObjectPermission,
+)
+from databricks_sdk_python.resources.workspace.permissions_index import PermissionsIndex
 
 
 class PermissionsFactory(ModelFactory):
@@ -199,3 +210,170 @@ def test_get_repo_permissions(workspace_client: WorkspaceClient, requests_mock):
     )
     permissions = workspace_client.permissions.get_repo_permissions(1)
     assert permissions == expected
+
+
+def test_iter_compact(workspace_client: WorkspaceClient, requests_mock):
+    expected: Permissions = PermissionsFactory.build()
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.0/permissions/t/a",
+        status_code=200,
+        text=expected.json(exclude={"workspace_host"}),
+    )
+    requests_mock.get(f"https://{workspace_client.host}/api/2.0/permissions/t/b", status_code=404)
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.0/permissions/t/c", status_code=500, json={"error": "boom"}
+    )
+
+    results = list(workspace_client.permissions.iter_compact("t", ["a", "b", "c"]))
+    assert [r.item for r in results] == ["a", "b", "c"]
+    assert results[0].get() == CompactPermissions.from_response(json.loads(expected.json()), workspace_client.host)
+    assert results[1].get() is None
+    assert isinstance(results[2].exception, UnknownApiResponse)
+
+
+def test_get_many(workspace_client: WorkspaceClient, requests_mock):
+    expected: Permissions = PermissionsFactory.build(workspace_host=workspace_client.host)
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.0/permissions/clusters/a",
+        status_code=200,
+        text=expected.json(exclude={"workspace_host"}),
+    )
+    requests_mock.get(f"https://{workspace_client.host}/api/2.0/permissions/jobs/1", status_code=404)
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.0/permissions/repos/2", status_code=403, json={"error": "forbidden"}
+    )
+
+    objects = [("clusters", "a"), ("jobs", 1), ("repos", 2)]
+    results = {r.item: r for r in workspace_client.permissions.get_many(objects, max_concurrency=2)}
+    assert results[("clusters", "a")].get() == expected
+    assert results[("jobs", 1)].get() is None
+    assert isinstance(results[("repos", 2)].exception, PermissionDenied)
+
+
+def test_index(workspace_client: WorkspaceClient, requests_mock, monkeypatch):
+    index = PermissionsIndex()
+    monkeypatch.setattr(workspace_client.permissions, "index", index)
+    response = {
+        "object_id": "/clusters/a",
+        "object_type": "cluster",
+        "access_control_list": [
+            {"group_name": "admins", "all_permissions": [{"permission_level": "CAN_MANAGE", "inherited": False}]}
+        ],
+    }
+    requests_mock.patch(
+        f"https://{workspace_client.host}/api/2.0/permissions/clusters/a", status_code=200, json=response
+    )
+
+    workspace_client.permissions.grant("clusters", "a", [])
+    assert index.principals("CAN_MANAGE", object_type="cluster") == {("group_name", "admins")}
+
+
+def test_skip_unchanged_without_index(workspace_client: WorkspaceClient, requests_mock):
+    current = {
+        "object_id": "/clusters/a",
+        "object_type": "cluster",
+        "access_control_list": [
+            {"group_name": "admins", "all_permissions": [{"permission_level": "CAN_MANAGE", "inherited": False}]}
+        ],
+    }
+    get_request = requests_mock.get(
+        f"https://{workspace_client.host}/api/2.0/permissions/clusters/a", status_code=200, json=current
+    )
+    patch_request = requests_mock.patch(
+        f"https://{workspace_client.host}/api/2.0/permissions/clusters/a", status_code=200, json=current
+    )
+
+    admins = GroupObjectPermission(group_name="admins", permission_level="CAN_MANAGE")
+    assert workspace_client.permissions.index is None
+    permissions = workspace_client.permissions.grant("clusters", "a", [admins], skip_unchanged=True)
+    assert permissions.access_control_list[0].group_name == "admins"
+    assert (get_request.call_count, patch_request.call_count) == (1, 0)
+
+    workspace_client.permissions.grant(
+        "clusters", "a", [UserObjectPermission(user_name="user", permission_level="CAN_MANAGE")], skip_unchanged=True
+    )
+    assert (get_request.call_count, patch_request.call_count) == (2, 1)
+
+
+def test_model_skip_unchanged(workspace_client: WorkspaceClient, requests_mock):
+    permissions = Permissions(
+        workspace_host=workspace_client.host,
+        object_id="/clusters/a",
+        object_type="cluster",
+        access_control_list=[
+            {"group_name": "admins", "all_permissions": [{"permission_level": "CAN_MANAGE", "inherited": False}]},
+            {
+                "user_name": "user",
+                "all_permissions": [
+                    {"permission_level": "CAN_MANAGE", "inherited": True, "inherited_from_object": ["/clusters/"]}
+                ],
+            },
+        ],
+    )
+    mock_request = requests_mock.put(
+        f"https://{workspace_client.host}/api/2.0/permissions/clusters/a",
+        status_code=200,
+        text=permissions.json(exclude={"workspace_host"}),
+    )
+
+    admins = GroupObjectPermission(group_name="admins", permission_level="CAN_MANAGE")
+    assert permissions.replace([admins], skip_unchanged=True) is permissions
+    assert mock_request.call_count == 0
+
+    # inherited permissions are not set on the object itself
+    permissions.replace([admins, UserObjectPermission(user_name="user", permission_level="CAN_MANAGE")], True)
+    assert mock_request.call_count == 1
+
+
+def test_batch(workspace_client: WorkspaceClient, requests_mock):
+    policy_request = requests_mock.patch(
+        f"https://{workspace_client.host}/api/2.0/permissions/cluster-policies/p",
+        status_code=200,
+        json={"object_id": "/cluster-policies/p", "object_type": "cluster-policy", "access_control_list": []},
+    )
+    cluster_request = requests_mock.put(
+        f"https://{workspace_client.host}/api/2.0/permissions/clusters/c",
+        status_code=200,
+        json={"object_id": "/clusters/c", "object_type": "cluster", "access_control_list": []},
+    )
+    user = UserObjectPermission(user_name="user", permission_level="CAN_USE")
+    group = GroupObjectPermission(group_name="group", permission_level="CAN_USE")
+    admins = GroupObjectPermission(group_name="admins", permission_level="CAN_MANAGE")
+
+    with workspace_client.permissions.batch() as batch:
+        assert workspace_client.permissions.grant("cluster-policies", "p", [user]) is None
+        workspace_client.permissions.grant("cluster-policies", "p", [group, user])
+        workspace_client.permissions.grant("clusters", "c", [user])
+        workspace_client.permissions.replace("clusters", "c", [admins])
+        workspace_client.permissions.grant("clusters", "c", [group])
+        assert len(batch) == 2
+        assert policy_request.call_count == 0
+
+    assert policy_request.call_count == 1
+    assert policy_request.last_request.json()["access_control_list"] == [user.dict(), group.dict()]
+    assert cluster_request.call_count == 1
+    assert cluster_request.last_request.json()["access_control_list"] == [admins.dict(), group.dict()]
+    assert [r.item for r in batch.results] == [("cluster-policies", "p"), ("clusters", "c")]
+    assert all(r.ok for r in batch.results)
+
+    # outside of the batch calls are sent right away
+    workspace_client.permissions.grant("cluster-policies", "p", [user])
+    assert policy_request.call_count == 2
+
+
+def test_batch_errors(workspace_client: WorkspaceClient, requests_mock):
+    mock_request = requests_mock.patch(
+        f"https://{workspace_client.host}/api/2.0/permissions/clusters/c", status_code=400, json={"error": "bad"}
+    )
+    user = UserObjectPermission(user_name="user", permission_level="CAN_USE")
+
+    with pytest.raises(UnknownApiResponse):
+        with workspace_client.permissions.batch():
+            workspace_client.permissions.grant("clusters", "c", [user])
+    assert mock_request.call_count == 1
+
+    with pytest.raises(ValueError):
+        with workspace_client.permissions.batch():
+            workspace_client.permissions.grant("clusters", "c", [user])
+            raise ValueError()
+    assert mock_request.call_count == 1
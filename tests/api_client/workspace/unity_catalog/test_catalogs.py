@@ -1,3 +1,4 @@
+import inspect
 import json
 import uuid
 
@@ -41,6 +42,27 @@ def test_list(workspace_client: WorkspaceClient, requests_mock):
     assert catalogs == [expected]
 
 
+def test_iter_pages(workspace_client: WorkspaceClient, requests_mock):
+    expected = CatalogFactory.batch(3)
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.1/unity-catalog/catalogs",
+        status_code=200,
+        json={
+            "catalogs": [json.loads(c.json(exclude={"workspace_host"})) for c in expected[:1]],
+            "next_page_token": "a",
+        },
+    )
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.1/unity-catalog/catalogs?page_token=a",
+        status_code=200,
+        json={"catalogs": [json.loads(c.json(exclude={"workspace_host"})) for c in expected[1:]]},
+    )
+    assert list(workspace_client.unity_catalog.catalogs.iter_catalogs(prefetch=False)) == expected
+    assert list(workspace_client.unity_catalog.catalogs.iter(prefetch=False)) == expected
+    assert inspect.isgeneratorfunction(workspace_client.unity_catalog.catalogs.iter)
+    assert workspace_client.unity_catalog.catalogs.list(max_results=1) == expected
+
+
 def test_get_by_name(workspace_client: WorkspaceClient, requests_mock):
     expected: Catalog = CatalogFactory.build()
 
@@ -103,12 +125,13 @@ def test_update(requests_mock, workspace_client: WorkspaceClient):
         properties=expected.properties,
         owner=expected.owner,
     )
-    assert mock_request.last_request.json() == {
+    body = {
         "name": expected.name,
         "comment": expected.comment,
         "properties": expected.properties,
         "owner": expected.owner,
     }
+    assert mock_request.last_request.json() == {k: v for k, v in body.items() if v is not None}
     assert result == expected
 
 
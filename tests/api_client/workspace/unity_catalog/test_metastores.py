@@ -85,6 +85,31 @@ def test_list(workspace_client: WorkspaceClient, requests_mock):
     assert metastores == [expected]
 
 
+def test_list_lazy(workspace_client: WorkspaceClient, requests_mock):
+    expected: Metastore = MetastoreFactory.build()
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.1/unity-catalog/metastores",
+        status_code=200,
+        json={"metastores": [json.loads(expected.json(exclude={"workspace_host"}))]},
+    )
+    metastore = workspace_client.unity_catalog.metastores.list(lazy=True)[0]
+    assert isinstance(metastore, Metastore)
+    assert metastore.__dict__ == {}
+    assert metastore.metastore_id == expected.metastore_id
+    assert list(metastore.__dict__) == ["metastore_id"]
+    assert metastore == expected
+
+    updated: Metastore = MetastoreFactory.build(metastore_id=expected.metastore_id)
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.1/unity-catalog/metastores/{expected.metastore_id}",
+        status_code=200,
+        text=updated.json(exclude={"workspace_host"}),
+    )
+    lazy = next(workspace_client.unity_catalog.metastores.iter(lazy=True))
+    lazy.refresh()
+    assert lazy == updated
+
+
 def test_get_by_id(workspace_client: WorkspaceClient, requests_mock):
     expected: Metastore = MetastoreFactory.build()
 
@@ -163,15 +188,15 @@ def test_update(requests_mock, workspace_client: WorkspaceClient):
         # delta_sharing_organization_name=expected.delta_sharing_organization_name,
         owner=expected.owner,
     )
-    assert mock_request.last_request.json() == {
+    body = {
         "name": expected.name,
         "delta_sharing_scope": expected.delta_sharing_scope,
         "storage_root_credential_id": str(expected.storage_root_credential_id),
         "privilege_model_version": expected.privilege_model_version,
         "delta_sharing_recipient_token_lifetime_in_seconds": expected.delta_sharing_recipient_token_lifetime_in_seconds,
-        "delta_sharing_organization_name": None,
         "owner": expected.owner,
     }
+    assert mock_request.last_request.json() == {k: v for k, v in body.items() if v is not None}
     assert result == expected
 
 
@@ -1,3 +1,4 @@
+import inspect
 import json
 
 from pydantic_factories import ModelFactory
@@ -40,6 +41,32 @@ def test_list(workspace_client: WorkspaceClient, requests_mock):
     assert schemas == [expected]
 
 
+def test_iter_pages(workspace_client: WorkspaceClient, requests_mock):
+    expected = SchemaFactory.batch(3)
+    first_page = requests_mock.get(
+        f"https://{workspace_client.host}/api/2.1/unity-catalog/schemas",
+        status_code=200,
+        json={
+            "schemas": [json.loads(s.json(exclude={"workspace_host"})) for s in expected[:2]],
+            "next_page_token": "a",
+        },
+    )
+    second_page = requests_mock.get(
+        f"https://{workspace_client.host}/api/2.1/unity-catalog/schemas?page_token=a",
+        status_code=200,
+        json={"schemas": [json.loads(expected[2].json(exclude={"workspace_host"}))]},
+    )
+    schemas = workspace_client.unity_catalog.schemas.iter_schemas(catalog_name="test", max_results=2)
+    assert next(schemas) == expected[0]
+    assert list(schemas) == expected[1:]
+
+    assert first_page.last_request.qs == {"catalog_name": ["test"], "max_results": ["2"]}
+    assert second_page.last_request.qs == {"catalog_name": ["test"], "max_results": ["2"], "page_token": ["a"]}
+    assert workspace_client.unity_catalog.schemas.list(catalog_name="test") == expected
+    assert list(workspace_client.unity_catalog.schemas.iter(catalog_name="test")) == expected
+    assert inspect.isgeneratorfunction(workspace_client.unity_catalog.schemas.iter)
+
+
 def test_get_by_name(workspace_client: WorkspaceClient, requests_mock):
     expected: Schema = SchemaFactory.build()
 
@@ -105,12 +132,13 @@ def test_update(requests_mock, workspace_client: WorkspaceClient):
         properties=expected.properties,
         owner=expected.owner,
     )
-    assert mock_request.last_request.json() == {
+    body = {
         "name": expected.name,
         "comment": expected.comment,
         "properties": expected.properties,
         "owner": expected.owner,
     }
+    assert mock_request.last_request.json() == {k: v for k, v in body.items() if v is not None}
     assert result == expected
 
 
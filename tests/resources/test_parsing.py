@@ -0,0 +1,154 @@
+import json
+import pickle
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+from pydantic_factories import ModelFactory
+
+from databricks_sdk_python.resources.account.aws.credentials import Credentials
+from databricks_sdk_python.resources.account.aws.networks import Network, NetworkWarning
+from databricks_sdk_python.resources.account.aws.storage_config import StorageConfiguration
+from databricks_sdk_python.resources.account.aws.workspaces import Workspace
+from databricks_sdk_python.resources.parsing import (
+    LAZY_MIN_FIELDS,
+    LazyModelMixin,
+    construct_model,
+    parse_model,
+    parse_record,
+)
+from databricks_sdk_python.resources.workspace.instance_profiles import InstanceProfile
+from databricks_sdk_python.resources.workspace.permissions import (
+    GroupAccessControl,
+    PermissionLevels,
+    Permissions,
+    UserAccessControl,
+)
+from databricks_sdk_python.resources.workspace.unity_catalog.catalogs import Catalog
+from databricks_sdk_python.resources.workspace.unity_catalog.metastores import Metastore
+from databricks_sdk_python.resources.workspace.unity_catalog.schemas import Schema
+
+MODELS = [
+    Credentials,
+    Network,
+    StorageConfiguration,
+    Workspace,
+    InstanceProfile,
+    Permissions,
+    PermissionLevels,
+    Catalog,
+    Metastore,
+    Schema,
+]
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda m: m.__name__)
+@pytest.mark.parametrize("trusted", [False, True])
+def test_lazy_matches_validation(model, trusted):
+    factory = ModelFactory.create_factory(model)
+    data = json.loads(factory.build().json())
+
+    lazy = parse_model(model, dict(data), trusted=trusted, lazy=True)
+    validated = parse_model(model, dict(data))
+    assert isinstance(lazy, model)
+    assert lazy.__fields_set__ == validated.__fields_set__
+    assert lazy.json() == validated.json()
+    assert pickle.loads(pickle.dumps(lazy)) == validated
+
+
+def test_lazy_validates_on_access():
+    workspace = parse_model(Workspace, {"workspace_id": "not a number", "workspace_name": "w"}, lazy=True)
+    assert workspace.workspace_name == "w"
+    with pytest.raises(ValidationError):
+        workspace.workspace_id
+    with pytest.raises(ValidationError):
+        workspace.deployment_name
+    with pytest.raises(AttributeError):
+        workspace.unknown
+
+
+def test_lazy_releases_raw_values():
+    data = json.loads(ModelFactory.create_factory(Workspace).build().json())
+    workspace = parse_model(Workspace, data, lazy=True)
+    assert isinstance(workspace, LazyModelMixin)
+    name = workspace.workspace_name
+    assert workspace._raw["workspace_name"] is None
+    assert data["workspace_name"] == name
+
+    workspace.workspace_name = "other"
+    assert workspace.dirty_fields == {"workspace_name": "other"}
+    assert workspace.original_value("workspace_name") == name
+    for field in Workspace.__fields__:
+        getattr(workspace, field)
+    assert workspace._raw is None
+    assert workspace.__fields_set__ == {n for n, f in Workspace.__fields__.items() if f.alias in data}
+
+
+def test_lazy_narrow_models_parsed_as_usual():
+    data = json.loads(ModelFactory.create_factory(InstanceProfile).build().json())
+    assert len(InstanceProfile.__fields__) < LAZY_MIN_FIELDS
+    assert not isinstance(parse_model(InstanceProfile, data, lazy=True), LazyModelMixin)
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda m: m.__name__)
+def test_construct_matches_validation(model):
+    factory = ModelFactory.create_factory(model)
+    data = json.loads(factory.build().json())
+
+    trusted = parse_model(model, dict(data), trusted=True)
+    validated = parse_model(model, dict(data))
+    assert trusted == validated
+    assert trusted.__fields_set__ == validated.__fields_set__
+
+
+def test_construct_coerces_types():
+    data = {
+        "account_id": "6e2d2d3c-3b0f-4d0b-9d8e-0b6f6f6f6f6f",
+        "network_id": "0b6f6f6f-3b0f-4d0b-9d8e-6e2d2d3c6f6f",
+        "network_name": "n",
+        "vpc_id": "v",
+        "subnet_ids": ["s"],
+        "security_group_ids": [],
+        "warning_messages": [{"warning_type": "t", "warning_message": "m"}],
+        "creation_time": 1,
+        "unknown": "dropped",
+    }
+    network = construct_model(Network, data)
+    assert isinstance(network.account_id, UUID)
+    assert isinstance(network.warning_messages[0], NetworkWarning)
+    assert network.error_messages == []
+    assert network.vpc_endpoints is None
+    assert not hasattr(network, "unknown")
+
+
+def test_construct_picks_union_member():
+    permissions = construct_model(
+        Permissions,
+        {
+            "object_id": "i",
+            "object_type": "t",
+            "access_control_list": [
+                {"user_name": "u", "all_permissions": [{"permission_level": "CAN_USE", "inherited": False}]},
+                {"group_name": "g", "all_permissions": []},
+            ],
+        },
+        workspace_host="test.cloud.databricks.com",
+    )
+    assert isinstance(permissions.access_control_list[0], UserAccessControl)
+    assert isinstance(permissions.access_control_list[1], GroupAccessControl)
+    assert permissions.access_control_list[0].all_permissions[0].inherited is False
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_record(trusted):
+    record = parse_record(
+        Network,
+        {"network_id": "0b6f6f6f-3b0f-4d0b-9d8e-6e2d2d3c6f6f", "warning_messages": [], "vpc_id": 1},
+        ["network_id", "vpc_status", "error_messages"],
+        trusted=trusted,
+    )
+    assert record == (UUID("0b6f6f6f-3b0f-4d0b-9d8e-6e2d2d3c6f6f"), None, [])
+    assert type(record).__name__ == "NetworkRecord"
+
+    with pytest.raises(ValidationError):
+        parse_record(Network, {}, ["network_id"], trusted=trusted)
@@ -3,8 +3,15 @@ import json
 from pydantic_factories import ModelFactory
 
 from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
-from databricks_sdk_python.resources.workspace.cluster_policies import ClusterPolicy
+from databricks_sdk_python.resources.workspace.cluster_policies import (
+    ClusterPolicy,
+    PolicyElement,
+    _parse_definition,
+    parse_definition,
+    serialize_definition,
+)
 from databricks_sdk_python.resources.workspace.permissions import PermissionLevels, Permissions
+from databricks_sdk_python.resources.workspace.permissions_index import PermissionsIndex
 
 
 class ClusterPolicyFactory(ModelFactory):
@@ -37,12 +44,6 @@ def test_grant_use(workspace_client: WorkspaceClient, requests_mock):
     permissions: Permissions = PermissionsFactory.build()
     policy: ClusterPolicy = ClusterPolicyFactory.build()
     permissions.object_id = f"/cluster-policies/{policy.policy_id}"
-    requests_mock.get(
-        f"https://{workspace_client.host}/api/2.0/permissions/cluster-policies/{policy.policy_id}",
-        status_code=200,
-        text=permissions.json(exclude={"workspace_host"}),
-    )
-
     mock_request = requests_mock.patch(
         f"https://{workspace_client.host}/api/2.0/permissions/cluster-policies/{policy.policy_id}",
         status_code=200,
@@ -67,12 +68,6 @@ def test_replace_permissions(workspace_client: WorkspaceClient, requests_mock):
     permissions: Permissions = PermissionsFactory.build()
     policy: ClusterPolicy = ClusterPolicyFactory.build()
     permissions.object_id = f"/cluster-policies/{policy.policy_id}"
-    requests_mock.get(
-        f"https://{workspace_client.host}/api/2.0/permissions/cluster-policies/{policy.policy_id}",
-        status_code=200,
-        text=permissions.json(exclude={"workspace_host"}),
-    )
-
     mock_request = requests_mock.put(
         f"https://{workspace_client.host}/api/2.0/permissions/cluster-policies/{policy.policy_id}",
         status_code=200,
@@ -95,6 +90,31 @@ def test_replace_permissions(workspace_client: WorkspaceClient, requests_mock):
     }
 
 
+def test_grant_use_skip_unchanged(workspace_client: WorkspaceClient, requests_mock, monkeypatch):
+    policy: ClusterPolicy = ClusterPolicyFactory.build()
+    permissions = Permissions(
+        workspace_host=workspace_client.host,
+        object_id=f"/cluster-policies/{policy.policy_id}",
+        object_type="cluster-policy",
+        access_control_list=[
+            {"group_name": "group", "all_permissions": [{"permission_level": "CAN_USE", "inherited": False}]}
+        ],
+    )
+    monkeypatch.setattr(workspace_client.permissions, "index", PermissionsIndex([permissions]))
+    mock_request = requests_mock.patch(
+        f"https://{workspace_client.host}/api/2.0/permissions/cluster-policies/{policy.policy_id}",
+        status_code=200,
+        text=permissions.json(exclude={"workspace_host"}),
+    )
+
+    assert policy.grant_use(group_name="group", skip_unchanged=True) == permissions
+    assert mock_request.call_count == 0
+
+    policy.grant_use(group_name="group")
+    policy.grant_use(user_name="user", skip_unchanged=True)
+    assert mock_request.call_count == 2
+
+
 def test_refresh(workspace_client: WorkspaceClient, requests_mock):
     policy: ClusterPolicy = ClusterPolicyFactory.build()
     expected: ClusterPolicy = ClusterPolicyFactory.build()
@@ -117,58 +137,76 @@ def test_refresh(workspace_client: WorkspaceClient, requests_mock):
 
 
 def test_update(workspace_client: WorkspaceClient, requests_mock):
-    policy: ClusterPolicy = ClusterPolicyFactory.build()
-    policy.policy_family_id = None
-    policy.definition = {}
-
-    response_json = json.loads(policy.json(exclude={"workspace_host"}))
-    response_json["definition"] = json.dumps(response_json["definition"])
-    response_json["policy_family_definition_overrides"] = json.dumps(
-        response_json["policy_family_definition_overrides"]
+    policy: ClusterPolicy = ClusterPolicyFactory.build(
+        policy_family_id=None,
+        description="old description",
+        definition={"node_type_id": PolicyElement(type="fixed", value="i3.xlarge")},
     )
     mock_request = requests_mock.post(
-        f"https://{workspace_client.host}/api/2.0/policies/clusters/edit",
-        status_code=200,
-        json=response_json,
+        f"https://{workspace_client.host}/api/2.0/policies/clusters/edit", status_code=200
     )
 
     policy.update()
+    policy.update(policy_name=policy.name)
+    assert not mock_request.called
 
+    # the edit endpoint replaces the policy, unchanged fields are sent as well
+    definition = serialize_definition(policy.definition)
+    policy.update(description="new description")
     assert mock_request.last_request.json() == {
-        "definition": response_json["definition"],
-        "description": policy.description,
+        "description": "new description",
+        "definition": definition,
         "name": policy.name,
         "policy_id": policy.policy_id,
     }
+    assert not policy.is_dirty
 
+    policy.definition = {"spark_version": PolicyElement(type="fixed", value="13.3.x-scala2.12")}
+    policy.update()
+    assert mock_request.last_request.json() == {
+        "description": "new description",
+        "definition": serialize_definition(policy.definition),
+        "name": policy.name,
+        "policy_id": policy.policy_id,
+    }
+    assert mock_request.call_count == 2
 
-def test_update_family(workspace_client: WorkspaceClient, requests_mock):
-    policy: ClusterPolicy = ClusterPolicyFactory.build()
-    policy.policy_family_id = "id"
-    policy.policy_family_definition_overrides = {}
 
-    response_json = json.loads(policy.json(exclude={"workspace_host"}))
-    response_json["definition"] = json.dumps(response_json["definition"])
-    response_json["policy_family_definition_overrides"] = json.dumps(
-        response_json["policy_family_definition_overrides"]
+def test_update_family(workspace_client: WorkspaceClient, requests_mock):
+    policy: ClusterPolicy = ClusterPolicyFactory.build(
+        policy_family_id="id", description="description", policy_family_definition_overrides={}
     )
     mock_request = requests_mock.post(
-        f"https://{workspace_client.host}/api/2.0/policies/clusters/edit",
-        status_code=200,
-        json=response_json,
+        f"https://{workspace_client.host}/api/2.0/policies/clusters/edit", status_code=200
     )
 
-    policy.update()
+    overrides = {"spark_version": PolicyElement(type="fixed", value="13.3.x-scala2.12")}
+    policy.update(policy_family_definition_overrides=overrides)
 
     assert mock_request.last_request.json() == {
-        "policy_family_definition_overrides": response_json["policy_family_definition_overrides"],
+        "description": "description",
+        "policy_family_definition_overrides": serialize_definition(overrides),
         "policy_family_id": policy.policy_family_id,
-        "description": policy.description,
         "name": policy.name,
         "policy_id": policy.policy_id,
     }
 
 
+def test_dirty_tracking():
+    policy: ClusterPolicy = ClusterPolicyFactory.build(description="old")
+    assert not policy.is_dirty
+
+    policy.description = "new"
+    assert policy.dirty_fields == {"description": "new"}
+    assert policy.original_value("description") == "old"
+
+    policy.description = "old"
+    assert not policy.is_dirty
+
+    policy.mark_dirty("definition")
+    assert policy.dirty_fields == {"definition": policy.definition}
+
+
 def test_delete(workspace_client: WorkspaceClient, requests_mock):
     policy: ClusterPolicy = ClusterPolicyFactory.build()
 
@@ -180,3 +218,38 @@ def test_delete(workspace_client: WorkspaceClient, requests_mock):
     policy.delete()
 
     assert mock_request.last_request.json() == {"policy_id": policy.policy_id}
+
+
+def test_parse_definition_memoized():
+    definition = json.dumps({"spark_version": {"type": "allowlist", "values": ["13.3.x-scala2.12"]}})
+    first = parse_definition(definition)
+    hits = _parse_definition.cache_info().hits
+    second = parse_definition(definition)
+
+    assert _parse_definition.cache_info().hits == hits + 1
+    assert first == second
+    second["spark_version"].values.append("14.3.x-scala2.12")
+    second["spark_version"].type = "fixed"
+    assert parse_definition(definition) == first
+    assert parse_definition("null") is None
+
+
+def test_parse_definition_copies_values():
+    definition = json.dumps({"spark_conf": {"type": "fixed", "value": {"a": ["b"]}, "defaultValue": {"c": "d"}}})
+    first = parse_definition(definition)
+    first["spark_conf"].value["a"].append("e")
+    first["spark_conf"].defaultValue["c"] = "f"
+
+    second = parse_definition(definition)
+    assert second["spark_conf"].value == {"a": ["b"]}
+    assert second["spark_conf"].defaultValue == {"c": "d"}
+
+
+def test_serialize_definition():
+    definition = {"spark_version": PolicyElement(type="fixed", value="13.3.x-scala2.12")}
+    assert json.loads(serialize_definition(definition)) == {
+        "spark_version": {"type": "fixed", "value": "13.3.x-scala2.12"}
+    }
+
+    definition["spark_version"].value = "14.3.x-scala2.12"
+    assert json.loads(serialize_definition(definition))["spark_version"]["value"] == "14.3.x-scala2.12"
@@ -0,0 +1,65 @@
+from databricks_sdk_python.resources.workspace.compact_permissions import CompactAclEntry, CompactPermissions
+from databricks_sdk_python.resources.workspace.permissions import (
+    GroupAccessControl,
+    ServicePrincipalAccessControl,
+    UserAccessControl,
+)
+
+RESPONSE = {
+    "object_id": "/cluster-policies/1",
+    "object_type": "cluster-policy",
+    "access_control_list": [
+        {"user_name": "user@example.com", "all_permissions": [{"permission_level": "CAN_USE", "inherited": False}]},
+        {
+            "group_name": "admins",
+            "all_permissions": [
+                {"permission_level": "CAN_USE", "inherited": False},
+                {"permission_level": "CAN_MANAGE", "inherited": True, "inherited_from_object": ["/cluster-policies/"]},
+            ],
+        },
+        {"service_principal_name": "sp", "all_permissions": [{"permission_level": "CAN_USE", "inherited": False}]},
+    ],
+}
+
+
+def test_from_response():
+    permissions = CompactPermissions.from_response(RESPONSE, workspace_host="test.cloud.databricks.com")
+
+    assert len(permissions) == 4
+    assert permissions.entries[2] == CompactAclEntry(
+        "group_name", "admins", "CAN_MANAGE", True, ("/cluster-policies/",)
+    )
+    assert permissions.permission_levels("admins") == ["CAN_USE", "CAN_MANAGE"]
+    assert not hasattr(permissions, "__dict__")
+
+
+def test_interned():
+    first = CompactPermissions.from_response(RESPONSE, workspace_host="test.cloud.databricks.com")
+    second = CompactPermissions.from_response(
+        {
+            **RESPONSE,
+            "access_control_list": [
+                {
+                    "group_name": "".join(["adm", "ins"]),
+                    "all_permissions": [{"permission_level": "".join(["CAN_", "USE"]), "inherited": False}],
+                }
+            ],
+        },
+        workspace_host="test.cloud.databricks.com",
+    )
+    assert second.entries[0].principal is first.entries[1].principal
+    assert second.entries[0].permission_level is first.entries[0].permission_level
+
+
+def test_to_permissions():
+    permissions = CompactPermissions.from_response(RESPONSE, workspace_host="test.cloud.databricks.com")
+    model = permissions.to_permissions()
+
+    assert model.object_id == RESPONSE["object_id"]
+    assert [type(a) for a in model.access_control_list] == [
+        UserAccessControl,
+        GroupAccessControl,
+        ServicePrincipalAccessControl,
+    ]
+    assert model.access_control_list[1].all_permissions[1].inherited_from_object == ["/cluster-policies/"]
+    assert CompactPermissions.from_response(model.dict(), workspace_host=model.workspace_host) == permissions
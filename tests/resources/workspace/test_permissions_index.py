@@ -0,0 +1,91 @@
+from databricks_sdk_python.resources.workspace.compact_permissions import CompactPermissions
+from databricks_sdk_python.resources.workspace.permissions import Permissions
+from databricks_sdk_python.resources.workspace.permissions_index import IndexedPermission, PermissionsIndex
+
+HOST = "test.cloud.databricks.com"
+
+
+def _permissions(object_id: str, object_type: str, *access_control_list: dict) -> Permissions:
+    return Permissions(
+        workspace_host=HOST, object_id=object_id, object_type=object_type, access_control_list=list(access_control_list)
+    )
+
+
+def _acl(principal_type: str, principal: str, *levels: str) -> dict:
+    return {
+        principal_type: principal,
+        "all_permissions": [{"permission_level": level, "inherited": False} for level in levels],
+    }
+
+
+def test_lookups():
+    policy = _permissions(
+        "/cluster-policies/1",
+        "cluster-policy",
+        _acl("group_name", "admins", "CAN_MANAGE"),
+        _acl("user_name", "user@example.com", "CAN_USE"),
+    )
+    cluster = CompactPermissions.from_permissions(
+        _permissions("/clusters/2", "cluster", _acl("group_name", "admins", "CAN_MANAGE", "CAN_RESTART"))
+    )
+    index = PermissionsIndex([policy, cluster])
+
+    assert len(index) == 2
+    assert "/clusters/2" in index
+    assert len(index.for_principal("group_name", "admins")) == 3
+    assert index.for_principal("group_name", "admins", object_type="cluster-policy") == [
+        IndexedPermission("group_name", "admins", "cluster-policy", "/cluster-policies/1", "CAN_MANAGE", False, None)
+    ]
+    assert index.principals("CAN_MANAGE") == {("group_name", "admins")}
+    assert index.principals("CAN_USE", object_type="cluster") == set()
+    assert {e.principal for e in index.for_object("/cluster-policies/1")} == {"admins", "user@example.com"}
+
+
+def test_principals_of_different_types_with_the_same_name():
+    index = PermissionsIndex(
+        [
+            _permissions(
+                "/clusters/1",
+                "cluster",
+                _acl("group_name", "etl", "CAN_MANAGE"),
+                _acl("service_principal_name", "etl", "CAN_RESTART"),
+            )
+        ]
+    )
+
+    assert [e.permission_level for e in index.for_principal("group_name", "etl")] == ["CAN_MANAGE"]
+    assert [e.permission_level for e in index.for_principal("service_principal_name", "etl")] == ["CAN_RESTART"]
+    assert index.for_principal("user_name", "etl") == []
+
+
+def test_incremental_update():
+    index = PermissionsIndex(
+        [_permissions("/cluster-policies/1", "cluster-policy", _acl("group_name", "admins", "CAN_MANAGE"))]
+    )
+
+    index.add(_permissions("/cluster-policies/1", "cluster-policy", _acl("user_name", "user@example.com", "CAN_USE")))
+    assert index.for_principal("group_name", "admins") == []
+    assert index.principals("CAN_MANAGE") == set()
+    assert index.principals("CAN_USE") == {("user_name", "user@example.com")}
+
+    index.remove("/cluster-policies/1")
+    assert len(index) == 0
+    assert index.for_principal("user_name", "user@example.com") == []
+    assert index._by_principal == {}
+    assert index._by_level == {}
+
+
+def test_from_permissions():
+    permissions = _permissions(
+        "/cluster-policies/1",
+        "cluster-policy",
+        {
+            "group_name": "admins",
+            "all_permissions": [
+                {"permission_level": "CAN_MANAGE", "inherited": True, "inherited_from_object": ["/cluster-policies/"]}
+            ],
+        },
+    )
+    compact = CompactPermissions.from_permissions(permissions)
+    assert compact == CompactPermissions.from_response(permissions.dict(), workspace_host=HOST)
+    assert compact.to_permissions() == permissions
@@ -0,0 +1,45 @@
+from pydantic_factories import ModelFactory
+
+from databricks_sdk_python.api_client.workspace.client import WorkspaceClient
+from databricks_sdk_python.resources.workspace.unity_catalog.catalogs import Catalog
+
+
+class CatalogFactory(ModelFactory):
+    __model__ = Catalog
+    workspace_host = "test.cloud.databricks.com"
+
+
+def test_update(workspace_client: WorkspaceClient, requests_mock):
+    catalog: Catalog = CatalogFactory.build(name="old", owner="owner")
+    updated: Catalog = CatalogFactory.build(name="new", owner="other")
+    mock_request = requests_mock.patch(
+        f"https://{workspace_client.host}/api/2.1/unity-catalog/catalogs/old",
+        status_code=200,
+        text=updated.json(exclude={"workspace_host"}),
+    )
+
+    catalog.update(owner="owner")
+    assert not mock_request.called
+
+    catalog.name = "new"
+    catalog.update(owner="other")
+    assert mock_request.last_request.json() == {"name": "new", "owner": "other"}
+    assert catalog == updated
+    assert not catalog.is_dirty
+
+
+def test_refresh(workspace_client: WorkspaceClient, requests_mock):
+    catalog: Catalog = Catalog.construct(
+        _fields_set={"name"}, **CatalogFactory.build(name="catalog", comment=None).dict()
+    )
+    current: Catalog = CatalogFactory.build(name="catalog", comment="comment")
+    requests_mock.get(
+        f"https://{workspace_client.host}/api/2.1/unity-catalog/catalogs/catalog",
+        status_code=200,
+        text=current.json(exclude={"workspace_host"}),
+    )
+    catalog.refresh()
+    assert catalog == current
+    assert not catalog.is_dirty
+    # fields the response has count as set, so `dict(exclude_unset=True)` includes them
+    assert catalog.__fields_set__ == current.__fields_set__